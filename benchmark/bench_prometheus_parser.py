@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Prometheus metrics parser benchmark
+
+Compares the previous line-splitting parser with the streaming parser, both
+parsing everything and keeping only the BE P0 metrics as get_monitoring_metrics
+does. Pass captured dumps (curl http://<be>:8040/metrics > be.txt) to measure
+real pages; without arguments a synthetic BE-sized page is generated.
+
+Usage:
+    python benchmark/bench_prometheus_parser.py [dump ...]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from doris_mcp_server.utils.monitoring_tools import P0Metrics
+from doris_mcp_server.utils.prometheus_parser import PrometheusTextParser
+
+
+def _legacy_parse(metrics_text: str) -> dict:
+    """The parser used before the streaming parser (kept here for comparison)"""
+    metrics = {}
+    for line in metrics_text.strip().split('\n'):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            if '{' in line:
+                metric_part, value_part = line.rsplit(' ', 1)
+                metric_name = metric_part.split('{')[0]
+                labels_part = metric_part[metric_part.find('{'):metric_part.rfind('}')+1]
+                labels = {}
+                labels_content = labels_part[1:-1]
+                if labels_content:
+                    for label_pair in labels_content.split(','):
+                        if '=' in label_pair:
+                            key, value = label_pair.split('=', 1)
+                            labels[key.strip()] = value.strip().strip('"')
+                if metric_name not in metrics:
+                    metrics[metric_name] = []
+                elif not isinstance(metrics[metric_name], list):
+                    metrics[metric_name] = [{"labels": {}, "value": metrics[metric_name]}]
+                metrics[metric_name].append({
+                    "labels": labels,
+                    "value": float(value_part) if '.' in value_part else int(value_part)
+                })
+            else:
+                metric_name, value_part = line.rsplit(' ', 1)
+                value = float(value_part) if '.' in value_part else int(value_part)
+                if metric_name in metrics and isinstance(metrics[metric_name], list):
+                    metrics[metric_name].append({"labels": {}, "value": value})
+                else:
+                    metrics[metric_name] = value
+        except Exception:
+            continue
+    return metrics
+
+
+def _synthetic_be_page() -> bytes:
+    """A BE-like page: P0 metrics plus many labeled per-disk, per-pool and per-tablet series"""
+    lines = []
+    for name in P0Metrics.get_be_p0_metrics():
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f'{name}{{device="sda",path="/data/doris"}} 12345.5')
+    for family in range(400):
+        name = f"doris_be_engine_family_{family}"
+        lines.append(f"# HELP {name} synthetic family")
+        lines.append(f"# TYPE {name} counter")
+        for series in range(60):
+            lines.append(f'{name}{{type="t{series % 7}",tablet_id="{100000 + series}",path="/data/doris/{series % 4}"}} {series * 17}')
+    return ("\n".join(lines) + "\n").encode()
+
+
+def _measure(parse, repeat: int = 5) -> tuple[float, int]:
+    """Return the best wall time in milliseconds and the number of metrics kept"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = parse()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, len(result)
+
+
+def _streaming(page: bytes, prefixes, chunk_size: int = 64 * 1024) -> dict:
+    parser = PrometheusTextParser(prefixes)
+    for offset in range(0, len(page), chunk_size):
+        parser.feed(page[offset:offset + chunk_size])
+    return parser.close()
+
+
+def main(paths: list[str]):
+    pages = [(path, Path(path).read_bytes()) for path in paths] or [("synthetic", _synthetic_be_page())]
+    p0_prefixes = list(P0Metrics.get_be_p0_metrics())
+    p0_set = tuple(p0_prefixes)
+
+    for label, page in pages:
+        line_count = page.count(b"\n")
+        print(f"{label}: {len(page) / 1024 / 1024:.1f} MB, {line_count:,} lines")
+        candidates = [
+            ("legacy, all metrics", lambda: _legacy_parse(page.decode())),
+            ("legacy + P0 filter", lambda: {k: v for k, v in _legacy_parse(page.decode()).items() if k.startswith(p0_set)}),
+            ("streaming, all metrics", lambda: _streaming(page, None)),
+            ("streaming, P0 only", lambda: _streaming(page, p0_prefixes)),
+        ]
+        for name, parse in candidates:
+            elapsed_ms, kept = _measure(parse)
+            print(f"  {name:<24} {elapsed_ms:9.1f} ms {kept:>8,} metrics")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
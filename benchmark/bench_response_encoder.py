@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Tool response encoding benchmark
+
+Compares the previous two-pass encoding (row pre-walk followed by indented
+json.dumps) with the single-pass response encoders on a typical query result.
+
+Usage:
+    python benchmark/bench_response_encoder.py [rows]
+"""
+
+import json
+import sys
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from doris_mcp_server.utils.response_encoder import ResponseEncoder
+
+
+def _build_result(rows: int) -> dict:
+    start = datetime(2024, 1, 1)
+    return {
+        "success": True,
+        "data": [
+            {
+                "id": i,
+                "name": f"customer_{i}",
+                "amount": Decimal(f"{i}.25"),
+                "created_at": start + timedelta(seconds=i),
+                "region": "north" if i % 2 else "south",
+            }
+            for i in range(rows)
+        ],
+        "row_count": rows,
+    }
+
+
+def _serialize_row(row: dict) -> dict:
+    """Row pre-walk the query executor ran before the response encoders existed"""
+    serialized = {}
+    for key, value in row.items():
+        if value is None or isinstance(value, (str, int, float, bool)):
+            serialized[key] = value
+        elif isinstance(value, Decimal):
+            serialized[key] = float(value)
+        elif isinstance(value, (datetime, date)):
+            serialized[key] = value.isoformat()
+        elif isinstance(value, bytes):
+            try:
+                serialized[key] = value.decode("utf-8")
+            except UnicodeDecodeError:
+                serialized[key] = str(value)
+        else:
+            serialized[key] = str(value)
+    return serialized
+
+
+def _measure(encode, result: dict, repeat: int = 5) -> tuple[float, int]:
+    """Return the best wall time in milliseconds and the payload size"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        payload = encode(result)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, len(payload)
+
+
+def main(rows: int):
+    result = _build_result(rows)
+
+    def two_pass(res):
+        walked = dict(res, data=[_serialize_row(row) for row in res["data"]])
+        return json.dumps(walked, ensure_ascii=False, indent=2)
+
+    candidates = [("pre-walk + indent=2", two_pass)]
+    for name in ("json", "auto"):
+        encoder = ResponseEncoder(name)
+        candidates.append((f"single pass ({encoder.name})", encoder.encode))
+
+    print(f"rows: {rows}")
+    for label, encode in candidates:
+        elapsed_ms, size = _measure(encode, result)
+        print(f"{label:<24} {elapsed_ms:9.1f} ms {size:>12,} bytes")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
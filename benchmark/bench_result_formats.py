@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+exec_query result format benchmark
+
+Compares the encoded payload size and layout time of each exec_query result
+format for a range of result sizes.
+
+Usage:
+    python benchmark/bench_result_formats.py
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from doris_mcp_server.utils.query_executor import RESULT_FORMATS, DorisQueryExecutor
+from doris_mcp_server.utils.response_encoder import ResponseEncoder
+
+COLUMNS = ["order_id", "customer_name", "order_amount", "order_status", "created_at"]
+
+
+def _build_rows(count: int) -> list:
+    start = datetime(2024, 1, 1)
+    return [
+        {
+            "order_id": i,
+            "customer_name": f"customer_{i % 997}",
+            "order_amount": Decimal(f"{i % 10000}.99"),
+            "order_status": ("PAID", "SHIPPED", "CANCELLED")[i % 3],
+            "created_at": start + timedelta(minutes=i),
+        }
+        for i in range(count)
+    ]
+
+
+def main():
+    # Formatting needs no connection, so skip the executor's constructor
+    executor = DorisQueryExecutor.__new__(DorisQueryExecutor)
+    encoder = ResponseEncoder()
+    encoder.encode(_build_rows(10))  # warm up
+
+    print(f"{'rows':>7} {'format':<15} {'bytes':>12} {'vs rows':>8} {'ms':>8}")
+    for count in (10, 100, 1000, 10000):
+        rows = _build_rows(count)
+        baseline = None
+        for result_format in RESULT_FORMATS:
+            start = time.perf_counter()
+            payload = encoder.encode({
+                "success": True,
+                "data": executor._format_result_data(rows, COLUMNS, result_format),
+                "row_count": count,
+            })
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            size = len(payload.encode("utf-8"))
+            baseline = baseline or size
+            print(f"{count:>7} {result_format:<15} {size:>12,} {size / baseline:>7.0%} {elapsed_ms:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
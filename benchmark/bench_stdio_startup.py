@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+stdio startup benchmark
+
+Spawns the server in stdio mode and measures the time from process start to
+the initialize response, the tools/list response and the first tool call
+response. The first call is ``exec_query`` with ``SELECT 1``, which waits for
+the connection pool started behind the handshake. The database settings are
+taken from the environment (DORIS_HOST, DORIS_PORT, DORIS_USER, ...); a run
+fails if the tool call returns an error, so a reachable Doris is required.
+
+Usage:
+    python benchmark/bench_stdio_startup.py [runs]
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+
+async def _request(proc, request_id: int, method: str, params: dict) -> dict:
+    """Send a JSON-RPC request and wait for the response with the same id"""
+    message = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+    proc.stdin.write((json.dumps(message) + "\n").encode())
+    await proc.stdin.drain()
+    while True:
+        line = await proc.stdout.readline()
+        if not line:
+            raise RuntimeError(f"Server exited before answering {method}")
+        response = json.loads(line)
+        if response.get("id") == request_id:
+            return response
+
+
+def _check_tool_result(response: dict) -> None:
+    """Raise if a tools/call response reports an error"""
+    if "error" in response:
+        raise RuntimeError(f"Tool call failed: {response['error']}")
+    result = response["result"]
+    text = "".join(item.get("text", "") for item in result.get("content", []))
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        payload = {}
+    if result.get("isError") or (isinstance(payload, dict) and payload.get("success") is False):
+        raise RuntimeError(f"Tool call failed: {text[:200]}")
+
+
+async def _run_once() -> dict[str, float]:
+    """Start one server process, returning milliseconds to each response"""
+    env = dict(os.environ, LOG_LEVEL=os.getenv("LOG_LEVEL", "WARNING"))
+    start = time.perf_counter()
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "doris_mcp_server", "--transport", "stdio",
+        cwd=ROOT,
+        env=env,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    timings = {}
+    try:
+        await _request(proc, 1, "initialize", {
+            "protocolVersion": "2025-03-26",
+            "capabilities": {},
+            "clientInfo": {"name": "bench", "version": "0"},
+        })
+        timings["initialize"] = (time.perf_counter() - start) * 1000
+        proc.stdin.write(b'{"jsonrpc": "2.0", "method": "notifications/initialized"}\n')
+
+        await _request(proc, 2, "tools/list", {})
+        timings["tools/list"] = (time.perf_counter() - start) * 1000
+
+        response = await _request(proc, 3, "tools/call", {
+            "name": "exec_query",
+            "arguments": {"sql": "SELECT 1"},
+        })
+        timings["first tool call"] = (time.perf_counter() - start) * 1000
+        _check_tool_result(response)
+    finally:
+        proc.stdin.close()
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+    return timings
+
+
+async def main(runs: int):
+    results = [await _run_once() for _ in range(runs)]
+
+    print(f"runs:                   {runs}")
+    for stage in results[0]:
+        values = sorted(r[stage] for r in results)
+        print(f"{stage + ' (ms):':<24}median {values[len(values) // 2]:,.0f}  max {values[-1]:,.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5))
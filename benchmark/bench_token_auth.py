@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Token authentication benchmark
+
+Measures DorisSecurityManager.authenticate_request throughput for a steady
+stream of requests carrying the same token, with and without the
+verified-token cache.
+
+Usage:
+    python benchmark/bench_token_auth.py [iterations]
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from doris_mcp_server.utils.config import DorisConfig
+from doris_mcp_server.utils.security import DorisSecurityManager
+
+
+async def _run(auth_cache_ttl: int, iterations: int, token_file: str) -> float:
+    """Authenticate the same token repeatedly, returning requests per second"""
+    config = DorisConfig()
+    config.security.enable_token_auth = True
+    config.security.token_file_path = token_file
+    config.security.auth_cache_ttl = auth_cache_ttl
+
+    security_manager = DorisSecurityManager(config)
+    token_manager = security_manager.auth_provider.token_manager
+    try:
+        token = await token_manager.create_token(f"bench-{auth_cache_ttl}", custom_token=f"bench_token_{auth_cache_ttl}")
+        auth_info = {"authorization": f"Bearer {token}", "client_ip": "127.0.0.1"}
+
+        # Warm up (and populate the cache when enabled)
+        for _ in range(100):
+            await security_manager.authenticate_request(auth_info)
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await security_manager.authenticate_request(auth_info)
+        elapsed = time.perf_counter() - start
+    finally:
+        token_manager.stop_hot_reload()
+
+    return iterations / elapsed
+
+
+async def main(iterations: int):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        token_file = str(Path(tmp_dir) / "tokens.json")
+        uncached = await _run(0, iterations, token_file)
+        cached = await _run(60, iterations, token_file)
+
+    print(f"iterations:          {iterations}")
+    print(f"uncached (req/s):    {uncached:,.0f}")
+    print(f"cached (req/s):      {cached:,.0f}")
+    print(f"speedup:             {cached / uncached:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000))
@@ -20,18 +20,40 @@ Doris MCP Server Authentication Module
 Provides JWT-based, Token-based, and OAuth 2.0/OIDC authentication and authorization services
 """
 
-from .jwt_manager import JWTManager
-from .key_manager import KeyManager
-from .token_validators import TokenValidator, TokenBlacklist
-from .auth_middleware import AuthMiddleware
-from .token_manager import TokenManager, TokenInfo, TokenValidationResult
-from .token_handlers import TokenHandlers
-from .oauth_client import OAuthClient, OAuthStateManager
-from .oauth_provider import OAuthAuthenticationProvider
-from .oauth_types import (
-    OAuthProvider, OAuthState, OAuthTokens, OAuthUserInfo,
-    OIDCDiscovery, OAuthError, OAuthProviderConfig
-)
+import importlib
+
+# Submodules are imported on first attribute access: the JWT and OAuth providers pull
+# in PyJWT, cryptography and aiohttp, which most deployments (and stdio mode) never use
+_LAZY_EXPORTS = {
+    "JWTManager": ".jwt_manager",
+    "KeyManager": ".key_manager",
+    "TokenValidator": ".token_validators",
+    "TokenBlacklist": ".token_validators",
+    "AuthMiddleware": ".auth_middleware",
+    "TokenManager": ".token_manager",
+    "TokenInfo": ".token_manager",
+    "TokenValidationResult": ".token_manager",
+    "TokenHandlers": ".token_handlers",
+    "OAuthClient": ".oauth_client",
+    "OAuthStateManager": ".oauth_client",
+    "OAuthAuthenticationProvider": ".oauth_provider",
+    "OAuthProvider": ".oauth_types",
+    "OAuthState": ".oauth_types",
+    "OAuthTokens": ".oauth_types",
+    "OAuthUserInfo": ".oauth_types",
+    "OIDCDiscovery": ".oauth_types",
+    "OAuthError": ".oauth_types",
+    "OAuthProviderConfig": ".oauth_types",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "JWTManager",
@@ -51,6 +51,9 @@ class DorisCacheManager:
         self.metadata_cache = {}
         self.metadata_cache_time = {}
         self.metadata_cache_hits = {}
+        # Lookups since start, exported as the metadata cache hit ratio
+        self.hits = 0
+        self.misses = 0
 
     # =============================================================================
     # Section 1: Core Cache Operations (used by bi_schema_extractor.py)
@@ -70,6 +73,7 @@ class DorisCacheManager:
             return None, False
 
         if key not in self.metadata_cache:
+            self.misses += 1
             return None, False
 
         cache_time = self.metadata_cache_time.get(key, 0)
@@ -77,8 +81,10 @@ class DorisCacheManager:
 
         if is_expired:
             self._remove_cache_entry(key)
+            self.misses += 1
             return None, False
 
+        self.hits += 1
         self.metadata_cache_hits[key] = self.metadata_cache_hits.get(key, 0) + 1
         return self.metadata_cache[key], False
 
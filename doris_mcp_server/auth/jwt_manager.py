@@ -23,6 +23,8 @@ Provides comprehensive JWT token management including generation, validation, re
 import time
 import uuid
 import asyncio
+import hashlib
+from collections import OrderedDict
 from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
@@ -79,6 +81,13 @@ class JWTManager:
         # Automatic key rotation task
         self._key_rotation_task = None
         
+        # Precomputed jwt.decode() arguments, rebuilt only when keys change
+        self._verification_context: Optional[Dict[str, Any]] = None
+        
+        # Verified-token cache: token digest -> (payload, token_type, exp)
+        self.verification_cache_size = getattr(security_config, 'jwt_verification_cache_size', 10000)
+        self._verified_tokens: OrderedDict[bytes, Tuple[Dict[str, Any], str, float]] = OrderedDict()
+        
         logger.info(f"JWTManager initialized with algorithm: {self.algorithm}")
     
     async def initialize(self) -> bool:
@@ -89,6 +98,8 @@ class JWTManager:
                 logger.error("Failed to initialize key manager")
                 return False
             
+            self._build_verification_context()
+            
             # Start token validator
             await self.validator.start()
             
@@ -222,9 +233,65 @@ class JWTManager:
             logger.error(f"Failed to sign token: {e}")
             raise
     
+    def _build_verification_context(self):
+        """Precompute the jwt.decode() arguments for the current verification key
+        
+        Called on initialization and after every key rotation. Tokens verified
+        against the previous key are dropped from the verification cache.
+        """
+        if hasattr(self.config, 'security'):
+            security_config = self.config.security
+        else:
+            security_config = self.config
+        
+        self._verification_context = {
+            'key': self.key_manager.get_public_key(),
+            'algorithms': [self.algorithm],
+            'audience': self.audience if security_config.jwt_verify_audience else None,
+            'issuer': self.issuer if security_config.jwt_verify_issuer else None,
+            'leeway': security_config.jwt_leeway,
+            'options': {
+                'verify_signature': security_config.jwt_verify_signature,
+                'verify_exp': security_config.jwt_require_exp,
+                'verify_iat': security_config.jwt_require_iat,
+                'verify_nbf': security_config.jwt_require_nbf,
+                'verify_aud': security_config.jwt_verify_audience,
+                'verify_iss': security_config.jwt_verify_issuer,
+            },
+        }
+        self._verified_tokens.clear()
+    
+    def _get_cached_payload(self, cache_key: bytes, token_type: str) -> Optional[Dict[str, Any]]:
+        """Return the payload of an already signature-verified token, if still valid"""
+        entry = self._verified_tokens.get(cache_key)
+        if entry is None:
+            return None
+        
+        payload, cached_type, exp = entry
+        if cached_type != token_type or time.time() >= exp:
+            self._verified_tokens.pop(cache_key, None)
+            return None
+        
+        self._verified_tokens.move_to_end(cache_key)
+        return payload
+    
+    def _cache_payload(self, cache_key: bytes, payload: Dict[str, Any], token_type: str):
+        """Remember a signature-verified token until its 'exp' claim"""
+        exp = payload.get('exp')
+        if not exp:
+            # Tokens without expiry are always fully re-verified
+            return
+        
+        self._verified_tokens[cache_key] = (payload, token_type, float(exp))
+        while len(self._verified_tokens) > self.verification_cache_size:
+            self._verified_tokens.popitem(last=False)
+    
     async def validate_token(self, token: str, token_type: str = 'access') -> Dict[str, Any]:
         """Validate JWT token
         
+        Signature verification results are cached per token until the token's
+        'exp' claim. Claim validation (blacklist, rate limit) runs on every call.
+        
         Args:
             token: JWT token string
             token_type: Token type ('access' or 'refresh')
@@ -236,45 +303,39 @@ class JWTManager:
             ValueError: Token validation failed
         """
         try:
-            # Decode token
-            verification_key = self.key_manager.get_public_key()
-            
-            # Get security configuration
-            if hasattr(self.config, 'security'):
-                security_config = self.config.security
-            else:
-                security_config = self.config
-            
-            # JWT decoding options
-            options = {
-                'verify_signature': security_config.jwt_verify_signature,
-                'verify_exp': security_config.jwt_require_exp,
-                'verify_iat': security_config.jwt_require_iat,
-                'verify_nbf': security_config.jwt_require_nbf,
-                'verify_aud': security_config.jwt_verify_audience,
-                'verify_iss': security_config.jwt_verify_issuer,
-            }
-            
-            # Decode JWT
-            payload = jwt.decode(
-                token,
-                verification_key,
-                algorithms=[self.algorithm],
-                audience=self.audience if security_config.jwt_verify_audience else None,
-                issuer=self.issuer if security_config.jwt_verify_issuer else None,
-                leeway=security_config.jwt_leeway,
-                options=options
-            )
-            
-            # Check token type
-            if payload.get('token_type') != token_type:
-                raise ValueError(f"Invalid token type: expected {token_type}")
-            
-            # Use validator for additional checks
-            validation_result = await self.validator.validate_claims(payload)
+            cache_key = None
+            payload = None
+            if self.verification_cache_size > 0:
+                cache_key = hashlib.blake2b(token.encode('utf-8'), digest_size=16).digest()
+                payload = self._get_cached_payload(cache_key, token_type)
+            
+            if payload is None:
+                if self._verification_context is None:
+                    self._build_verification_context()
+                context = self._verification_context
+                
+                # Decode JWT
+                payload = jwt.decode(
+                    token,
+                    context['key'],
+                    algorithms=context['algorithms'],
+                    audience=context['audience'],
+                    issuer=context['issuer'],
+                    leeway=context['leeway'],
+                    options=context['options']
+                )
+                
+                # Check token type
+                if payload.get('token_type') != token_type:
+                    raise ValueError(f"Invalid token type: expected {token_type}")
+                
+                if cache_key is not None:
+                    self._cache_payload(cache_key, payload, token_type)
+                
+                logger.info(f"Token validation successful for user: {payload.get('sub')}")
             
-            logger.info(f"Token validation successful for user: {payload.get('sub')}")
-            return validation_result
+            # Use validator for additional checks (blacklist and rate limit included)
+            return await self.validator.validate_claims(payload)
             
         except jwt.ExpiredSignatureError:
             raise ValueError("Token has expired")
@@ -347,7 +408,8 @@ class JWTManager:
                 token,
                 verification_key,
                 algorithms=[self.algorithm],
-                options={'verify_exp': False}  # Allow decoding expired tokens
+                # Allow decoding expired tokens; only the signature matters for revocation
+                options={'verify_exp': False, 'verify_aud': False, 'verify_iss': False}
             )
             
             jti = payload.get('jti')
@@ -359,6 +421,7 @@ class JWTManager:
             
             # Add to blacklist
             await self.validator.revoke_token(jti, exp)
+            self._verified_tokens.pop(hashlib.blake2b(token.encode('utf-8'), digest_size=16).digest(), None)
             
             logger.info(f"Token {jti} revoked successfully")
             return True
@@ -420,7 +483,8 @@ class JWTManager:
                 # Check if key rotation is needed
                 if await self.key_manager.is_key_expired():
                     logger.info("Key rotation needed, rotating keys...")
-                    await self.key_manager.rotate_keys()
+                    if await self.key_manager.rotate_keys():
+                        self._build_verification_context()
                 
                 # Wait until next check
                 await asyncio.sleep(3600)  # Check every hour
@@ -466,6 +530,10 @@ class JWTManager:
                 'enable_refresh': self.enable_refresh,
                 'enable_revocation': self.enable_revocation
             },
+            'verification_cache': {
+                'size': len(self._verified_tokens),
+                'max_size': self.verification_cache_size
+            },
             'key_manager': key_info,
             'validator': validation_stats
         }
\ No newline at end of file
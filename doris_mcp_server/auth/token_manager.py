@@ -22,20 +22,27 @@ Provides enterprise-grade token authentication system with configurable tokens,
 expiration management, role-based access control and secure token storage.
 """
 
+import contextlib
 import hashlib
 import json
 import os
 import secrets
+import tempfile
 import time
 import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional
 from pathlib import Path
 
 from ..utils.logger import get_logger
 from ..utils.security import SecurityLevel
 
+try:
+    import fcntl
+except ImportError:  # Windows: token file updates are serialized within one process only
+    fcntl = None
+
 
 @dataclass
 class TokenInfo:
@@ -76,18 +83,28 @@ class TokenManager:
         # Token storage
         self._tokens: Dict[str, TokenInfo] = {}  # token_hash -> TokenInfo
         self._token_ids: Dict[str, str] = {}     # token_id -> token_hash
+        self._token_sources: Dict[str, str] = {}  # token_id -> default, env or file
+        self._token_fingerprints: Dict[str, tuple] = {}  # token_id -> loaded config fingerprint
         
         # Configuration
         self.token_file_path = getattr(config.security, 'token_file_path', 'tokens.json')
         self.enable_token_expiry = getattr(config.security, 'enable_token_expiry', True)
         self.default_token_expiry_hours = getattr(config.security, 'default_token_expiry_hours', 24 * 30)  # 30 days
         self.token_hash_algorithm = getattr(config.security, 'token_hash_algorithm', 'sha256')
+        # Resolve the hash constructor once instead of branching on every validation
+        self._hash_func = hashlib.sha512 if self.token_hash_algorithm == 'sha512' else hashlib.sha256
+        
+        # Bumped on every change to the token table so cached validations can be invalidated
+        self._generation = 0
         
         # Hot reload configuration
         self.enable_hot_reload = True
         self.hot_reload_interval = 10  # Check every 10 seconds
         self._file_last_modified = 0
         self._hot_reload_task = None
+        self._reload_listeners: List[Callable[[], None]] = []
+        # Serializes read-modify-write updates of the token file
+        self._file_lock = asyncio.Lock()
         
         # Initialize with default tokens if none exist
         self._initialize_default_tokens()
@@ -153,38 +170,78 @@ class TokenManager:
         # Add default tokens only if no custom configuration exists
         if not custom_tokens_exist and not token_file_exists:
             for token_config in default_tokens:
-                self._add_token_from_config(token_config)
+                self._add_token_from_config(token_config, source='default')
             
             self.logger.info(f"Initialized {len(default_tokens)} default tokens (no custom config found)")
         else:
             self.logger.info("Skipped default tokens initialization (custom tokens detected)")
     
-    def _add_token_from_config(self, token_config: Dict[str, Any]):
+    def _build_token_entry(self, token_config: Dict[str, Any]) -> tuple[str, TokenInfo]:
+        """Build the (token_hash, TokenInfo) pair for a token configuration"""
+        # Calculate expiration time
+        expires_at = None
+        if self.enable_token_expiry:
+            expires_hours = token_config.get('expires_hours', self.default_token_expiry_hours)
+            if expires_hours is not None:
+                expires_at = datetime.utcnow() + timedelta(hours=expires_hours)
+        
+        # Create token info
+        token_info = TokenInfo(
+            token_id=token_config['token_id'],
+            expires_at=expires_at,
+            description=token_config.get('description', ''),
+            is_active=token_config.get('is_active', True)
+        )
+        
+        # Hash the token
+        return self._hash_token(token_config['token']), token_info
+    
+    def _config_fingerprint(self, token_config: Dict[str, Any], token_hash: str) -> tuple:
+        """Fingerprint of a token configuration, used to detect changed entries on reload"""
+        return (
+            token_hash,
+            token_config.get('description', ''),
+            token_config.get('is_active', True),
+            token_config.get('expires_hours', self.default_token_expiry_hours),
+        )
+    
+    def _store_token(self, token_hash: str, token_info: TokenInfo, source: str, fingerprint: tuple):
+        """Insert or replace a token in the token table"""
+        token_id = token_info.token_id
+        previous_hash = self._token_ids.get(token_id)
+        if previous_hash is not None and previous_hash != token_hash:
+            previous_info = self._tokens.get(previous_hash)
+            if previous_info is not None and previous_info.token_id == token_id:
+                del self._tokens[previous_hash]
+        
+        self._tokens[token_hash] = token_info
+        self._token_ids[token_id] = token_hash
+        self._token_sources[token_id] = source
+        self._token_fingerprints[token_id] = fingerprint
+        self._generation += 1
+    
+    def _drop_token(self, token_id: str) -> bool:
+        """Remove a token from the token table by token ID"""
+        token_hash = self._token_ids.pop(token_id, None)
+        self._token_sources.pop(token_id, None)
+        self._token_fingerprints.pop(token_id, None)
+        if token_hash is None:
+            return False
+        
+        token_info = self._tokens.get(token_hash)
+        if token_info is not None and token_info.token_id == token_id:
+            del self._tokens[token_hash]
+        self._generation += 1
+        return True
+    
+    def _add_token_from_config(self, token_config: Dict[str, Any], source: str = 'file'):
         """Add token from configuration with optional database binding"""
         try:
-            # Calculate expiration time
-            expires_at = None
-            if self.enable_token_expiry:
-                expires_hours = token_config.get('expires_hours', self.default_token_expiry_hours)
-                if expires_hours is not None:
-                    expires_at = datetime.utcnow() + timedelta(hours=expires_hours)
-            
-            # Create token info
-            token_info = TokenInfo(
-                token_id=token_config['token_id'],
-                expires_at=expires_at,
-                description=token_config.get('description', ''),
-                is_active=token_config.get('is_active', True)
+            token_hash, token_info = self._build_token_entry(token_config)
+            self._store_token(
+                token_hash, token_info, source, self._config_fingerprint(token_config, token_hash)
             )
             
-            # Hash the token
-            raw_token = token_config['token']
-            token_hash = self._hash_token(raw_token)
-            
-            # Store token
-            self._tokens[token_hash] = token_info
-            self._token_ids[token_info.token_id] = token_hash
-            
             self.logger.debug(f"Added token '{token_info.token_id}'")
             
         except Exception as e:
@@ -252,42 +309,101 @@ class TokenManager:
                     'description': description
                 }
                 
-                self._add_token_from_config(token_config)
+                self._add_token_from_config(token_config, source='env')
                 
             except Exception as e:
                 self.logger.error(f"Failed to load token {token_id} from environment: {e}")
     
+    def _read_token_file(self) -> List[Dict[str, Any]]:
+        """Read and parse the token configurations from the JSON token file"""
+        with open(self.token_file_path, 'r', encoding='utf-8') as f:
+            tokens_data = json.load(f)
+        
+        if isinstance(tokens_data, dict) and 'tokens' in tokens_data:
+            return tokens_data['tokens']
+        if isinstance(tokens_data, list):
+            return tokens_data
+        raise ValueError(f"Invalid token file format: {self.token_file_path}")
+    
     def _load_tokens_from_file(self):
         """Load tokens from JSON file"""
         try:
-            with open(self.token_file_path, 'r', encoding='utf-8') as f:
-                tokens_data = json.load(f)
-            
-            if isinstance(tokens_data, dict) and 'tokens' in tokens_data:
-                tokens_list = tokens_data['tokens']
-            elif isinstance(tokens_data, list):
-                tokens_list = tokens_data
-            else:
-                self.logger.error(f"Invalid token file format: {self.token_file_path}")
-                return
+            tokens_list = self._read_token_file()
             
             for token_config in tokens_list:
-                self._add_token_from_config(token_config)
+                self._add_token_from_config(token_config, source='file')
             
             self.logger.info(f"Loaded {len(tokens_list)} tokens from file: {self.token_file_path}")
             
         except Exception as e:
             self.logger.error(f"Failed to load tokens from file {self.token_file_path}: {e}")
     
+    def _write_token_file(self, data: Dict[str, Any], file_path: Optional[str] = None):
+        """Atomically replace the token file
+        
+        The content is written to a temporary file in the same directory, flushed
+        to disk and renamed over the target, so readers never see a partial file.
+        """
+        file_path = file_path or self.token_file_path
+        directory = os.path.dirname(os.path.abspath(file_path))
+        fd, tmp_path = tempfile.mkstemp(prefix='.tokens-', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+    
+    async def _persist(self, func: Callable[..., Any], *args, apply: Optional[Callable[[], Any]] = None):
+        """Run a blocking token file update in a worker thread, one update at a time
+        
+        ``apply`` makes the matching in-memory change under the same lock, so a
+        concurrent hot reload sees either neither or both of them.
+        """
+        async with self._file_lock:
+            if apply is not None:
+                apply()
+            written_mtime = await asyncio.to_thread(self._update_token_file, func, *args)
+            if written_mtime is not None:
+                self._file_last_modified = written_mtime
+    
+    def _update_token_file(self, func: Callable[..., Any], *args) -> Optional[float]:
+        """Run a token file update holding an exclusive lock shared by all processes
+        
+        HTTP workers share the token file, so each read-modify-write takes an
+        flock on a sidecar lock file. Returns the file's new modification time
+        when no external change was pending, so hot reload does not re-apply our
+        own write; otherwise None, leaving the pending change to be picked up.
+        """
+        with self._token_file_lock():
+            up_to_date = self._file_modified_time() <= self._file_last_modified
+            func(*args)
+            return self._file_modified_time() if up_to_date else None
+    
+    @contextlib.contextmanager
+    def _token_file_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(f"{self.token_file_path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
     def _hash_token(self, token: str) -> str:
-        """Hash token for secure storage"""
-        if self.token_hash_algorithm == 'sha256':
-            return hashlib.sha256(token.encode('utf-8')).hexdigest()
-        elif self.token_hash_algorithm == 'sha512':
-            return hashlib.sha512(token.encode('utf-8')).hexdigest()
-        else:
-            # Fallback to sha256
-            return hashlib.sha256(token.encode('utf-8')).hexdigest()
+        """Hash token for secure storage (sha256 or sha512, falling back to sha256)"""
+        return self._hash_func(token.encode('utf-8')).hexdigest()
+    
+    @property
+    def generation(self) -> int:
+        """Monotonic counter that changes whenever tokens are added, revoked or reloaded"""
+        return self._generation
     
     async def validate_token(self, token: str) -> TokenValidationResult:
         """Validate token and return user information"""
@@ -371,13 +487,16 @@ class TokenManager:
             
             # Hash and store token
             token_hash = self._hash_token(raw_token)
-            self._tokens[token_hash] = token_info
-            self._token_ids[token_id] = token_hash
+            token_config = self._token_info_to_config(token_id, raw_token, token_info)
+            fingerprint = self._config_fingerprint(token_config, token_hash)
             
-            self.logger.info(f"Created new token '{token_id}'")
+            # Save token to file without blocking the event loop
+            await self._persist(
+                self._save_token_to_file, token_id, raw_token, token_info,
+                apply=lambda: self._store_token(token_hash, token_info, 'file', fingerprint),
+            )
             
-            # Save token to file
-            self._save_token_to_file(token_id, raw_token, token_info)
+            self.logger.info(f"Created new token '{token_id}'")
             
             return raw_token
             
@@ -392,17 +511,13 @@ class TokenManager:
                 self.logger.warning(f"Token ID '{token_id}' not found")
                 return False
             
-            # Get token hash and remove from storage
-            token_hash = self._token_ids[token_id]
-            if token_hash in self._tokens:
-                del self._tokens[token_hash]
-            del self._token_ids[token_id]
+            # Remove from storage and save updated tokens to file without blocking the event loop
+            await self._persist(
+                self._remove_token_from_file, token_id, apply=lambda: self._drop_token(token_id)
+            )
             
             self.logger.info(f"Revoked token '{token_id}'")
             
-            # Save updated tokens to file
-            self._remove_token_from_file(token_id)
-            
             return True
             
         except Exception as e:
@@ -463,8 +578,7 @@ class TokenManager:
             }
             
             # Save to file
-            with open(self.token_file_path, 'w', encoding='utf-8') as f:
-                json.dump(file_content, f, indent=2, ensure_ascii=False)
+            self._write_token_file(file_content)
             
             self.logger.info(f"Saved {len(tokens_list)} tokens to file: {self.token_file_path}")
             
@@ -509,8 +623,7 @@ class TokenManager:
             })
             
             # Save to file
-            with open(self.token_file_path, 'w', encoding='utf-8') as f:
-                json.dump(existing_data, f, indent=2, ensure_ascii=False)
+            self._write_token_file(existing_data)
             
             self.logger.info(f"Saved token '{token_id}' to file: {self.token_file_path}")
             
@@ -564,8 +677,7 @@ class TokenManager:
                 })
                 
                 # Save to file
-                with open(self.token_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(existing_data, f, indent=2, ensure_ascii=False)
+                self._write_token_file(existing_data)
                 
                 self.logger.info(f"Removed token '{token_id}' from file: {self.token_file_path}")
             
@@ -611,9 +723,9 @@ class TokenManager:
         
         # Remove expired tokens
         for token_hash, token_id in expired_tokens:
-            del self._tokens[token_hash]
-            if token_id in self._token_ids:
-                del self._token_ids[token_id]
+            if not self._drop_token(token_id):
+                del self._tokens[token_hash]
+                self._generation += 1
         
         if expired_tokens:
             self.logger.info(f"Cleaned up {len(expired_tokens)} expired tokens")
@@ -632,8 +744,7 @@ class TokenManager:
                 'tokens': tokens_list
             }
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(tokens_data, f, indent=2, ensure_ascii=False)
+            await self._persist(self._write_token_file, tokens_data, file_path)
             
             self.logger.info(f"Saved {len(tokens_list)} tokens to file: {file_path}")
             return True
@@ -681,6 +792,25 @@ class TokenManager:
             self._hot_reload_task = None
             self.logger.info("Stopped hot reload monitoring")
     
+    def add_reload_listener(self, callback: Callable[[], None]):
+        """Register a callback invoked after tokens are hot-reloaded from file"""
+        self._reload_listeners.append(callback)
+    
+    def _notify_reload_listeners(self):
+        """Notify registered listeners that the token table changed"""
+        for callback in self._reload_listeners:
+            try:
+                callback()
+            except Exception as e:
+                self.logger.error(f"Token reload listener failed: {e}")
+    
+    def _file_modified_time(self) -> float:
+        """Modification time of the token file, 0 when it does not exist"""
+        try:
+            return os.path.getmtime(self.token_file_path)
+        except OSError:
+            return 0
+    
     def _update_file_modified_time(self):
         """Update the last modified time of tokens file"""
         try:
@@ -689,6 +819,75 @@ class TokenManager:
         except Exception as e:
             self.logger.debug(f"Failed to get file modification time: {e}")
     
+    def _apply_token_file(self, tokens_list: List[Dict[str, Any]]) -> tuple[int, int, int]:
+        """Apply token file contents as a diff against the current token table
+        
+        Every entry is validated before anything is modified. Tokens loaded from
+        the file (or the built-in defaults) that are no longer listed are removed,
+        new and changed entries are stored, unchanged entries keep their state.
+        
+        Returns:
+            Tuple of (added, removed, changed) counts
+        """
+        entries = {}
+        for token_config in tokens_list:
+            token_hash, token_info = self._build_token_entry(token_config)
+            entries[token_info.token_id] = (
+                token_hash, token_info, self._config_fingerprint(token_config, token_hash)
+            )
+        
+        removed = [
+            token_id for token_id, source in self._token_sources.items()
+            if source in ('file', 'default') and token_id not in entries
+        ]
+        for token_id in removed:
+            self._drop_token(token_id)
+        
+        added = changed = 0
+        for token_id, (token_hash, token_info, fingerprint) in entries.items():
+            if token_id not in self._token_ids:
+                added += 1
+            elif (self._token_sources.get(token_id) == 'file'
+                  and self._token_fingerprints.get(token_id) == fingerprint):
+                continue
+            else:
+                changed += 1
+            self._store_token(token_hash, token_info, 'file', fingerprint)
+        
+        return added, len(removed), changed
+    
+    async def _reload_token_file(self):
+        """Re-read the token file and apply it if it changed since the last load or write
+        
+        Holds the file lock so a token created or revoked concurrently, which is
+        stored in memory before its file update, is never undone by applying the
+        file as it was before that update.
+        """
+        async with self._file_lock:
+            current_mtime = self._file_modified_time()
+            if current_mtime <= self._file_last_modified:
+                return  # Our own write, applied while waiting for the lock
+            
+            self.logger.info(f"Detected changes in {self.token_file_path}, reloading tokens...")
+            try:
+                tokens_list = await asyncio.to_thread(self._read_token_file)
+                # Applied without awaiting, so requests never observe a partial table
+                added, removed, changed = self._apply_token_file(tokens_list)
+                
+                # Update modification time
+                self._file_last_modified = current_mtime
+                
+                self.logger.info(
+                    f"Hot reload completed: {added} added, {removed} removed, {changed} changed, "
+                    f"{len(self._tokens)} tokens loaded"
+                )
+                if added or removed or changed:
+                    self._notify_reload_listeners()
+                
+            except Exception as reload_error:
+                # The token table is only modified once the whole file is validated
+                self.logger.error(f"Hot reload failed, keeping previous tokens: {reload_error}")
+    
     async def _hot_reload_monitor(self):
         """Background task to monitor tokens.json file changes"""
         while True:
@@ -699,35 +898,8 @@ class TokenManager:
                     continue
                 
                 # Check if file was modified
-                current_mtime = os.path.getmtime(self.token_file_path)
-                if current_mtime > self._file_last_modified:
-                    self.logger.info(f"Detected changes in {self.token_file_path}, reloading tokens...")
-                    
-                    try:
-                        # Backup current tokens
-                        old_tokens = self._tokens.copy()
-                        old_token_ids = self._token_ids.copy()
-                        
-                        # Clear and reload
-                        self._tokens.clear()
-                        self._token_ids.clear()
-                        
-                        # Reinitialize default tokens
-                        self._initialize_default_tokens()
-                        
-                        # Load from file
-                        self._load_tokens_from_file()
-                        
-                        # Update modification time
-                        self._file_last_modified = current_mtime
-                        
-                        self.logger.info(f"Hot reload completed, {len(self._tokens)} tokens loaded")
-                        
-                    except Exception as reload_error:
-                        # Restore backup on failure
-                        self.logger.error(f"Hot reload failed, restoring previous tokens: {reload_error}")
-                        self._tokens = old_tokens
-                        self._token_ids = old_token_ids
+                if os.path.getmtime(self.token_file_path) > self._file_last_modified:
+                    await self._reload_token_file()
                 
             except asyncio.CancelledError:
                 self.logger.info("Hot reload monitor stopped")
@@ -20,11 +20,15 @@ JWT Token Validation Module
 Provides token validation, blacklist management and security features
 """
 
+import hashlib
+import os
+import struct
+import threading
 import time
 import asyncio
 from typing import Dict, Set, Optional, Any
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import OrderedDict
 
 from ..utils.logger import get_logger
 
@@ -146,23 +150,67 @@ class TokenBlacklist:
                 logger.error(f"Error during periodic cleanup: {e}")
 
 
+def _sliding_window_estimate(previous_count: int, current_count: int, elapsed_fraction: float) -> float:
+    """Estimate requests in the trailing window from two fixed-window counters
+
+    The previous window's count is weighted by how much of it still overlaps
+    the sliding window, which keeps the per-key state at two integers.
+    """
+    return previous_count * (1.0 - elapsed_fraction) + current_count
+
+
 class RateLimiter:
-    """Token usage rate limiter"""
+    """Token usage rate limiter
+
+    Sliding-window counter: each key keeps only the current and previous
+    fixed-window counts, so checks are O(1) with fixed memory per key.
+    Keys idle for more than a full window are evicted, and the number of
+    tracked keys is bounded by ``max_keys``.
+    """
     
-    def __init__(self, max_requests: int = 100, time_window: int = 3600):
+    def __init__(self, max_requests: int = 100, time_window: int = 3600, max_keys: int = 100000):
         """Initialize rate limiter
         
         Args:
             max_requests: Maximum requests within time window
             time_window: Time window in seconds
+            max_keys: Maximum number of tracked users (least recently seen are evicted)
         """
         self.max_requests = max_requests
         self.time_window = time_window
-        # Storage format: {user_id: [timestamp1, timestamp2, ...]}
-        self._request_history: Dict[str, list] = defaultdict(list)
+        self.max_keys = max_keys
+        # Storage format: {user_id: [window_index, current_count, previous_count]},
+        # ordered from least to most recently seen
+        self._windows: "OrderedDict[str, list]" = OrderedDict()
         
         logger.info(f"RateLimiter initialized: {max_requests} requests per {time_window} seconds")
     
+    def _get_window(self, user_id: str, window_index: int, create: bool) -> Optional[list]:
+        """Return the user's counters rolled forward to ``window_index``"""
+        entry = self._windows.get(user_id)
+        if entry is None:
+            if not create:
+                return None
+            entry = [window_index, 0, 0]
+            self._windows[user_id] = entry
+        else:
+            self._windows.move_to_end(user_id)
+            if entry[0] != window_index:
+                # Counts from a window older than the previous one no longer overlap
+                entry[2] = entry[1] if entry[0] == window_index - 1 else 0
+                entry[1] = 0
+                entry[0] = window_index
+        return entry
+    
+    def _evict_idle(self, window_index: int):
+        """Drop least recently seen keys that are idle or over the key budget"""
+        windows = self._windows
+        while windows:
+            oldest_key, oldest = next(iter(windows.items()))
+            if oldest[0] >= window_index - 1 and len(windows) <= self.max_keys:
+                break
+            del windows[oldest_key]
+    
     async def is_allowed(self, user_id: str) -> bool:
         """Check if user is allowed to make request
         
@@ -173,19 +221,17 @@ class RateLimiter:
             True if allowed, False otherwise
         """
         current_time = time.time()
-        user_requests = self._request_history[user_id]
+        window_index = int(current_time // self.time_window)
+        entry = self._get_window(user_id, window_index, create=True)
+        self._evict_idle(window_index)
         
-        # Clean up expired request records
-        cutoff_time = current_time - self.time_window
-        user_requests[:] = [t for t in user_requests if t > cutoff_time]
-        
-        # Check if limit exceeded
-        if len(user_requests) >= self.max_requests:
+        elapsed_fraction = (current_time % self.time_window) / self.time_window
+        if _sliding_window_estimate(entry[2], entry[1], elapsed_fraction) >= self.max_requests:
             logger.warning(f"Rate limit exceeded for user {user_id}")
             return False
         
         # Record current request
-        user_requests.append(current_time)
+        entry[1] += 1
         return True
     
     async def get_usage(self, user_id: str) -> Dict[str, Any]:
@@ -198,20 +244,188 @@ class RateLimiter:
             Usage statistics
         """
         current_time = time.time()
-        user_requests = self._request_history[user_id]
+        window_index = int(current_time // self.time_window)
+        entry = self._get_window(user_id, window_index, create=False)
+        
+        requests_in_window = 0
+        if entry is not None:
+            elapsed_fraction = (current_time % self.time_window) / self.time_window
+            requests_in_window = int(_sliding_window_estimate(entry[2], entry[1], elapsed_fraction))
+        
+        return {
+            "user_id": user_id,
+            "requests_in_window": requests_in_window,
+            "max_requests": self.max_requests,
+            "time_window": self.time_window,
+            "remaining_requests": max(0, self.max_requests - requests_in_window)
+        }
+
+
+class SharedRateLimiter(RateLimiter):
+    """Sliding-window rate limiter shared between processes
+
+    Counters live in a fixed-size slot table in a memory-mapped file, guarded
+    by an exclusive ``flock``, so every worker started by ``multiworker_app``
+    enforces the same per-user limit. Users are mapped to slots by a 64-bit
+    hash with short linear probing; idle slots are reused and, when a probe
+    run is full, the least recently active slot is recycled.
+    """
+
+    _HEADER = struct.Struct("<8sIi")  # magic, slot count, time window
+    _SLOT = struct.Struct("<QqII")  # key hash, window index, current count, previous count
+    _MAGIC = b"DMCPRL01"
+    _PROBE_LIMIT = 8
+
+    def __init__(
+        self,
+        path: str,
+        max_requests: int = 100,
+        time_window: int = 3600,
+        slots: int = 16384,
+    ):
+        """Initialize shared rate limiter
+        
+        Args:
+            path: Backing file shared by all participating processes
+            max_requests: Maximum requests within time window
+            time_window: Time window in seconds
+            slots: Number of user slots in the shared table
+        """
+        import fcntl
+        import mmap
+
+        super().__init__(max_requests, time_window, max_keys=slots)
+        self._flock = fcntl.flock
+        self._lock_ex = fcntl.LOCK_EX
+        self._lock_un = fcntl.LOCK_UN
+        self._thread_lock = threading.Lock()
+        self.path = path
+        self.slots = slots
+
+        size = self._HEADER.size + slots * self._SLOT.size
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._flock(self._fd, self._lock_ex)
+        try:
+            header = os.pread(self._fd, self._HEADER.size, 0)
+            expected = self._HEADER.pack(self._MAGIC, slots, time_window)
+            if header != expected or os.fstat(self._fd).st_size != size:
+                # New file or a table laid out with different parameters
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, size)
+                os.pwrite(self._fd, expected, 0)
+        finally:
+            self._flock(self._fd, self._lock_un)
+        self._map = mmap.mmap(self._fd, size)
+
+        logger.info(f"SharedRateLimiter attached to {path} ({slots} slots)")
+
+    def _slot_offset(self, key_hash: int, window_index: int) -> int:
+        """Find the slot for ``key_hash``; caller must hold the lock"""
+        slot_size = self._SLOT.size
+        base = self._HEADER.size
+        start = key_hash % self.slots
+        reusable = None
+        oldest_offset, oldest_window = None, None
+        for probe in range(self._PROBE_LIMIT):
+            offset = base + ((start + probe) % self.slots) * slot_size
+            slot_key, slot_window, _, _ = self._SLOT.unpack_from(self._map, offset)
+            if slot_key == key_hash:
+                return offset
+            if reusable is None and (slot_key == 0 or slot_window < window_index - 1):
+                reusable = offset
+            if oldest_window is None or slot_window < oldest_window:
+                oldest_offset, oldest_window = offset, slot_window
+        offset = reusable if reusable is not None else oldest_offset
+        self._SLOT.pack_into(self._map, offset, key_hash, window_index, 0, 0)
+        return offset
+
+    def _update(self, user_id: str, consume: bool) -> tuple[bool, int]:
+        """Roll the user's slot forward and optionally record a request"""
+        key_hash = int.from_bytes(
+            hashlib.blake2b(user_id.encode("utf-8"), digest_size=8).digest(), "little"
+        ) or 1  # zero marks an empty slot
+        current_time = time.time()
+        window_index = int(current_time // self.time_window)
+        elapsed_fraction = (current_time % self.time_window) / self.time_window
+
+        with self._thread_lock:
+            self._flock(self._fd, self._lock_ex)
+            try:
+                offset = self._slot_offset(key_hash, window_index)
+                _, slot_window, current_count, previous_count = self._SLOT.unpack_from(self._map, offset)
+                if slot_window != window_index:
+                    previous_count = current_count if slot_window == window_index - 1 else 0
+                    current_count = 0
+                estimate = _sliding_window_estimate(previous_count, current_count, elapsed_fraction)
+                allowed = estimate < self.max_requests
+                if consume and allowed:
+                    current_count += 1
+                self._SLOT.pack_into(
+                    self._map, offset, key_hash, window_index, current_count, previous_count
+                )
+            finally:
+                self._flock(self._fd, self._lock_un)
+        return allowed, int(estimate)
+
+    async def is_allowed(self, user_id: str) -> bool:
+        """Check if user is allowed to make request
         
-        # Clean up expired records
-        cutoff_time = current_time - self.time_window
-        active_requests = [t for t in user_requests if t > cutoff_time]
+        Args:
+            user_id: User ID
+            
+        Returns:
+            True if allowed, False otherwise
+        """
+        allowed, _ = self._update(user_id, consume=True)
+        if not allowed:
+            logger.warning(f"Rate limit exceeded for user {user_id}")
+        return allowed
+
+    async def get_usage(self, user_id: str) -> Dict[str, Any]:
+        """Get user usage information
         
+        Args:
+            user_id: User ID
+            
+        Returns:
+            Usage statistics
+        """
+        _, requests_in_window = self._update(user_id, consume=False)
         return {
             "user_id": user_id,
-            "requests_in_window": len(active_requests),
+            "requests_in_window": requests_in_window,
             "max_requests": self.max_requests,
             "time_window": self.time_window,
-            "remaining_requests": max(0, self.max_requests - len(active_requests))
+            "remaining_requests": max(0, self.max_requests - requests_in_window)
         }
 
+    def close(self):
+        """Detach from the shared table (the backing file is left in place)"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def create_rate_limiter(security_config) -> RateLimiter:
+    """Create the rate limiter selected by the security configuration"""
+    max_requests = security_config.jwt_rate_limit_requests
+    time_window = security_config.jwt_rate_limit_window
+    if security_config.rate_limit_backend == "shared":
+        # There is no host-wide default: a file shared by unrelated server instances
+        # would pool their limits, so the worker supervisor assigns one per pool
+        path = security_config.rate_limit_shared_path
+        if not path:
+            logger.warning("RATE_LIMIT_SHARED_PATH is not set, falling back to per-process limits")
+            return RateLimiter(max_requests, time_window)
+        try:
+            return SharedRateLimiter(path, max_requests, time_window)
+        except (ImportError, OSError) as e:
+            logger.warning(f"Shared rate limiter unavailable ({e}), falling back to per-process limits")
+    return RateLimiter(max_requests, time_window)
+
 
 class TokenValidator:
     """JWT Token Validator
@@ -229,7 +443,6 @@ class TokenValidator:
         """
         self.config = config
         self.blacklist = blacklist or TokenBlacklist()
-        self.rate_limiter = RateLimiter()
         
         # Access JWT settings through the security configuration
         if hasattr(config, 'security'):
@@ -238,6 +451,8 @@ class TokenValidator:
             # Fallback if config is passed directly as SecurityConfig
             security_config = config
         
+        self.rate_limiter = create_rate_limiter(security_config)
+        
         # Validation options
         self.verify_signature = security_config.jwt_verify_signature
         self.verify_audience = security_config.jwt_verify_audience
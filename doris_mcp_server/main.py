@@ -26,6 +26,7 @@ import argparse
 import asyncio
 import json
 import logging
+import time
 from typing import Any
 
 # MCP version compatibility handling
@@ -209,9 +210,21 @@ if not _import_mcp_with_compatibility():
 from .tools.bi_tools_manager import DorisToolsManager
 from .tools.prompts_manager import DorisPromptsManager
 from .tools.resources_manager import DorisResourcesManager
+from .utils.asgi_router import PrefixRouter
 from .utils.config import DorisConfig
 from .utils.db import DorisConnectionManager
+from .utils.http_client import close_http_session
 from .utils.security import DorisSecurityManager
+from .utils.server_metrics import register_server, render_metrics
+from .utils.sql_security_utils import set_auth_context
+from .utils.tracing import carry_span
+from .utils.worker_supervisor import (
+    REUSE_PORT_SUPPORTED,
+    WorkerSupervisor,
+    create_reuseport_socket,
+    read_pool_stats,
+    write_worker_stats,
+)
 from .auth.cache_manager import DorisCacheManager
 import os
 
@@ -247,11 +260,22 @@ class DorisServer:
         self.resources_manager = DorisResourcesManager(self.connection_manager)
         self.tools_manager = DorisToolsManager(self.connection_manager, self.cache_manager)
         self.prompts_manager = DorisPromptsManager(self.connection_manager)
+        self._prefetch_task = None  # stdio metadata prefetch
 
         # Import here to avoid circular imports
-        from .utils.logger import get_logger
+        from .utils.logger import get_hot_path_logger, get_logger
         from .utils.mcp_call_stats import MCPCallStats
         self.logger = get_logger(f"{__name__}.DorisServer")
+        # Sampled, rate-limited logger for messages emitted on every request
+        self.request_logger = get_hot_path_logger(f"{__name__}.DorisServer")
+        self.request_counters = {"http_requests": 0}
+        # Exported on monitoring.metrics_path, read only when scraped
+        register_server(
+            tools_manager=self.tools_manager,
+            connection_manager=self.connection_manager,
+            cache_manager=self.cache_manager,
+            request_counters=self.request_counters,
+        )
         self._setup_handlers()
         # Load MCP call stats on server startup
         MCPCallStats.load_stats()
@@ -365,16 +389,14 @@ class DorisServer:
         async def handle_list_tools() -> list[Tool]:
             """Handle tool list request"""
             try:
-                self.logger.info(f"Handling tool list request")
                 ctx = self.server.request_context
                 headers = {}
                 if ctx and ctx.request:
                     # ctx.request 是 transport 提供的 request（StreamableHTTP 下为 Starlette Request）
                     headers = dict(ctx.request.headers)
                 mcp_session_id = headers.get("mcp-session-id")
-                self.logger.info(f"MCP Session ID: {mcp_session_id}")
                 tools = await self.tools_manager.list_tools(mcp_session_id)
-                self.logger.info(f"Returning {len(tools)} tools")
+                self.request_logger.debug("Returning %d tools, MCP Session ID: %s", len(tools), mcp_session_id)
                 return tools
             except Exception as e:
                 self.logger.error(f"Failed to handle tool list request: {e}")
@@ -386,14 +408,21 @@ class DorisServer:
         ) -> list[TextContent]:
             """Handle tool call request"""
             try:
-                self.logger.info(f"Handling tool call request: {name}")
                 ctx = self.server.request_context
                 headers = {}
                 if ctx and ctx.request:
                     # ctx.request 是 transport 提供的 request（StreamableHTTP 下为 Starlette Request）
                     headers = dict(ctx.request.headers)
+                    # The session task may outlive the request that created it, so rebind the
+                    # shared auth context from the request this message arrived on
+                    auth_context = ctx.request.scope.get("auth_context")
+                    if auth_context is not None:
+                        set_auth_context(auth_context)
+                    auth_span = ctx.request.scope.get("auth_span")
+                    if auth_span is not None:
+                        carry_span("auth", *auth_span)
                 mcp_session_id = headers.get("mcp-session-id")
-                self.logger.info(f"MCP Session ID: {mcp_session_id}")
+                self.request_logger.debug("Handling tool call request: %s, MCP Session ID: %s", name, mcp_session_id)
                 result = await self.tools_manager.call_tool(name, arguments, mcp_session_id)
 
                 return [TextContent(type="text", text=result)]
@@ -452,9 +481,13 @@ class DorisServer:
             await self.security_manager.initialize()
             self.logger.info("Security manager initialization completed")
             
-            # For stdio mode, we must establish a working database connection
-            # Use the dedicated stdio mode initialization method
-            await self.connection_manager.initialize_for_stdio_mode()
+            # Validate the database configuration now, but connect in the background so
+            # the MCP initialize exchange is not held up by connectivity tests and pool
+            # warmup. The first tool call waits in get_connection() if it arrives early.
+            self.connection_manager.start_background_initialization()
+            if getattr(self.config.performance, "enable_metadata_cache", True):
+                self._prefetch_task = asyncio.create_task(self.resources_manager.prefetch_metadata())
+            self.tools_manager.monitoring_tools.start_collector()
 
             # Start stdio server - using compatible import approach
             try:
@@ -513,9 +546,19 @@ class DorisServer:
 
 
 
-    async def start_http(self, host: str = os.getenv("SERVER_HOST", os.getenv("MCP_HOST", _default_config.server_host)), port: int = os.getenv("SERVER_PORT", _default_config.server_port), workers: int = 1):
-        """Start Streamable HTTP transport mode with workers support"""
-        self.logger.info(f"Starting Doris MCP Server (Streamable HTTP mode) - {host}:{port}, workers: {workers}")
+    async def start_http(self, host: str = os.getenv("SERVER_HOST", os.getenv("MCP_HOST", _default_config.server_host)), port: int = os.getenv("SERVER_PORT", _default_config.server_port), workers: int = 1,
+                         worker_index: int | None = None, stats_dir: str | None = None):
+        """Start Streamable HTTP transport mode
+        
+        With ``worker_index`` set, this process is one worker of a WorkerSupervisor pool:
+        it binds its own SO_REUSEPORT socket, serves stateless sessions (any worker may
+        receive any request of a session) and publishes its stats to ``stats_dir``.
+        """
+        is_worker = worker_index is not None
+        self.logger.info(
+            f"Starting Doris MCP Server (Streamable HTTP mode) - {host}:{port}, "
+            + (f"worker {worker_index} (pid {os.getpid()})" if is_worker else f"workers: {workers}")
+        )
 
         try:
             # Initialize security manager first (includes JWT setup if enabled)  
@@ -543,14 +586,37 @@ class DorisServer:
             session_manager = StreamableHTTPSessionManager(
                 app=self.server,
                 json_response=True,  # Enable JSON response
-                stateless=False  # Maintain session state
+                stateless=is_worker  # Maintain session state unless sessions are spread over workers
             )
             
             self.logger.info(f"StreamableHTTP session manager created, will start at http://{host}:{port}")
             
             # Health check endpoint
             async def health_check(request):
-                return JSONResponse({"status": "healthy", "service": "doris-mcp-server"})
+                health = {"status": "healthy", "service": "doris-mcp-server"}
+                if is_worker:
+                    health["worker"] = worker_index
+                    health["pool"] = await asyncio.to_thread(read_pool_stats, stats_dir)
+                return JSONResponse(health)
+            
+            # Prometheus metrics of this server process (per worker with --workers)
+            metrics_path = self.config.monitoring.metrics_path
+            
+            async def metrics_endpoint(request):
+                # Same authentication as /mcp: tool names, pool state and process details are not public
+                try:
+                    auth_info = await self._extract_auth_info_from_scope(
+                        request.scope, dict(request.scope.get("headers", []))
+                    )
+                    await self.security_manager.authenticate_request(auth_info)
+                except Exception as auth_error:
+                    self.logger.warning(f"Metrics authentication failed: {auth_error}")
+                    return JSONResponse(
+                        {"error": "Authentication required", "message": str(auth_error)},
+                        status_code=401
+                    )
+                body, content_type = render_metrics()
+                return Response(body, media_type=content_type)
             
             # OAuth endpoints
             from .auth.oauth_handlers import OAuthHandlers
@@ -686,11 +752,7 @@ class DorisServer:
         
             async def index_page(request):
                 """Index page with login check"""
-                self.logger.info(f"index_page function called with request: {request}")
-                self.logger.info(f"Request path: {request.url.path}")
-                response = await index_handlers.handle_index_page(request)
-                self.logger.info(f"index_page returning response: {response}")
-                return response
+                return await index_handlers.handle_index_page(request)
             
             async def db_management_page(request):
                 """Connection pool management page"""
@@ -729,6 +791,7 @@ class DorisServer:
             async def lifespan(app: Starlette) -> AsyncIterator[None]:
                 """Context manager for managing application lifecycle"""
                 self.logger.info("Application started!")
+                self.tools_manager.monitoring_tools.start_collector()
                 try:
                     yield
                 finally:
@@ -786,11 +849,91 @@ class DorisServer:
                 Route("/db/recreate", db_recreate, methods=["POST"]),
                 Route("/db/session/{session_id}/release", db_release_session, methods=["POST"]),
                 Route("/db/connections", db_connections, methods=["GET"]),
+                # Server metrics endpoint
+                *([Route(metrics_path, metrics_endpoint, methods=["GET"])] if self.config.monitoring.enable_metrics else []),
             ],
             lifespan=lifespan,
             )
             
-            # Custom ASGI app that handles both /mcp and /mcp/ without redirects
+            async def handle_mcp_request(scope, receive, send):
+                """Authenticate an MCP request and hand it to the session manager"""
+                method = scope.get("method", "UNKNOWN")
+                headers = dict(scope.get("headers", []))
+                self.request_logger.debug("MCP request: %s %s", method, scope.get("path", ""))
+                
+                # Authentication check for MCP requests
+                try:
+                    auth_started = time.perf_counter()
+                    # Extract authentication information
+                    auth_info = await self._extract_auth_info_from_scope(scope, headers)
+
+                    # Authenticate the request
+                    auth_context = await self.security_manager.authenticate_request(auth_info)
+                    self.request_logger.debug(
+                        "MCP request authenticated: token_id=%s, client_ip=%s",
+                        auth_context.token_id, auth_context.client_ip
+                    )
+
+                    # Store auth context in scope; tool handlers read it back from the request
+                    scope["auth_context"] = auth_context
+                    # Authentication time, attached to the trace of a sampled tool call
+                    scope["auth_span"] = (auth_started, time.perf_counter())
+                    # FIX for Issue #62 Bug 1: expose auth_context to tools through the shared
+                    # context variable for token-bound database configuration
+                    set_auth_context(auth_context)
+
+                except Exception as auth_error:
+                    self.logger.error(f"MCP authentication failed: {auth_error}")
+                    # Return 401 Unauthorized
+                    from starlette.responses import JSONResponse
+                    response = JSONResponse(
+                        {"error": "Authentication required", "message": str(auth_error)},
+                        status_code=401
+                    )
+                    await response(scope, receive, send)
+                    return
+                
+                # Handle Dify compatibility for GET requests
+                if method == "GET":
+                    accept_header = headers.get(b'accept', b'').decode('utf-8')
+                    
+                    # For other GET requests, try to add application/json to Accept header
+                    if 'text/event-stream' in accept_header and 'application/json' not in accept_header:
+                        # Modify headers to include both content types
+                        new_headers = []
+                        for name, value in scope.get("headers", []):
+                            if name == b'accept':
+                                # Add application/json to the accept header
+                                new_value = value.decode('utf-8') + ', application/json'
+                                new_headers.append((name, new_value.encode('utf-8')))
+                            else:
+                                new_headers.append((name, value))
+                        # Update scope with modified headers
+                        scope = dict(scope)
+                        scope["headers"] = new_headers
+                        self.request_logger.debug("Modified Accept header to: %s", new_value)
+                
+                await session_manager.handle_request(scope, receive, send)
+            
+            # Routing table compiled once at startup: root, index, health check, auth, ui,
+            # token, cache, db, logs, config and static endpoints go to starlette_app;
+            # both /mcp and /mcp/ go to the session manager without redirects
+            router = (
+                PrefixRouter()
+                .add_exact(("/", "/index", "/index.html"), starlette_app)
+                .add_prefix(
+                    (
+                        "/health", "/auth/", "/ui/", "/token/", "/cache/", "/db/", "/logs/",
+                        "/config/", "/api/", "/static/", "/public/", "/metrics", "/favicon.ico",
+                        *({metrics_path} - {"/metrics"}),
+                    ),
+                    starlette_app,
+                )
+                .add_exact(("/mcp",), handle_mcp_request)
+                .add_prefix(("/mcp/",), handle_mcp_request)
+            )
+            
+            # Custom ASGI app that dispatches through the routing table
             async def mcp_app(scope, receive, send):
                 # Handle lifespan events
                 if scope["type"] == "lifespan":
@@ -800,106 +943,16 @@ class DorisServer:
                 # Handle HTTP requests
                 if scope["type"] == "http":
                     path = scope.get("path", "")
-                    self.logger.info(f"Received request for path: '{path}'")
+                    self.request_counters["http_requests"] += 1
                     
                     try:
-                        # Debug: Check if path matches root
-                        is_root = path == "/"
-                        is_index = path == "/index" or path == "/index.html"
-                        is_health = path.startswith("/health")
-                        self.logger.info(f"Debug: path='{path}', is_root={is_root}, is_index={is_index}, is_health={is_health}")
-                        
-                        # Handle root, index, health check, auth, ui, token management, and cache management endpoints  
-                        if (is_root or 
-                            is_index or
-                            is_health or 
-                            path.startswith("/auth/") or 
-                            path.startswith("/ui/") or
-                            path.startswith("/token/") or
-                            path.startswith("/cache/") or
-                            path.startswith("/db/") or
-                            path.startswith("/logs/") or
-                            path.startswith("/config/") or
-                            path.startswith("/api/") or
-                            path.startswith("/static/") or
-                            path.startswith("/public/") or
-                            path.startswith("/metrics") or
-                            path.startswith("/favicon.ico")):
-                            self.logger.info(f"Routing path '{path}' to starlette_app")
-                            await starlette_app(scope, receive, send)
-                            return
-                        
-                        # Handle MCP requests - both /mcp and /mcp/ go to session manager
-                        if path == "/mcp" or path.startswith("/mcp/"):
-                            self.logger.info(f"Handling MCP request for path: {path}")
-                            # Log request details for debugging
-                            method = scope.get("method", "UNKNOWN")
-                            headers = dict(scope.get("headers", []))
-                            self.logger.info(f"MCP Request - Method: {method}")
-                            self.logger.info(f"MCP Request - Headers: {headers}")
-                            
-                            # Authentication check for MCP requests
-                            try:
-                                # Extract authentication information
-                                auth_info = await self._extract_auth_info_from_scope(scope, headers)
-
-                                # Authenticate the request
-                                auth_context = await self.security_manager.authenticate_request(auth_info)
-                                self.logger.info(f"MCP request authenticated: token_id={auth_context.token_id}, client_ip={auth_context.client_ip}")
-
-                                # Store auth context in scope for potential use by tools/resources
-                                scope["auth_context"] = auth_context
-
-                                # FIX for Issue #62 Bug 1: Set auth_context in context variable
-                                # This allows tools to access token information for token-bound database configuration
-                                try:
-                                    from contextvars import ContextVar
-                                    auth_context_var: ContextVar = ContextVar('mcp_auth_context', default=None)
-                                    auth_context_var.set(auth_context)
-                                    self.logger.debug(f"Set auth_context in context variable with token: {bool(hasattr(auth_context, 'token') and auth_context.token)}")
-                                except Exception as ctx_error:
-                                    self.logger.warning(f"Failed to set auth_context in context variable: {ctx_error}")
-
-                            except Exception as auth_error:
-                                self.logger.error(f"MCP authentication failed: {auth_error}")
-                                # Return 401 Unauthorized
-                                from starlette.responses import JSONResponse
-                                response = JSONResponse(
-                                    {"error": "Authentication required", "message": str(auth_error)},
-                                    status_code=401
-                                )
-                                await response(scope, receive, send)
-                                return
-                            
-                            # Handle Dify compatibility for GET requests
-                            if method == "GET":
-                                accept_header = headers.get(b'accept', b'').decode('utf-8')
-                                user_agent = headers.get(b'user-agent', b'').decode('utf-8')
-                                
-
-                                
-                                # For other GET requests, try to add application/json to Accept header
-                                if 'text/event-stream' in accept_header and 'application/json' not in accept_header:
-                                    self.logger.info("Adding application/json to Accept header for GET request")
-                                    # Modify headers to include both content types
-                                    new_headers = []
-                                    for name, value in scope.get("headers", []):
-                                        if name == b'accept':
-                                            # Add application/json to the accept header
-                                            new_value = value.decode('utf-8') + ', application/json'
-                                            new_headers.append((name, new_value.encode('utf-8')))
-                                        else:
-                                            new_headers.append((name, value))
-                                    # Update scope with modified headers
-                                    scope = dict(scope)
-                                    scope["headers"] = new_headers
-                                    self.logger.info(f"Modified Accept header to: {new_value}")
-                            
-                            await session_manager.handle_request(scope, receive, send)
+                        handler = router.resolve(path)
+                        if handler is not None:
+                            await handler(scope, receive, send)
                             return
                         
                         # 404 for other paths
-                        self.logger.info(f"Path not found: {path}")
+                        self.request_logger.info("Path not found: %s", path)
                         response = Response("Not Found", status_code=404)
                         await response(scope, receive, send)
                     except Exception as e:
@@ -913,8 +966,6 @@ class DorisServer:
                     self.logger.warning(f"Unsupported scope type: {scope['type']}")
                     return
             
-            self.logger.info("Using single-process mode")
-            # Single worker mode, use original logic with session manager lifecycle
             config = uvicorn.Config(
                 app=mcp_app,
                 host=host,
@@ -925,10 +976,23 @@ class DorisServer:
             )
             server = uvicorn.Server(config)
             
+            if is_worker:
+                # Every worker binds the address itself; the kernel balances connections
+                sockets = [create_reuseport_socket(host, int(port))]
+                stats_task = asyncio.create_task(self._publish_worker_stats(worker_index, stats_dir))
+            else:
+                self.logger.info("Using single-process mode")
+                sockets = None
+                stats_task = None
+            
             # Run session manager and server together
-            async with session_manager.run():
-                self.logger.info("Session manager started, now starting HTTP server")
-                await server.serve()
+            try:
+                async with session_manager.run():
+                    self.logger.info("Session manager started, now starting HTTP server")
+                    await server.serve(sockets=sockets)
+            finally:
+                if stats_task is not None:
+                    stats_task.cancel()
 
         except Exception as e:
             self.logger.error(f"Streamable HTTP server startup failed: {e}")
@@ -945,6 +1009,23 @@ class DorisServer:
 
 
 
+    def get_worker_stats(self) -> dict[str, Any]:
+        """Stats snapshot published by this process in multi-worker mode"""
+        latency = self.tools_manager.get_tool_latency_stats()
+        counters = dict(self.request_counters)
+        counters["tool_calls"] = sum(stats["count"] for stats in latency.values())
+        counters["tool_errors"] = sum(stats["errors"] for stats in latency.values())
+        return {"counters": counters, "tool_latency": latency}
+
+    async def _publish_worker_stats(self, worker_index: int, stats_dir: str, interval: float = 5.0):
+        """Periodically publish this worker's stats for the pool-wide /health view"""
+        while True:
+            try:
+                await asyncio.to_thread(write_worker_stats, stats_dir, worker_index, self.get_worker_stats())
+            except OSError as e:
+                self.logger.warning(f"Failed to publish worker stats: {e}")
+            await asyncio.sleep(interval)
+
     async def shutdown(self):
         """Shutdown server"""
         self.logger.info("Shutting down Doris MCP Server")
@@ -958,6 +1039,12 @@ class DorisServer:
             MCPCallStats.save_stats()
             self.logger.info("MCP call stats saved successfully")
 
+            if self._prefetch_task and not self._prefetch_task.done():
+                self._prefetch_task.cancel()
+
+            await self.tools_manager.close()
+            await close_http_session()
+
             await self.connection_manager.close()
             self.logger.info("Connection manager shutdown completed")
             
@@ -1094,6 +1181,97 @@ def update_configuration(config: DorisConfig):
         config.workers = args.workers
 
 
+def _run_http_worker(config: DorisConfig, worker_index: int, stats_dir: str):
+    """Entry point of a worker process in multi-worker HTTP mode"""
+    asyncio.run(_serve_http_worker(config, worker_index, stats_dir))
+
+
+async def _serve_http_worker(config: DorisConfig, worker_index: int, stats_dir: str):
+    """Serve HTTP requests as one worker of the pool"""
+    from .utils.config import ConfigManager
+    from .utils.logger import shutdown_logging
+    ConfigManager(config).setup_logging()
+
+    server = DorisServer(config)
+    try:
+        await server.start_http(
+            config.server_host, config.server_port, worker_index=worker_index, stats_dir=stats_dir
+        )
+    finally:
+        try:
+            await server.shutdown()
+        finally:
+            shutdown_logging()
+
+
+def worker_pool_conflicts(config: DorisConfig) -> list[str]:
+    """Settings that keep state in each worker's memory and so break with several workers
+
+    SO_REUSEPORT hands every connection to an arbitrary worker, so a login session,
+    OAuth state or generated JWT key held by one worker is unknown to the others.
+    """
+    security = config.security
+    conflicts = []
+    if security.enable_basic_auth:
+        conflicts.append("ENABLE_BASIC_AUTH: admin UI login sessions are kept per worker")
+    if security.enable_oauth_auth or security.oauth_enabled:
+        conflicts.append("ENABLE_OAUTH_AUTH: OAuth state is kept per worker")
+    if security.enable_jwt_auth:
+        if security.jwt_algorithm == "HS256":
+            key_configured = bool(security.jwt_secret_key)
+        else:
+            key_configured = (
+                bool(security.jwt_private_key_path and security.jwt_public_key_path)
+                and os.path.exists(security.jwt_private_key_path)
+                and os.path.exists(security.jwt_public_key_path)
+            ) or bool(os.getenv("JWT_PRIVATE_KEY") and os.getenv("JWT_PUBLIC_KEY"))
+        if not key_configured:
+            conflicts.append(
+                "ENABLE_JWT_AUTH: each worker would generate its own JWT key, "
+                "set JWT_PRIVATE_KEY_PATH and JWT_PUBLIC_KEY_PATH"
+            )
+        if security.key_rotation_interval > 0:
+            conflicts.append("KEY_ROTATION_INTERVAL: each worker would rotate to its own JWT key, set it to 0")
+    return conflicts
+
+
+def run_http_workers(config: DorisConfig, workers: int) -> int:
+    """Serve HTTP mode with ``workers`` supervised worker processes"""
+    from .utils.logger import get_logger
+    logger = get_logger(__name__)
+
+    conflicts = worker_pool_conflicts(config)
+    if conflicts:
+        for conflict in conflicts:
+            logger.error(f"Cannot start {workers} workers: {conflict}")
+        logger.error("Disable these settings or start the server with --workers 1")
+        return 1
+
+    # Rate limits must hold across the pool, not per worker
+    if "RATE_LIMIT_BACKEND" not in os.environ:
+        config.security.rate_limit_backend = "shared"
+
+    # State shared by the pool defaults to a directory owned by this supervisor, so
+    # other server instances on the host never share it
+    import tempfile
+    run_dir = tempfile.mkdtemp(prefix="doris_mcp_workers_")
+    if config.security.rate_limit_backend == "shared" and not config.security.rate_limit_shared_path:
+        config.security.rate_limit_shared_path = os.path.join(run_dir, "rate_limit.bin")
+    # Continuation cursors are resolved by whichever worker receives the next request,
+    # so the result spool lives in one directory shared by the pool
+    if not config.performance.result_spool_dir:
+        config.performance.result_spool_dir = os.path.join(run_dir, "spool")
+        os.mkdir(config.performance.result_spool_dir)
+
+    logger.info(f"Starting {workers} HTTP worker processes on {config.server_host}:{config.server_port}")
+    supervisor = WorkerSupervisor(workers, _run_http_worker, args=(config,))
+    try:
+        return supervisor.run()
+    finally:
+        import shutil
+        shutil.rmtree(run_dir, ignore_errors=True)
+
+
 async def main():
     """Main function"""
     # Create configuration - priority: command line arguments > env variables > .env file > default values
@@ -1119,6 +1297,24 @@ async def main():
     logger.info(f"Transport: {config.transport}")
     logger.info(f"Log Level: {config.logging.level}")
 
+    if config.transport == "http":
+        # Get workers configuration with auto-detection support
+        workers = getattr(config, 'workers', 1)
+        if workers == 0:
+            import multiprocessing
+            workers = multiprocessing.cpu_count()
+            logger.info(f"Auto-detected {workers} CPU cores for worker processes")
+        
+        if workers > 1:
+            if REUSE_PORT_SUPPORTED:
+                # The supervisor owns this process; workers build their own servers
+                exit_code = run_http_workers(config, workers)
+                from .utils.logger import shutdown_logging
+                shutdown_logging()
+                return exit_code
+            logger.warning("SO_REUSEPORT is not supported on this platform, falling back to a single process")
+            workers = 1
+
     # Create server instance
     server = DorisServer(config)
 
@@ -1126,13 +1322,6 @@ async def main():
         if config.transport == "stdio":
             await server.start_stdio()
         elif config.transport == "http":
-            # Get workers configuration with auto-detection support
-            workers = getattr(config, 'workers', 1)
-            if workers == 0:
-                import multiprocessing
-                workers = multiprocessing.cpu_count()
-                logger.info(f"Auto-detected {workers} CPU cores for worker processes")
-            
             await server.start_http(config.server_host, config.server_port, workers)
         else:
             logger.error(f"Unsupported transport protocol: {config.transport}")
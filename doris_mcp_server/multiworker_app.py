@@ -21,6 +21,10 @@ Multi-worker application module for doris-mcp-server
 This module provides full MCP functionality with multi-worker support.
 Each worker process creates its own MCP server and session manager using the same
 robust architecture as the single-worker mode.
+
+Deprecated: start the server with ``--transport http --workers N`` instead. That mode
+supervises SO_REUSEPORT workers running the complete DorisServer, including the
+cache, db, logs and config management routes missing here.
 """
 
 import os
@@ -217,6 +221,7 @@ from starlette.responses import JSONResponse, Response
 from .tools.tools_manager import DorisToolsManager
 from .tools.prompts_manager import DorisPromptsManager
 from .tools.resources_manager import DorisResourcesManager
+from .utils.asgi_router import PrefixRouter
 from .utils.config import DorisConfig
 from .utils.db import DorisConnectionManager
 from .utils.security import DorisSecurityManager
@@ -266,13 +271,24 @@ async def initialize_worker():
     
     try:
         # Import logger properly
-        from .utils.logger import get_logger
+        from .utils.logger import get_hot_path_logger, get_logger
         logger = get_logger(__name__)
+        request_logger = get_hot_path_logger(__name__)
         
         logger.info(f"Initializing MCP worker process {os.getpid()}")
+        logger.warning("multiworker_app is deprecated, start the server with --transport http --workers N instead")
         
         # Create configuration
         config = DorisConfig.from_env()
+        if "RATE_LIMIT_BACKEND" not in os.environ:
+            # Per-user limits must hold across all workers, not per process
+            config.security.rate_limit_backend = "shared"
+        if config.security.rate_limit_backend == "shared" and not config.security.rate_limit_shared_path:
+            # Workers of this app share a table scoped to its port
+            import tempfile
+            config.security.rate_limit_shared_path = os.path.join(
+                tempfile.gettempdir(), f"doris_mcp_rate_limit_{config.server_port}.bin"
+            )
         
         # Initialize enhanced logging system
         from .utils.config import ConfigManager
@@ -335,9 +351,8 @@ async def initialize_worker():
         async def handle_list_tools() -> list[Tool]:
             """Handle tool list request"""
             try:
-                logger.info("Handling tool list request in worker")
                 tools = await tools_manager.list_tools()
-                logger.info(f"Returning {len(tools)} tools from worker")
+                request_logger.debug("Returning %d tools from worker", len(tools))
                 return tools
             except Exception as e:
                 logger.error(f"Failed to handle tool list request in worker: {e}")
@@ -347,7 +362,7 @@ async def initialize_worker():
         async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             """Handle tool call request"""
             try:
-                logger.info(f"Handling tool call request in worker: {name}")
+                request_logger.debug("Handling tool call request in worker: %s", name)
                 result = await tools_manager.call_tool(name, arguments)
                 return [TextContent(type="text", text=result)]
             except Exception as e:
@@ -614,14 +629,15 @@ basic_app = Starlette(
     lifespan=lifespan
 )
 
+# MCP requests go to the session manager, everything else to the basic Starlette app
+# (includes auth endpoints)
+_router = (
+    PrefixRouter(default=basic_app)
+    .add_exact(("/mcp",), mcp_asgi_app)
+    .add_prefix(("/mcp/",), mcp_asgi_app)
+)
+
 # Create main ASGI app that routes between basic app and MCP
 async def app(scope, receive, send):
     """Main ASGI app that routes requests"""
-    path = scope.get('path', '/')
-    
-    if path == "/mcp" or path.startswith('/mcp/'):
-        # Handle MCP requests with session manager
-        await mcp_asgi_app(scope, receive, send)
-    else:
-        # Handle other requests with basic Starlette app (includes auth endpoints)
-        await basic_app(scope, receive, send)
+    await _router.resolve(scope.get('path', '/'))(scope, receive, send)
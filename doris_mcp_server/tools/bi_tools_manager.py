@@ -4,7 +4,6 @@ Apache Doris MCP Tools Manager
 Responsible for tool registration, management, scheduling and routing, does not contain specific business logic implementation
 """
 
-import json
 import time
 from datetime import datetime
 from typing import Any, Dict, List
@@ -15,12 +14,17 @@ from ..utils.db import DorisConnectionManager
 from ..utils.query_executor import DorisQueryExecutor
 from ..utils.monitoring_tools import DorisMonitoringTools
 from ..utils.bi_schema_extractor import MetadataExtractor
-from ..utils.logger import get_logger, get_mcp_logger
+from ..utils.logger import get_hot_path_logger, get_logger, get_mcp_logger
 from ..utils.mcp_call_stats import MCPCallStats
+from ..utils.response_budget import ResponseBudgeter
+from ..utils.response_encoder import ResponseEncoder
+from ..utils.tracing import Tracer, span
 from .artifact_instructions import ArtifactInstructionsTool
+from .tool_registry import METADATA_CLASS, QUERY_CLASS, ToolRegistry
 
 logger = get_logger(__name__)
-mcp_logger = get_mcp_logger()
+# Tool calls are logged on every request, so the MCP log is sampled and rate limited
+mcp_logger = get_hot_path_logger(get_mcp_logger().name)
 
 
 
@@ -35,16 +39,37 @@ class DorisToolsManager:
         self.metadata_extractor = MetadataExtractor(connection_manager=connection_manager, cache_manager=cache_manager)
         self.monitoring_tools = DorisMonitoringTools(connection_manager)
         self.artifact_instructions_tool = ArtifactInstructionsTool()
+        # Single-pass JSON encoder for tool results
+        self.response_encoder = ResponseEncoder.from_config(connection_manager.config)
+        # Enforces max_response_content_size on exec_query results with continuation cursors
+        self.response_budgeter = ResponseBudgeter.from_config(connection_manager.config, self.response_encoder)
+        # Samples tool calls for the per-stage timing breakdown
+        self.tracer = Tracer.from_config(connection_manager.config)
+        # Tool definitions and handlers are resolved once; dispatch is a dictionary lookup
+        self._tool_registry = ToolRegistry.from_config(connection_manager.config)
+        for tool in self._build_tool_definitions():
+            self._tool_registry.register(
+                tool.name,
+                getattr(self, f"_{tool.name}_tool"),
+                definition=tool,
+                concurrency_class=QUERY_CLASS if tool.name == "exec_query" else METADATA_CLASS,
+            )
  
 
     async def list_tools(self, mcp_session_id: str = None) -> List[Tool]:
         """List all available query tools (for stdio mode)"""
-        # Log MCP tool call
-        mcp_logger.info(f"Tool called: list_tools, Arguments: {{}}, MCP Session ID: {mcp_session_id}")
-        
-        # Increment call count
-        MCPCallStats.increment_call_count("list_tools")
-        
+        return self._tool_registry.list_tools()
+    
+    async def close(self):
+        """Stop background work owned by the tools"""
+        await self.monitoring_tools.close()
+    
+    def get_tool_latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-tool latency histograms"""
+        return self._tool_registry.get_latency_stats()
+    
+    def _build_tool_definitions(self) -> List[Tool]:
+        """Build the Tool definitions served by list_tools"""
         # Get ADBC configuration defaults
         adbc_config = self.connection_manager.config.adbc
         
@@ -55,11 +80,15 @@ class DorisToolsManager:
 
 [Parameter Content]:
 
-- sql (string) [Required] - SQL statement to execute. MUST use three-part naming for all table references: 'catalog_name.db_name.table_name'. For internal tables use 'internal.db_name.table_name', for external tables use 'catalog_name.db_name.table_name'
+- sql (string) [Required unless cursor is given] - SQL statement to execute. MUST use three-part naming for all table references: 'catalog_name.db_name.table_name'. For internal tables use 'internal.db_name.table_name', for external tables use 'catalog_name.db_name.table_name'
 
 - max_rows (integer) [Optional] - Maximum number of rows to return, default 100
 
 - timeout (integer) [Optional] - Query timeout in seconds, default 30
+
+- format (string) [Optional] - Result layout: 'rows' (list of row objects, default), 'columns' (column names once plus value arrays), 'csv' or 'markdown_table'. Prefer 'columns' or 'csv' for large results to save tokens
+
+- cursor (string) [Optional] - Continuation cursor from a previous response with truncated=true. The next page is served from the server-side result spool without running the query again
 """,
                 inputSchema={
                     "type": "object",
@@ -67,8 +96,16 @@ class DorisToolsManager:
                         "sql": {"type": "string", "description": "SQL statement to execute, must use three-part naming"},
                         "max_rows": {"type": "integer", "description": "Maximum number of rows to return", "default": 100},
                         "timeout": {"type": "integer", "description": "Timeout in seconds", "default": 30},
+                        "format": {
+                            "type": "string",
+                            "enum": ["rows", "columns", "csv", "markdown_table"],
+                            "description": "Result layout",
+                            "default": "rows",
+                        },
+                        "cursor": {"type": "string", "description": "Continuation cursor (next_cursor) from a truncated response"},
                     },
-                    "required": ["sql"],
+                    # A cursor-only call fetches the next page, so either sql or cursor is required
+                    "anyOf": [{"required": ["sql"]}, {"required": ["cursor"]}],
                 },
             ),
             Tool(
@@ -110,26 +147,18 @@ class DorisToolsManager:
         """
         Call the specified query tool (tool routing and scheduling center)
         """
+        trace = self.tracer.start(name)
         try:
             start_time = time.time()
             
             # Log MCP tool call
-            mcp_logger.info(f"Tool called: {name}, Arguments: {arguments}, MCP Session ID: {mcp_session_id}")
+            mcp_logger.info("Tool called: %s, Arguments: %s, MCP Session ID: %s", name, arguments, mcp_session_id)
             
             # Increment call count
             MCPCallStats.increment_call_count(name)
             
             # Tool routing - dispatch requests to corresponding business logic processors
-            if name == "exec_query":
-                result = await self._exec_query_tool(arguments)
-            elif name == "get_table_schema":
-                result = await self._get_table_schema_tool(arguments)
-            elif name == "get_db_table_list":
-                result = await self._get_db_table_list_tool(arguments)
-            elif name == "get_artifact_instructions":
-                result = await self._get_artifact_instructions_tool(arguments)
-            else:
-                raise ValueError(f"Unknown tool: {name}")
+            result = await self._tool_registry.call(name, arguments)
             if name != "get_artifact_instructions":
                 execution_time = time.time() - start_time
                 
@@ -141,7 +170,16 @@ class DorisToolsManager:
                         "timestamp": datetime.now().isoformat(),
                     }
             
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            if name == "exec_query":
+                with span("response_budget"):
+                    result = await self.response_budgeter.apply(result)
+            
+            if trace is not None and isinstance(result, dict) and "_execution_info" in result:
+                # JSON encoding comes after this point; it is reported by the trace exporter only
+                result["_execution_info"] = dict(result["_execution_info"], stages_ms=trace.breakdown())
+            
+            with span("json_encode"):
+                return self.response_encoder.encode(result)
             
         except Exception as e:
             logger.error(f"Tool call failed {name}: {str(e)}")
@@ -151,18 +189,33 @@ class DorisToolsManager:
                 "arguments": arguments,
                 "timestamp": datetime.now().isoformat(),
             }
-            return json.dumps(error_result, ensure_ascii=False, indent=2)
+            return self.response_encoder.encode(error_result)
+        finally:
+            if trace is not None:
+                self.tracer.finish(trace)
     
     
     async def _exec_query_tool(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """SQL query execution tool routing (supports federation queries)"""
+        if arguments.get("cursor"):
+            # Next page of a truncated result, served from the result spool
+            return await self.response_budgeter.fetch_page(arguments["cursor"])
+        
         sql = arguments.get("sql")
+        if not sql:
+            return {
+                "success": False,
+                "error": "Either sql or cursor is required",
+                "error_type": "invalid_arguments",
+                "data": None,
+            }
         max_rows = arguments.get("max_rows", 100)
         timeout = arguments.get("timeout", 30)
+        result_format = arguments.get("format", "rows")
         
         # Delegate to metadata extractor for processing
         return await self.metadata_extractor.exec_query_for_mcp(
-            sql, max_rows, timeout
+            sql, max_rows, timeout, result_format
         )
     
     async def _get_table_schema_tool(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
@@ -26,8 +26,11 @@ from typing import Any
 from mcp.types import Resource
 
 from ..utils.db import DorisConnectionManager
+from ..utils.logger import get_logger
 from ..utils.sql_security_utils import get_auth_context
 
+logger = get_logger(__name__)
+
 
 class TableMetadata:
     """Data table metadata"""
@@ -127,6 +130,15 @@ class DorisResourcesManager:
 
         return resources
 
+    async def prefetch_metadata(self) -> None:
+        """Populate the metadata cache ahead of the first resource request"""
+        try:
+            await self._get_table_metadata()
+            await self._get_view_metadata()
+        except Exception as e:
+            # stdout carries the stdio transport, so this must go through logging
+            logger.warning(f"Failed to prefetch resource metadata: {e}")
+
     async def read_resource(self, uri: str) -> str:
         """Read detailed information of specific resource"""
         try:
@@ -0,0 +1,198 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+MCP Tool Registry
+
+Declarative tool registry built once at startup. Each tool name maps to its
+handler, precomputed Tool definition, timeout and concurrency class, so
+tools/list returns a cached list and dispatch is a single dictionary lookup.
+Every call is recorded in a per-tool latency histogram.
+"""
+
+import asyncio
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from mcp.types import Tool
+
+ToolHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+# Upper bounds in seconds of the latency histogram buckets (a final +Inf bucket follows)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Concurrency classes: query and analytics tools run statements on Doris and are
+# bounded; metadata and monitoring lookups are not
+QUERY_CLASS = "query"
+ANALYTICS_CLASS = "analytics"
+METADATA_CLASS = "metadata"
+
+# Seconds added to a per-call ``timeout`` argument (exec_query, exec_adbc_query) so the
+# class timeout never fires before the query's own timeout and its result handling
+TIMEOUT_ARGUMENT_MARGIN = 10.0
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram"""
+
+    __slots__ = ("bucket_counts", "count", "total", "errors")
+
+    def __init__(self):
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.errors = 0
+
+    def observe(self, seconds: float, failed: bool = False):
+        self.bucket_counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if failed:
+            self.errors += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return cumulative bucket counts in Prometheus style"""
+        buckets = {}
+        cumulative = 0
+        for bound, bucket_count in zip(LATENCY_BUCKETS, self.bucket_counts):
+            cumulative += bucket_count
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = self.count
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "errors": self.errors,
+            "buckets": buckets,
+        }
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """Registered tool"""
+
+    name: str
+    handler: ToolHandler
+    definition: Optional[Tool] = None  # None for unlisted aliases of deprecated names
+    timeout: Optional[float] = None
+    concurrency_class: str = METADATA_CLASS
+
+
+class ToolRegistry:
+    """Name-indexed tool registry with cached definitions and latency tracking"""
+
+    def __init__(
+        self,
+        concurrency_limits: Optional[Dict[str, int]] = None,
+        class_timeouts: Optional[Dict[str, float]] = None,
+    ):
+        self._specs: Dict[str, ToolSpec] = {}
+        self._definitions: Tuple[Tool, ...] = ()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._class_timeouts = dict(class_timeouts or {})
+        self._semaphores = {
+            concurrency_class: asyncio.Semaphore(limit)
+            for concurrency_class, limit in (concurrency_limits or {}).items()
+            if limit and limit > 0
+        }
+
+    @classmethod
+    def from_config(cls, config) -> "ToolRegistry":
+        """Create a registry with concurrency limits and timeouts from ``config.performance``"""
+        max_queries = config.performance.max_concurrent_queries
+        query_timeout = config.performance.query_timeout
+        return cls(
+            concurrency_limits={
+                QUERY_CLASS: max_queries,
+                # Analytics tools issue several scans per call
+                ANALYTICS_CLASS: max(1, max_queries // 4),
+            },
+            class_timeouts={QUERY_CLASS: query_timeout, ANALYTICS_CLASS: query_timeout},
+        )
+
+    def register(
+        self,
+        name: str,
+        handler: ToolHandler,
+        definition: Optional[Tool] = None,
+        concurrency_class: str = METADATA_CLASS,
+        timeout: Optional[float] = None,
+    ):
+        """Register a tool; ``timeout`` defaults to the concurrency class timeout"""
+        if timeout is None:
+            timeout = self._class_timeouts.get(concurrency_class)
+        self._specs[name] = ToolSpec(
+            name=name,
+            handler=handler,
+            definition=definition,
+            timeout=timeout,
+            concurrency_class=concurrency_class,
+        )
+        self._histograms.setdefault(name, LatencyHistogram())
+        self._definitions = tuple(spec.definition for spec in self._specs.values() if spec.definition)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    def get_spec(self, name: str) -> Optional[ToolSpec]:
+        return self._specs.get(name)
+
+    def list_tools(self) -> List[Tool]:
+        """Return the tool definitions (a copy of the cached tuple)"""
+        return list(self._definitions)
+
+    async def call(self, name: str, arguments: Dict[str, Any]) -> Any:
+        """Dispatch a tool call and record its latency"""
+        spec = self._specs.get(name)
+        if spec is None:
+            raise ValueError(f"Unknown tool: {name}")
+
+        start = time.perf_counter()
+        failed = True
+        try:
+            semaphore = self._semaphores.get(spec.concurrency_class)
+            if semaphore is None:
+                result = await self._run(spec, arguments)
+            else:
+                async with semaphore:
+                    result = await self._run(spec, arguments)
+            failed = False
+            return result
+        finally:
+            self._histograms[name].observe(time.perf_counter() - start, failed)
+
+    @staticmethod
+    async def _run(spec: ToolSpec, arguments: Dict[str, Any]) -> Any:
+        if spec.timeout is None:
+            return await spec.handler(arguments)
+        timeout = spec.timeout
+        requested = arguments.get("timeout")
+        # A longer timeout requested by the caller extends the class timeout instead of being capped by it
+        if isinstance(requested, (int, float)) and not isinstance(requested, bool) and requested > 0:
+            timeout = max(timeout, requested + TIMEOUT_ARGUMENT_MARGIN)
+        try:
+            return await asyncio.wait_for(spec.handler(arguments), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Tool '{spec.name}' timed out after {timeout} seconds") from None
+
+    def get_latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Latency histograms of every tool that has been called"""
+        return {
+            name: histogram.snapshot()
+            for name, histogram in self._histograms.items()
+            if histogram.count
+        }
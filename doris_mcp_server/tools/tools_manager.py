@@ -19,9 +19,9 @@ Apache Doris MCP Tools Manager
 Responsible for tool registration, management, scheduling and routing, does not contain specific business logic implementation
 """
 
-import json
 import time
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Dict, List
 
 from mcp.types import Tool
@@ -31,18 +31,39 @@ from ..utils.query_executor import DorisQueryExecutor
 from ..utils.analysis_tools import TableAnalyzer, SQLAnalyzer, MemoryTracker
 from ..utils.monitoring_tools import DorisMonitoringTools
 from ..utils.schema_extractor import MetadataExtractor
-from ..utils.data_governance_tools import DataGovernanceTools
-from ..utils.data_exploration_tools import DataExplorationTools
-from ..utils.data_quality_tools import DataQualityTools
-from ..utils.security_analytics_tools import SecurityAnalyticsTools
-from ..utils.dependency_analysis_tools import DependencyAnalysisTools
-from ..utils.performance_analytics_tools import PerformanceAnalyticsTools
-from ..utils.adbc_query_tools import DorisADBCQueryTools
-from ..utils.logger import get_logger, get_mcp_logger
+from ..utils.logger import get_hot_path_logger, get_logger, get_mcp_logger
+from ..utils.response_budget import ResponseBudgeter
+from ..utils.response_encoder import ResponseEncoder
+from ..utils.tracing import Tracer, span
+from .tool_registry import ANALYTICS_CLASS, METADATA_CLASS, QUERY_CLASS, ToolRegistry
 
 logger = get_logger(__name__)
-mcp_logger = get_mcp_logger()
-
+# Tool calls are logged on every request, so the MCP log is sampled and rate limited
+mcp_logger = get_hot_path_logger(get_mcp_logger().name)
+
+# Tools that execute user SQL or query profiles on Doris
+QUERY_TOOLS = frozenset({"exec_query", "exec_adbc_query", "get_sql_explain", "get_sql_profile"})
+
+# Tools that run several scans over a table per call
+ANALYTICS_TOOLS = frozenset({
+    "get_table_basic_info",
+    "analyze_columns",
+    "analyze_table_storage",
+    "trace_column_lineage",
+    "monitor_data_freshness",
+    "analyze_data_access_patterns",
+    "analyze_data_flow_dependencies",
+    "analyze_slow_queries_topn",
+    "analyze_resource_growth_curves",
+})
+
+# Deprecated tool names, still dispatched but not listed
+LEGACY_TOOLS = (
+    "get_monitoring_metrics_info",
+    "get_monitoring_metrics_data",
+    "get_realtime_memory_stats",
+    "get_historical_memory_stats",
+)
 
 
 class DorisToolsManager:
@@ -57,18 +78,19 @@ class DorisToolsManager:
         self.sql_analyzer = SQLAnalyzer(connection_manager)
         self.metadata_extractor = MetadataExtractor(connection_manager=connection_manager)
         self.monitoring_tools = DorisMonitoringTools(connection_manager)
-        self.memory_tracker = MemoryTracker(connection_manager)
+        self.memory_tracker = MemoryTracker(connection_manager, collector=self.monitoring_tools.collector)
+        
+        # v0.5.0 advanced analytics tools and ADBC query tools are created on first use
         
-        # Initialize v0.5.0 advanced analytics tools
-        self.data_governance_tools = DataGovernanceTools(connection_manager)
-        self.data_exploration_tools = DataExplorationTools(connection_manager)
-        self.data_quality_tools = DataQualityTools(connection_manager, connection_manager.config)
-        self.security_analytics_tools = SecurityAnalyticsTools(connection_manager)
-        self.dependency_analysis_tools = DependencyAnalysisTools(connection_manager)
-        self.performance_analytics_tools = PerformanceAnalyticsTools(connection_manager)
+        # Single-pass JSON encoder for tool results
+        self.response_encoder = ResponseEncoder.from_config(connection_manager.config)
+        # Enforces max_response_content_size on exec_query results with continuation cursors
+        self.response_budgeter = ResponseBudgeter.from_config(connection_manager.config, self.response_encoder)
+        # Samples tool calls for the per-stage timing breakdown
+        self.tracer = Tracer.from_config(connection_manager.config)
         
-        # Initialize ADBC query tools
-        self.adbc_query_tools = DorisADBCQueryTools(connection_manager)
+        # Tool definitions and handlers are resolved once; dispatch is a dictionary lookup
+        self._tool_registry = self._build_tool_registry()
         
         logger.info("DorisToolsManager initialized with business logic processors, v0.5.0 analytics tools, and ADBC query tools")
     
@@ -434,8 +456,9 @@ class DorisToolsManager:
   * "compaction": Compaction-related memory trackers
   * "all": All memory tracker types
 
-- tracker_names (array) [Optional] - List of specific tracker names for historical data
-  * Example: ["process_resident_memory", "global", "query", "load", "compaction"]
+- tracker_names (array) [Optional] - BE memory metrics for historical data, default is "allocated_bytes"
+  * Example: ["allocated_bytes", "jemalloc_resident_bytes", "doris_be_memory_jemalloc_active_bytes"]
+  * Historical data requires the background metrics collector (METRICS_COLLECTOR_ENABLED=true)
 
 - time_range (string) [Optional] - Time range for historical data, default is "1h"
   * "1h": Last 1 hour
@@ -770,8 +793,82 @@ No parameters required. Returns connection status, configuration, and diagnostic
 
         logger.info("Successfully registered 25 tools to MCP server (14 basic + 9 advanced analytics + 2 ADBC tools)")
 
+    # v0.5.0 advanced analytics tools, imported and created on first use to keep startup fast
+    @cached_property
+    def data_governance_tools(self):
+        from ..utils.data_governance_tools import DataGovernanceTools
+        return DataGovernanceTools(self.connection_manager)
+    
+    @cached_property
+    def data_exploration_tools(self):
+        from ..utils.data_exploration_tools import DataExplorationTools
+        return DataExplorationTools(self.connection_manager)
+    
+    @cached_property
+    def data_quality_tools(self):
+        from ..utils.data_quality_tools import DataQualityTools
+        return DataQualityTools(self.connection_manager, self.connection_manager.config)
+    
+    @cached_property
+    def security_analytics_tools(self):
+        from ..utils.security_analytics_tools import SecurityAnalyticsTools
+        return SecurityAnalyticsTools(self.connection_manager)
+    
+    @cached_property
+    def dependency_analysis_tools(self):
+        from ..utils.dependency_analysis_tools import DependencyAnalysisTools
+        return DependencyAnalysisTools(self.connection_manager)
+    
+    @cached_property
+    def performance_analytics_tools(self):
+        from ..utils.performance_analytics_tools import PerformanceAnalyticsTools
+        return PerformanceAnalyticsTools(self.connection_manager)
+    
+    # ADBC query tools (the ADBC driver itself is imported when a connection is made)
+    @cached_property
+    def adbc_query_tools(self):
+        from ..utils.adbc_query_tools import DorisADBCQueryTools
+        return DorisADBCQueryTools(self.connection_manager)
+    
+    async def close(self):
+        """Release resources held by lazily created tools"""
+        await self.monitoring_tools.close()
+        adbc_query_tools = self.__dict__.get("adbc_query_tools")
+        if adbc_query_tools is not None:
+            await adbc_query_tools.close()
+    
+    def _build_tool_registry(self) -> ToolRegistry:
+        """Register every tool with its handler, definition and concurrency class"""
+        registry = ToolRegistry.from_config(self.connection_manager.config)
+        
+        def concurrency_class(name: str) -> str:
+            if name in QUERY_TOOLS:
+                return QUERY_CLASS
+            if name in ANALYTICS_TOOLS:
+                return ANALYTICS_CLASS
+            return METADATA_CLASS
+        
+        for tool in self._build_tool_definitions():
+            registry.register(
+                tool.name,
+                getattr(self, f"_{tool.name}_tool"),
+                definition=tool,
+                concurrency_class=concurrency_class(tool.name),
+            )
+        for name in LEGACY_TOOLS:
+            registry.register(name, getattr(self, f"_{name}_tool"))
+        return registry
+    
+    def get_tool_latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-tool latency histograms"""
+        return self._tool_registry.get_latency_stats()
+    
     async def list_tools(self) -> List[Tool]:
         """List all available query tools (for stdio mode)"""
+        return self._tool_registry.list_tools()
+    
+    def _build_tool_definitions(self) -> List[Tool]:
+        """Build the Tool definitions served by list_tools"""
         # Get ADBC configuration defaults
         adbc_config = self.connection_manager.config.adbc
         
@@ -782,7 +879,7 @@ No parameters required. Returns connection status, configuration, and diagnostic
 
 [Parameter Content]:
 
-- sql (string) [Required] - SQL statement to execute. MUST use three-part naming for all table references: 'catalog_name.db_name.table_name'. For internal tables use 'internal.db_name.table_name', for external tables use 'catalog_name.db_name.table_name'
+- sql (string) [Required unless cursor is given] - SQL statement to execute. MUST use three-part naming for all table references: 'catalog_name.db_name.table_name'. For internal tables use 'internal.db_name.table_name', for external tables use 'catalog_name.db_name.table_name'
 
 - db_name (string) [Optional] - Target database name, defaults to the current database
 
@@ -791,6 +888,10 @@ No parameters required. Returns connection status, configuration, and diagnostic
 - max_rows (integer) [Optional] - Maximum number of rows to return, default 100
 
 - timeout (integer) [Optional] - Query timeout in seconds, default 30
+
+- format (string) [Optional] - Result layout: 'rows' (list of row objects, default), 'columns' (column names once plus value arrays), 'csv' or 'markdown_table'. Prefer 'columns' or 'csv' for large results to save tokens
+
+- cursor (string) [Optional] - Continuation cursor from a previous response with truncated=true. The next page is served from the server-side result spool without running the query again
 """,
                 inputSchema={
                     "type": "object",
@@ -800,8 +901,16 @@ No parameters required. Returns connection status, configuration, and diagnostic
                         "catalog_name": {"type": "string", "description": "Catalog name"},
                         "max_rows": {"type": "integer", "description": "Maximum number of rows to return", "default": 100},
                         "timeout": {"type": "integer", "description": "Timeout in seconds", "default": 30},
+                        "format": {
+                            "type": "string",
+                            "enum": ["rows", "columns", "csv", "markdown_table"],
+                            "description": "Result layout",
+                            "default": "rows",
+                        },
+                        "cursor": {"type": "string", "description": "Continuation cursor (next_cursor) from a truncated response"},
                     },
-                    "required": ["sql"],
+                    # A cursor-only call fetches the next page, so either sql or cursor is required
+                    "anyOf": [{"required": ["sql"]}, {"required": ["cursor"]}],
                 },
             ),
             Tool(
@@ -1089,8 +1198,9 @@ No parameters required. Returns connection status, configuration, and diagnostic
   * "compaction": Compaction-related memory trackers
   * "all": All memory tracker types
 
-- tracker_names (array) [Optional] - List of specific tracker names for historical data
-  * Example: ["process_resident_memory", "global", "query", "load", "compaction"]
+- tracker_names (array) [Optional] - BE memory metrics for historical data, default is "allocated_bytes"
+  * Example: ["allocated_bytes", "jemalloc_resident_bytes", "doris_be_memory_jemalloc_active_bytes"]
+  * Historical data requires the background metrics collector (METRICS_COLLECTOR_ENABLED=true)
 
 - time_range (string) [Optional] - Time range for historical data, default is "1h"
   * "1h": Last 1 hour
@@ -1104,7 +1214,7 @@ No parameters required. Returns connection status, configuration, and diagnostic
                     "properties": {
                         "data_type": {"type": "string", "enum": ["realtime", "historical", "both"], "description": "Type of memory data to retrieve", "default": "realtime"},
                         "tracker_type": {"type": "string", "enum": ["overview", "global", "query", "load", "compaction", "all"], "description": "Type of memory trackers to retrieve (for real-time)", "default": "overview"},
-                        "tracker_names": {"type": "array", "items": {"type": "string"}, "description": "List of specific tracker names for historical data"},
+                        "tracker_names": {"type": "array", "items": {"type": "string"}, "description": "BE memory metrics for historical data"},
                         "time_range": {"type": "string", "enum": ["1h", "6h", "24h"], "description": "Time range for historical data", "default": "1h"},
                         "include_details": {"type": "boolean", "description": "Whether to include detailed tracker information and definitions", "default": True},
                     },
@@ -1366,80 +1476,15 @@ No parameters required. Returns connection status, configuration, and diagnostic
         """
         Call the specified query tool (tool routing and scheduling center)
         """
+        trace = self.tracer.start(name)
         try:
             start_time = time.time()
             
             # Log MCP tool call
-            mcp_logger.info(f"Tool called: {name}, Arguments: {arguments}")
+            mcp_logger.info("Tool called: %s, Arguments: %s", name, arguments)
             
             # Tool routing - dispatch requests to corresponding business logic processors
-            if name == "exec_query":
-                result = await self._exec_query_tool(arguments)
-            elif name == "get_table_schema":
-                result = await self._get_table_schema_tool(arguments)
-            elif name == "get_db_table_list":
-                result = await self._get_db_table_list_tool(arguments)
-            elif name == "get_db_list":
-                result = await self._get_db_list_tool(arguments)
-            elif name == "get_table_comment":
-                result = await self._get_table_comment_tool(arguments)
-            elif name == "get_table_column_comments":
-                result = await self._get_table_column_comments_tool(arguments)
-            elif name == "get_table_indexes":
-                result = await self._get_table_indexes_tool(arguments)
-            elif name == "get_recent_audit_logs":
-                result = await self._get_recent_audit_logs_tool(arguments)
-            elif name == "get_catalog_list":
-                result = await self._get_catalog_list_tool(arguments)
-            elif name == "get_sql_explain":
-                result = await self._get_sql_explain_tool(arguments)
-            elif name == "get_sql_profile":
-                result = await self._get_sql_profile_tool(arguments)
-            elif name == "get_table_data_size":
-                result = await self._get_table_data_size_tool(arguments)
-            elif name == "get_monitoring_metrics":
-                result = await self._get_monitoring_metrics_tool(arguments)
-            elif name == "get_memory_stats":
-                result = await self._get_memory_stats_tool(arguments)
-            # Legacy support for old tool names (deprecated)
-            elif name == "get_monitoring_metrics_info":
-                arguments["content_type"] = "definitions"
-                result = await self._get_monitoring_metrics_tool(arguments)
-            elif name == "get_monitoring_metrics_data":
-                arguments["content_type"] = "data"
-                result = await self._get_monitoring_metrics_tool(arguments)
-            elif name == "get_realtime_memory_stats":
-                arguments["data_type"] = "realtime"
-                result = await self._get_memory_stats_tool(arguments)
-            elif name == "get_historical_memory_stats":
-                arguments["data_type"] = "historical"
-                result = await self._get_memory_stats_tool(arguments)
-            # v0.5.0 Advanced Analytics Tools - Atomic Data Quality Tools
-            elif name == "get_table_basic_info":
-                result = await self._get_table_basic_info_tool(arguments)
-            elif name == "analyze_columns":
-                result = await self._analyze_columns_tool(arguments)
-            elif name == "analyze_table_storage":
-                result = await self._analyze_table_storage_tool(arguments)
-            elif name == "trace_column_lineage":
-                result = await self._trace_column_lineage_tool(arguments)
-            elif name == "monitor_data_freshness":
-                result = await self._monitor_data_freshness_tool(arguments)
-            elif name == "analyze_data_access_patterns":
-                result = await self._analyze_data_access_patterns_tool(arguments)
-            elif name == "analyze_data_flow_dependencies":
-                result = await self._analyze_data_flow_dependencies_tool(arguments)
-            elif name == "analyze_slow_queries_topn":
-                result = await self._analyze_slow_queries_topn_tool(arguments)
-            elif name == "analyze_resource_growth_curves":
-                result = await self._analyze_resource_growth_curves_tool(arguments)
-            # ADBC Query Tools
-            elif name == "exec_adbc_query":
-                result = await self._exec_adbc_query_tool(arguments)
-            elif name == "get_adbc_connection_info":
-                result = await self._get_adbc_connection_info_tool(arguments)
-            else:
-                raise ValueError(f"Unknown tool: {name}")
+            result = await self._tool_registry.call(name, arguments)
             
             execution_time = time.time() - start_time
             
@@ -1451,7 +1496,16 @@ No parameters required. Returns connection status, configuration, and diagnostic
                     "timestamp": datetime.now().isoformat(),
                 }
             
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            if name == "exec_query":
+                with span("response_budget"):
+                    result = await self.response_budgeter.apply(result)
+            
+            if trace is not None and isinstance(result, dict) and "_execution_info" in result:
+                # JSON encoding comes after this point; it is reported by the trace exporter only
+                result["_execution_info"] = dict(result["_execution_info"], stages_ms=trace.breakdown())
+            
+            with span("json_encode"):
+                return self.response_encoder.encode(result)
             
         except Exception as e:
             logger.error(f"Tool call failed {name}: {str(e)}")
@@ -1461,20 +1515,35 @@ No parameters required. Returns connection status, configuration, and diagnostic
                 "arguments": arguments,
                 "timestamp": datetime.now().isoformat(),
             }
-            return json.dumps(error_result, ensure_ascii=False, indent=2)
+            return self.response_encoder.encode(error_result)
+        finally:
+            if trace is not None:
+                self.tracer.finish(trace)
     
     
     async def _exec_query_tool(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """SQL query execution tool routing (supports federation queries)"""
+        if arguments.get("cursor"):
+            # Next page of a truncated result, served from the result spool
+            return await self.response_budgeter.fetch_page(arguments["cursor"])
+        
         sql = arguments.get("sql")
+        if not sql:
+            return {
+                "success": False,
+                "error": "Either sql or cursor is required",
+                "error_type": "invalid_arguments",
+                "data": None,
+            }
         db_name = arguments.get("db_name")
         catalog_name = arguments.get("catalog_name")
         max_rows = arguments.get("max_rows", 100)
         timeout = arguments.get("timeout", 30)
+        result_format = arguments.get("format", "rows")
         
         # Delegate to metadata extractor for processing
         return await self.metadata_extractor.exec_query_for_mcp(
-            sql, db_name, catalog_name, max_rows, timeout
+            sql, db_name, catalog_name, max_rows, timeout, result_format
         )
     
     async def _get_table_schema_tool(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
@@ -0,0 +1,260 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+ADBC Connection Pool
+
+Keeps Arrow Flight SQL connections open between queries. Connections are
+created in a worker thread (the ADBC driver blocks while it dials the FE),
+handed out to at most ``max_size`` concurrent users, and validated with a
+lightweight query before reuse when they have been idle for a while.
+
+Queries run through ``run()`` on a dedicated thread pool of the same size,
+so a long Arrow Flight fetch never blocks the event loop. When the caller
+times out or is cancelled, the statement is aborted with the ADBC cancel API.
+Work inside ``run()`` that needs more connections (parallel partition
+readers) borrows them with ``borrow_threadsafe()``, which only takes a free
+slot, so every thread doing Flight I/O holds a connection of its own and the
+number of connections never exceeds ``max_size``.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Tuple
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds to wait for a cancelled statement to stop before giving up on it
+CANCEL_GRACE_PERIOD = 5.0
+
+
+def _validate_connection(connection) -> bool:
+    """Run a trivial query to confirm the connection still works"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT 1")
+        cursor.fetchall()
+        return True
+    finally:
+        cursor.close()
+
+
+def _cancel_quietly(cursor) -> None:
+    """Abort the statement running on ``cursor`` (safe to call from any thread)"""
+    try:
+        cursor.adbc_cancel()
+    except Exception as e:
+        logger.debug(f"Error cancelling ADBC statement: {e}")
+
+
+def _close_quietly(connection) -> None:
+    try:
+        connection.close()
+    except Exception as e:
+        logger.debug(f"Error closing ADBC connection: {e}")
+
+
+class ADBCConnectionPool:
+    """Bounded pool of reusable ADBC connections"""
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        max_size: int = 4,
+        idle_timeout: float = 300.0,
+        validate_after: float = 30.0,
+        validate: Callable[[Any], bool] = _validate_connection,
+    ):
+        """
+        Args:
+            connect: Blocking callable that opens a new DB-API connection
+            max_size: Maximum number of connections in use or idle
+            idle_timeout: Idle connections older than this are closed instead of reused
+            validate_after: Idle connections older than this are validated before reuse
+            validate: Blocking callable returning True for a healthy connection
+        """
+        self._connect = connect
+        self._validate = validate
+        self.max_size = max(1, max_size)
+        self.idle_timeout = idle_timeout
+        self.validate_after = validate_after
+        self._idle: List[Tuple[Any, float]] = []  # (connection, released_at), most recent last
+        self._slots = asyncio.Semaphore(self.max_size)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_size, thread_name_prefix="adbc")
+        self._closed = False
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self.cancelled = 0
+
+    async def acquire(self):
+        """Return a healthy connection, opening a new one when no idle connection is usable"""
+        if self._closed:
+            raise RuntimeError("ADBC connection pool is closed")
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                connection, released_at = self._idle.pop()
+                idle_for = time.monotonic() - released_at
+                if idle_for > self.idle_timeout:
+                    self._discard(connection)
+                    continue
+                if idle_for > self.validate_after and not await self._is_healthy(connection):
+                    self._discard(connection)
+                    continue
+                self.reused += 1
+                return connection
+
+            connection = await asyncio.to_thread(self._connect)
+            self.created += 1
+            return connection
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def try_acquire(self):
+        """Acquire a connection if a slot is free right now, otherwise return None"""
+        if self._closed or self._slots.locked():
+            return None
+        return await self.acquire()
+
+    def borrow_threadsafe(self, loop: asyncio.AbstractEventLoop):
+        """From a worker thread: an extra connection if a slot is free, otherwise None
+
+        Blocks while a new connection is opened. Return it with give_back_threadsafe().
+        """
+        try:
+            return asyncio.run_coroutine_threadsafe(self.try_acquire(), loop).result()
+        except Exception as e:
+            logger.debug(f"Could not borrow an extra ADBC connection: {e}")
+            return None
+
+    def give_back_threadsafe(self, loop: asyncio.AbstractEventLoop, connection, discard: bool = False) -> None:
+        """From a worker thread: return a connection taken with borrow_threadsafe()"""
+        loop.call_soon_threadsafe(self.release, connection, discard)
+
+    def release(self, connection, discard: bool = False) -> None:
+        """Return a connection to the pool, or close it when ``discard`` is set"""
+        try:
+            if discard or self._closed:
+                self._discard(connection)
+            else:
+                self._idle.append((connection, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def connection(self):
+        """Acquire a connection for the duration of the block
+
+        The connection is discarded if the block raises, since a failed
+        Flight SQL call can leave it in an unknown state.
+        """
+        connection = await self.acquire()
+        try:
+            yield connection
+        except BaseException:
+            self.release(connection, discard=True)
+            raise
+        else:
+            self.release(connection)
+
+    async def run(self, fn: Callable[[Any, threading.Event], Any], timeout: float | None = None) -> Any:
+        """Call ``fn(cursor, cancelled)`` on a pooled connection in the pool's thread pool
+
+        ``cancelled`` is set when the call is abandoned, for functions that start
+        work of their own (such as partition readers) besides ``cursor``.
+
+        Raises:
+            asyncio.TimeoutError: If ``fn`` does not finish within ``timeout`` seconds;
+                the statement is cancelled and the connection discarded
+        """
+        connection = await self.acquire()
+        cursor = None
+        future = None
+        cancelled = threading.Event()
+        try:
+            cursor = connection.cursor()
+            future = asyncio.get_running_loop().run_in_executor(self._executor, fn, cursor, cancelled)
+            result = await asyncio.wait_for(asyncio.shield(future), timeout)
+        except BaseException:
+            if future is not None and not future.done():
+                # Timed out or the calling task was cancelled: abort the statement
+                self.cancelled += 1
+                cancelled.set()
+                _cancel_quietly(cursor)
+                await asyncio.wait({future}, timeout=CANCEL_GRACE_PERIOD)
+            if future is not None and not future.done():
+                # The driver has not returned yet, keep the slot until it does
+                logger.warning("Cancelled ADBC statement is still running, connection will be dropped")
+                future.add_done_callback(lambda _: self._finish(connection, cursor, discard=True))
+            else:
+                self._finish(connection, cursor, discard=True)
+            raise
+        self._finish(connection, cursor)
+        return result
+
+    def _finish(self, connection, cursor, discard: bool = False) -> None:
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Exception as e:
+                logger.debug(f"Error closing ADBC cursor: {e}")
+                discard = True
+        self.release(connection, discard=discard)
+
+    async def close(self) -> None:
+        """Close idle connections; connections in use are closed when released"""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for connection, _ in idle:
+            await asyncio.to_thread(_close_quietly, connection)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def close_nowait(self) -> None:
+        """Synchronous variant of close() for finalizers"""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for connection, _ in idle:
+            _close_quietly(connection)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_size": self.max_size,
+            "idle": len(self._idle),
+            "created": self.created,
+            "reused": self.reused,
+            "discarded": self.discarded,
+            "cancelled": self.cancelled,
+            "closed": self._closed,
+        }
+
+    async def _is_healthy(self, connection) -> bool:
+        try:
+            return bool(await asyncio.to_thread(self._validate, connection))
+        except Exception as e:
+            logger.info(f"Dropping stale ADBC connection: {e}")
+            return False
+
+    def _discard(self, connection) -> None:
+        self.discarded += 1
+        _close_quietly(connection)
@@ -20,66 +20,226 @@ Apache Doris ADBC Query Tools
 High-performance data querying using Apache Arrow Flight SQL protocol
 """
 
+import asyncio
 import os
+import queue
+import re
 import socket
+import threading
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from ..utils.logger import get_logger
+from ..utils.adbc_pool import ADBCConnectionPool
 from ..utils.db import DorisConnectionManager
 from ..utils.sql_security_utils import get_auth_context
 
 logger = get_logger(__name__)
 
+_LIMITABLE_STATEMENT = re.compile(r"^\s*(select|with)\b", re.IGNORECASE)
+# Exports must stay top-level statements; a subquery is not guaranteed to keep its
+# ORDER BY, so ordered queries are only cut off in the stream
+_NOT_WRAPPABLE = re.compile(r"\binto\s+outfile\b|\border\s+by\b", re.IGNORECASE)
 
-def _convert_numpy_types(obj):
-    """Convert numpy types to native Python types for JSON serialization"""
+
+def _push_down_limit(sql: str, max_rows: int) -> str:
+    """Wrap a SELECT in ``SELECT * FROM (...) __t LIMIT max_rows + 1``
+
+    The extra row tells the caller whether the result was truncated. Wrapping
+    rather than appending keeps a LIMIT inside the query and a trailing line
+    comment intact. Statements that cannot be wrapped are left alone; their
+    stream is still cut off by _read_limited().
+    """
+    if not _LIMITABLE_STATEMENT.match(sql) or _NOT_WRAPPABLE.search(sql):
+        return sql
+    body = sql.strip().rstrip(";").rstrip()
+    # The closing parenthesis goes on its own line so a trailing -- comment cannot swallow it
+    return f"SELECT * FROM (\n{body}\n) __t LIMIT {max_rows + 1}"
+
+
+def _read_limited(cursor, max_rows: int):
+    """Read at most max_rows rows from the Flight stream
+
+    Record batches are consumed until max_rows is reached. The statement is
+    then cancelled so the remaining endpoints are not transferred.
+
+    Returns:
+        (pyarrow.Table, truncated)
+    """
+    import pyarrow as pa
+
+    reader = cursor.fetch_record_batch()
+    batches = []
+    rows = 0
+    truncated = False
     try:
-        # Import numpy only when needed
-        import numpy as np
-        import pandas as pd
-        
-        if isinstance(obj, np.integer):
-            return int(obj)
-        elif isinstance(obj, np.floating):
-            return float(obj)
-        elif isinstance(obj, np.bool_):
-            return bool(obj)
-        elif isinstance(obj, np.ndarray):
-            return obj.tolist()
-        elif isinstance(obj, (pd.Timestamp, pd.NaT.__class__)):
-            return str(obj)
-        elif pd.isna(obj):
-            return None
-        else:
-            return obj
-    except ImportError:
-        # If numpy/pandas not available, return as-is
-        return obj
-
-
-def _convert_dataframe_to_json_serializable(df):
-    """Convert DataFrame to JSON serializable format"""
+        for batch in reader:
+            if rows + batch.num_rows > max_rows:
+                batches.append(batch.slice(0, max_rows - rows))
+                truncated = True
+                break
+            batches.append(batch)
+            rows += batch.num_rows
+    finally:
+        if truncated:
+            try:
+                cursor.adbc_cancel()
+            except Exception as e:
+                logger.debug(f"Error cancelling truncated ADBC stream: {e}")
+        reader.close()
+    return pa.Table.from_batches(batches, schema=reader.schema), truncated
+
+
+# Marks the end of one partition reader's work in the batch queue
+_READER_DONE = object()
+
+
+def _put_until_stopped(results: queue.Queue, item, stop: threading.Event) -> None:
+    """Put into the bounded queue, giving up once the consumer has stopped"""
+    while not stop.is_set():
+        try:
+            results.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+def _read_partitions(
+    cursor,
+    partitions: List[bytes],
+    schema,
+    max_rows: int,
+    concurrency: int,
+    cancelled: threading.Event,
+    borrow: Optional[Callable[[], Any]] = None,
+    give_back: Optional[Callable[[Any, bool], None]] = None,
+):
+    """Read the Flight endpoints of a partitioned result concurrently
+
+    ADBC connections are not required to be thread-safe, so every reader
+    thread reads on a connection of its own: the query's connection plus up
+    to ``concurrency - 1`` connections from ``borrow`` (which returns None
+    once no more are available without waiting), handed back through
+    ``give_back(connection, discard)``. Without extra connections the
+    partitions are read by a single reader. Each reader takes whole
+    partitions; record batches go to the calling thread through a bounded
+    queue, so a slow consumer throttles the readers instead of every endpoint
+    being buffered in memory. Reading stops at max_rows, and the remaining
+    readers are cancelled. Batches are concatenated in partition order.
+
+    Returns:
+        (pyarrow.Table, truncated)
+    """
+    import pyarrow as pa
+
+    connections = [cursor.connection]
+    if borrow is not None:
+        while len(connections) < min(concurrency, len(partitions)) and not cancelled.is_set():
+            connection = borrow()
+            if connection is None:
+                break
+            connections.append(connection)
+    borrowed = connections[1:]
+
+    pending = queue.SimpleQueue()
+    for index in range(len(partitions)):
+        pending.put(index)
+    results = queue.Queue(maxsize=concurrency * 2)
+    stop = threading.Event()
+    reader_cursors = []
+    reader_lock = threading.Lock()
+
+    def read(connection):
+        try:
+            reader_cursor = connection.cursor()
+            with reader_lock:
+                reader_cursors.append(reader_cursor)
+            while not stop.is_set():
+                try:
+                    index = pending.get_nowait()
+                except queue.Empty:
+                    break
+                reader_cursor.adbc_read_partition(partitions[index])
+                for batch in reader_cursor.fetch_record_batch():
+                    if stop.is_set():
+                        break
+                    _put_until_stopped(results, (index, batch), stop)
+        except Exception as e:
+            _put_until_stopped(results, e, stop)
+        finally:
+            _put_until_stopped(results, _READER_DONE, stop)
+
+    readers = [
+        threading.Thread(target=read, args=(connection,), name=f"adbc-partition-{i}", daemon=True)
+        for i, connection in enumerate(connections)
+    ]
+    for reader in readers:
+        reader.start()
+
+    batches_by_partition = [[] for _ in partitions]
+    rows = 0
+    finished = 0
+    truncated = False
+    completed = False
     try:
-        import pandas as pd
-        import numpy as np
-        
-        # Convert DataFrame to records
-        records = df.to_dict('records')
-        
-        # Convert each record's values
-        converted_records = []
-        for record in records:
-            converted_record = {}
-            for key, value in record.items():
-                converted_record[key] = _convert_numpy_types(value)
-            converted_records.append(converted_record)
-        
-        return converted_records
-    except ImportError:
-        # Fallback to basic dict conversion
-        return df.to_dict('records')
+        while finished < len(readers):
+            if cancelled.is_set():
+                raise RuntimeError("ADBC partition read was cancelled")
+            try:
+                item = results.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is _READER_DONE:
+                finished += 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                index, batch = item
+                batches_by_partition[index].append(batch)
+                rows += batch.num_rows
+                if rows > max_rows:
+                    truncated = True
+                    break
+        completed = True
+    finally:
+        stop.set()
+        if finished < len(readers):
+            with reader_lock:
+                for reader_cursor in reader_cursors:
+                    try:
+                        reader_cursor.adbc_cancel()
+                    except Exception as e:
+                        logger.debug(f"Error cancelling ADBC partition reader: {e}")
+        for reader in readers:
+            reader.join()
+        for reader_cursor in reader_cursors:
+            try:
+                reader_cursor.close()
+            except Exception as e:
+                logger.debug(f"Error closing ADBC partition reader: {e}")
+        for connection in borrowed:
+            # A failed or cancelled read can leave a connection in an unknown state
+            give_back(connection, not completed)
+
+    table = pa.Table.from_batches(
+        [batch for batches in batches_by_partition for batch in batches], schema=schema
+    )
+    if table.num_rows > max_rows:
+        table = table.slice(0, max_rows)
+    return table, truncated
+
+
+def _arrow_table_to_records(table) -> List[Dict[str, Any]]:
+    """Convert a pyarrow.Table to row dicts, one column at a time
+
+    Each column is converted with a single to_pylist() call, which yields plain
+    Python values (datetime, Decimal and bytes are handled by the response
+    encoder), so neither pandas nor per-cell type checks are involved.
+    """
+    names = table.column_names
+    columns = [column.to_pylist() for column in table.columns]
+    return [dict(zip(names, row)) for row in zip(*columns)]
 
 
 class DorisADBCQueryTools:
@@ -87,10 +247,16 @@ class DorisADBCQueryTools:
     
     def __init__(self, connection_manager: DorisConnectionManager):
         self.connection_manager = connection_manager
-        self.adbc_client = None
         self.flight_sql_module = None
         self.adbc_manager_module = None
-        
+        self._module_status = None  # Result of the first successful module import
+        self.pool: ADBCConnectionPool | None = None
+        self.pool_uri = None
+        # Successful port checks are reused for ADBC_PORT_CHECK_TTL seconds
+        self._port_check_result = None
+        self._port_check_time = 0.0
+        self._port_check_lock = asyncio.Lock()
+
     async def exec_adbc_query(
         self,
         sql: str,
@@ -157,8 +323,30 @@ class DorisADBCQueryTools:
                 "timestamp": datetime.now().isoformat()
             }
     
-    async def _check_arrow_flight_ports(self) -> Dict[str, Any]:
-        """Check Arrow Flight SQL port configuration and availability"""
+    async def _check_arrow_flight_ports(self, use_cache: bool = True) -> Dict[str, Any]:
+        """Check Arrow Flight SQL port configuration and availability
+
+        A successful result is cached for ``adbc.port_check_ttl`` seconds. Probes
+        run concurrently in worker threads so they never block the event loop.
+        """
+        ttl = self.connection_manager.config.adbc.port_check_ttl
+        if use_cache and self._port_check_result and time.monotonic() - self._port_check_time < ttl:
+            return self._port_check_result
+
+        async with self._port_check_lock:
+            # Another caller may have refreshed the result while we waited
+            if use_cache and self._port_check_result and time.monotonic() - self._port_check_time < ttl:
+                return self._port_check_result
+            result = await self._probe_arrow_flight_ports()
+            if result["success"]:
+                self._port_check_result = result
+                self._port_check_time = time.monotonic()
+            else:
+                self._port_check_result = None
+            return result
+
+    async def _probe_arrow_flight_ports(self) -> Dict[str, Any]:
+        """Probe the FE and BE Arrow Flight SQL ports"""
         try:
             # Check environment variables
             fe_port = os.getenv("FE_ARROW_FLIGHT_SQL_PORT")
@@ -193,8 +381,14 @@ class DorisADBCQueryTools:
             db_config = self.connection_manager.config.database
             fe_host = db_config.host
             
-            # Check FE Arrow Flight SQL port availability
-            fe_available = self._check_port_connectivity(fe_host, fe_port)
+            # Probe the FE port while looking up BE hosts
+            fe_probe = asyncio.create_task(
+                asyncio.to_thread(self._check_port_connectivity, fe_host, fe_port)
+            )
+            try:
+                be_hosts = await self._get_be_hosts()
+            finally:
+                fe_available = await fe_probe
             if not fe_available:
                 return {
                     "success": False,
@@ -204,8 +398,6 @@ class DorisADBCQueryTools:
                     "fe_port": fe_port
                 }
             
-            # Get BE host list
-            be_hosts = await self._get_be_hosts()
             if not be_hosts:
                 return {
                     "success": False,
@@ -217,8 +409,12 @@ class DorisADBCQueryTools:
             be_available_count = 0
             be_check_results = []
             
-            for be_host in be_hosts[:3]:  # Check first 3 BE nodes
-                be_available = self._check_port_connectivity(be_host, be_port)
+            checked_hosts = be_hosts[:3]  # Check first 3 BE nodes
+            be_probes = await asyncio.gather(*(
+                asyncio.to_thread(self._check_port_connectivity, be_host, be_port)
+                for be_host in checked_hosts
+            ))
+            for be_host, be_available in zip(checked_hosts, be_probes):
                 be_check_results.append({
                     "host": be_host,
                     "port": be_port,
@@ -277,9 +473,9 @@ class DorisADBCQueryTools:
             
             # Get BE nodes via SHOW BACKENDS
             logger.info("No BE hosts configured, getting BE node information via SHOW BACKENDS")
-            connection = await self.connection_manager.get_connection("query")
             auth_context = get_auth_context()
-            result = await connection.execute("SHOW BACKENDS", auth_context=auth_context)
+            async with self.connection_manager.get_connection_context("query") as connection:
+                result = await connection.execute("SHOW BACKENDS", auth_context=auth_context)
             
             be_hosts = []
             for row in result.data:
@@ -297,6 +493,8 @@ class DorisADBCQueryTools:
     
     async def _import_adbc_modules(self) -> Dict[str, Any]:
         """Import ADBC related modules"""
+        if self._module_status is not None:
+            return self._module_status
         try:
             # Import ADBC Driver Manager
             try:
@@ -320,11 +518,12 @@ class DorisADBCQueryTools:
                     "error_type": "missing_flight_sql_driver"
                 }
             
-            return {
+            self._module_status = {
                 "success": True,
                 "adbc_manager_version": getattr(adbc_driver_manager, '__version__', 'unknown'),
                 "flight_sql_version": getattr(flight_sql, '__version__', 'unknown')
             }
+            return self._module_status
             
         except Exception as e:
             logger.error(f"ADBC module import failed: {str(e)}")
@@ -335,7 +534,7 @@ class DorisADBCQueryTools:
             }
     
     async def _create_adbc_connection(self) -> Dict[str, Any]:
-        """Create ADBC connection"""
+        """Create the ADBC connection pool, or reuse it while the endpoint is unchanged"""
         try:
             db_config = self.connection_manager.config.database
             fe_port = int(os.getenv("FE_ARROW_FLIGHT_SQL_PORT"))
@@ -349,11 +548,18 @@ class DorisADBCQueryTools:
                 self.adbc_manager_module.DatabaseOptions.PASSWORD.value: db_config.password,
             }
             
-            # Create connection
-            self.adbc_client = self.flight_sql_module.connect(
-                uri=uri,
-                db_kwargs=db_kwargs
-            )
+            if self.pool is not None and self.pool_uri != uri:
+                await self.pool.close()
+                self.pool = None
+
+            if self.pool is None:
+                flight_sql = self.flight_sql_module
+                self.pool = ADBCConnectionPool(
+                    lambda: flight_sql.connect(uri=uri, db_kwargs=db_kwargs),
+                    max_size=self.connection_manager.config.adbc.pool_size,
+                    idle_timeout=self.connection_manager.config.adbc.pool_idle_timeout,
+                )
+                self.pool_uri = uri
             
             return {
                 "success": True,
@@ -378,7 +584,7 @@ class DorisADBCQueryTools:
     ) -> Dict[str, Any]:
         """Execute query using ADBC"""
         try:
-            if not self.adbc_client:
+            if not self.pool:
                 return {
                     "success": False,
                     "error": "ADBC connection not established",
@@ -399,95 +605,132 @@ class DorisADBCQueryTools:
                         "risk_level": validation_result.risk_level
                     }
             
-            cursor = self.adbc_client.cursor()
-            start_time = time.time()
-            
-            # Execute query
-            cursor.execute(sql)
-            
-            # Get results based on return format
-            if return_format == "arrow":
-                # Return Arrow format
-                arrow_data = cursor.fetchallarrow()
-                
-                # Limit rows
-                if len(arrow_data) > max_rows:
-                    arrow_data = arrow_data.slice(0, max_rows)
-                
-                # Convert Arrow data to serializable format
-                preview_df = arrow_data.to_pandas().head(10) if len(arrow_data) > 0 else None
-                result_data = {
-                    "format": "arrow",
-                    "num_rows": len(arrow_data),
-                    "num_columns": len(arrow_data.schema),
-                    "column_names": arrow_data.schema.names,
-                    "column_types": [str(field.type) for field in arrow_data.schema],
-                    "data_preview": _convert_dataframe_to_json_serializable(preview_df) if preview_df is not None else [],
-                    "total_bytes": arrow_data.nbytes if hasattr(arrow_data, 'nbytes') else 0
-                }
-                
-            elif return_format == "pandas":
-                # Return Pandas DataFrame
-                df = cursor.fetch_df()
-                
-                # Limit rows
-                if len(df) > max_rows:
-                    df = df.head(max_rows)
-                
-                result_data = {
-                    "format": "pandas",
-                    "num_rows": len(df),
-                    "num_columns": len(df.columns),
-                    "column_names": df.columns.tolist(),
-                    "column_types": df.dtypes.astype(str).tolist(),
-                    "data": _convert_dataframe_to_json_serializable(df),
-                    "memory_usage": int(df.memory_usage(deep=True).sum())
-                }
-                
-            else:  # return_format == "dict"
-                # Return dictionary format
-                arrow_data = cursor.fetchallarrow()
-                df = arrow_data.to_pandas()
-                
-                # Limit rows
-                if len(df) > max_rows:
-                    df = df.head(max_rows)
-                
-                result_data = {
-                    "format": "dict",
-                    "num_rows": len(df),
-                    "num_columns": len(df.columns),
-                    "column_names": df.columns.tolist(),
-                    "column_types": df.dtypes.astype(str).tolist(),
-                    "data": _convert_dataframe_to_json_serializable(df)
-                }
-            
-            execution_time = time.time() - start_time
-            
-            cursor.close()
+            # Runs in the pool's thread pool; on timeout the statement is cancelled
+            loop = asyncio.get_running_loop()
+            return await self.pool.run(
+                lambda cursor, cancelled: self._run_query(cursor, cancelled, sql, max_rows, return_format, loop),
+                timeout=timeout,
+            )
             
+        except asyncio.TimeoutError:
+            logger.warning(f"ADBC query timed out after {timeout} seconds")
             return {
-                "success": True,
-                "result": result_data,
-                "execution_time": round(execution_time, 3),
-                "sql": sql,
-                "max_rows_applied": len(result_data.get("data", [])) >= max_rows
+                "success": False,
+                "error": f"ADBC query timed out after {timeout} seconds and was cancelled",
+                "error_type": "timeout",
+                "sql": sql
             }
-            
         except Exception as e:
             logger.error(f"ADBC query execution failed: {str(e)}")
+            # Re-probe the ports on the next call in case a node went away
+            self._port_check_result = None
             return {
                 "success": False,
                 "error": f"ADBC query execution failed: {str(e)}",
                 "error_type": "query_execution_error",
                 "sql": sql
             }
+
+    def _run_query(
+        self, cursor, cancelled: threading.Event, sql: str, max_rows: int, return_format: str,
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> Dict[str, Any]:
+        """Run a query on a pooled connection's cursor and convert the result (worker thread)
+
+        ``loop`` is the event loop owning the pool, used to borrow connections for parallel reads.
+        """
+        start_time = time.time()
+        
+        # Execute query with max_rows pushed down, then stop reading at max_rows
+        arrow_data, truncated = self._fetch(cursor, cancelled, _push_down_limit(sql, max_rows), max_rows, loop)
+        column_names = arrow_data.schema.names
+        
+        # Get results based on return format
+        if return_format == "arrow":
+            result_data = {
+                "format": "arrow",
+                "num_rows": arrow_data.num_rows,
+                "num_columns": arrow_data.num_columns,
+                "column_names": column_names,
+                "column_types": [str(field.type) for field in arrow_data.schema],
+                "data_preview": _arrow_table_to_records(arrow_data.slice(0, 10)),
+                "total_bytes": arrow_data.nbytes
+            }
+            
+        elif return_format == "pandas":
+            # pandas was requested: report its dtypes and memory usage, but build
+            # the rows from Arrow directly
+            df = arrow_data.to_pandas()
+            result_data = {
+                "format": "pandas",
+                "num_rows": len(df),
+                "num_columns": len(df.columns),
+                "column_names": column_names,
+                "column_types": df.dtypes.astype(str).tolist(),
+                "data": _arrow_table_to_records(arrow_data),
+                "memory_usage": int(df.memory_usage(deep=True).sum())
+            }
+            
+        else:  # return_format == "dict"
+            result_data = {
+                "format": "dict",
+                "num_rows": arrow_data.num_rows,
+                "num_columns": arrow_data.num_columns,
+                "column_names": column_names,
+                "column_types": [str(field.type) for field in arrow_data.schema],
+                "data": _arrow_table_to_records(arrow_data)
+            }
+        
+        execution_time = time.time() - start_time
+        
+        return {
+            "success": True,
+            "result": result_data,
+            "execution_time": round(execution_time, 3),
+            "sql": sql,
+            "max_rows_applied": truncated
+        }
+    
+    def _fetch(
+        self, cursor, cancelled: threading.Event, sql: str, max_rows: int,
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ):
+        """Execute and read at most max_rows rows, in parallel when the result has several endpoints"""
+        concurrency = self.connection_manager.config.adbc.fetch_concurrency
+        if concurrency > 1:
+            try:
+                partitions, schema = cursor.adbc_execute_partitions(sql)
+            except self.adbc_manager_module.NotSupportedError:
+                logger.info("ADBC driver does not support partitioned results, reading serially")
+                concurrency = 1
+            else:
+                if len(partitions) > 1:
+                    borrow = give_back = None
+                    if loop is not None and self.pool is not None:
+                        pool = self.pool
+
+                        def borrow():
+                            return pool.borrow_threadsafe(loop)
+
+                        def give_back(connection, discard):
+                            pool.give_back_threadsafe(loop, connection, discard)
+                    return _read_partitions(
+                        cursor, partitions, schema, max_rows, concurrency, cancelled, borrow, give_back
+                    )
+                if not partitions:
+                    import pyarrow as pa
+                    return pa.Table.from_batches([], schema=schema), False
+                cursor.adbc_read_partition(partitions[0])
+                return _read_limited(cursor, max_rows)
+
+        cursor.execute(sql)
+        return _read_limited(cursor, max_rows)
     
     async def get_adbc_connection_info(self) -> Dict[str, Any]:
         """Get ADBC connection information and status"""
         try:
-            # Check port status
-            port_status = await self._check_arrow_flight_ports()
+            # Check port status (always probe, this is the diagnostics tool)
+            port_status = await self._check_arrow_flight_ports(use_cache=False)
             
             # Check module status
             module_status = await self._import_adbc_modules()
@@ -508,6 +751,7 @@ class DorisADBCQueryTools:
                 },
                 "port_status": port_status,
                 "module_status": module_status,
+                "pool": self.pool.stats() if self.pool else None,
                 "timestamp": datetime.now().isoformat()
             }
             
@@ -533,10 +777,16 @@ class DorisADBCQueryTools:
                 "timestamp": datetime.now().isoformat()
             }
     
+    async def close(self):
+        """Close pooled ADBC connections"""
+        if self.pool:
+            await self.pool.close()
+            self.pool = None
+
     def __del__(self):
         """Cleanup resources"""
         try:
-            if self.adbc_client:
-                self.adbc_client.close()
+            if self.pool:
+                self.pool.close_nowait()
         except:
             pass 
\ No newline at end of file
@@ -23,7 +23,6 @@ import time
 from datetime import datetime
 from typing import Any, Dict, List
 import uuid
-import aiohttp
 import hashlib
 from pathlib import Path
 
@@ -800,6 +799,8 @@ class SQLAnalyzer:
             url = f"http://{db_config.host}:{db_config.fe_http_port}/rest/v2/manager/query/trace_id/{trace_id}"
             
             # HTTP Basic Auth
+            # aiohttp is imported on first use; it dominates module import time
+            import aiohttp
             auth = aiohttp.BasicAuth(db_config.user, db_config.password)
             
             logger.info(f"Requesting query ID from: {url}")
@@ -880,6 +881,7 @@ class SQLAnalyzer:
             ]
             
             # HTTP Basic Auth
+            import aiohttp
             auth = aiohttp.BasicAuth(db_config.user, db_config.password)
             
             for i, url in enumerate(urls):
@@ -980,6 +982,7 @@ class SQLAnalyzer:
                 params["single_replica"] = "true"
             
             # HTTP Basic Auth
+            import aiohttp
             auth = aiohttp.BasicAuth(db_config.user, db_config.password)
             
             logger.info(f"Requesting table data size from: {url} with params: {params}")
@@ -1184,11 +1187,30 @@ class SQLAnalyzer:
             return str(bytes_value)
 
 
+# Time ranges accepted by get_historical_memory_stats, e.g. "30m", "1h", "24h", "1d"
+_TIME_RANGE_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+# Points returned per series in a memory history response
+_HISTORY_MAX_POINTS = 60
+
+
+def _parse_time_range(time_range: str) -> int:
+    """Convert a time range such as "1h" to seconds"""
+    text = (time_range or "").strip().lower()
+    if len(text) < 2 or text[-1] not in _TIME_RANGE_UNITS or not text[:-1].isdigit():
+        raise ValueError(f"Invalid time_range: {time_range!r}, expected e.g. '30m', '1h' or '24h'")
+    return int(text[:-1]) * _TIME_RANGE_UNITS[text[-1]]
+
+
 class MemoryTracker:
     """Memory tracker for Doris BE memory monitoring"""
     
-    def __init__(self, connection_manager: DorisConnectionManager):
+    # BE memory metric read when no tracker names are given
+    DEFAULT_HISTORY_METRIC = "doris_be_memory_allocated_bytes"
+    
+    def __init__(self, connection_manager: DorisConnectionManager, collector=None):
         self.connection_manager = connection_manager
+        # Background MetricsCollector holding the BE memory series (None when disabled)
+        self.collector = collector
     
     async def get_realtime_memory_stats(
         self,
@@ -1239,31 +1261,59 @@ class MemoryTracker:
         """
         Get historical memory statistics
         
+        History is read from the BE memory series buffered by the background
+        metrics collector, so it covers at most the collector retention period.
+        
         Args:
-            tracker_names: List of specific tracker names to query
-            time_range: Time range for historical data
+            tracker_names: BE memory metrics to query, as full metric names or
+                short names ("allocated_bytes" for doris_be_memory_allocated_bytes)
+            time_range: Time range for historical data ("30m", "1h", "24h", ...)
             
         Returns:
-            Dict containing historical memory statistics
+            Dict containing historical memory statistics per BE node
         """
         try:
-            # This is a placeholder implementation
-            # In a real implementation, this would fetch historical data from Doris BE bvar endpoints
-            return {
+            if self.collector is None:
+                return {
+                    "success": False,
+                    "error": "Historical memory stats require the background metrics collector "
+                             "(set METRICS_COLLECTOR_ENABLED=true)",
+                    "tracker_names": tracker_names,
+                    "time_range": time_range,
+                    "timestamp": datetime.now().isoformat()
+                }
+            
+            window = _parse_time_range(time_range)
+            historical_stats = {}
+            unmatched = []
+            for tracker_name in tracker_names or [self.DEFAULT_HISTORY_METRIC]:
+                series = {}
+                for metric_name in (tracker_name, f"doris_be_memory_{tracker_name}", f"doris_be_memory_{tracker_name}_bytes"):
+                    series.update(self.collector.history(metric_name, window, role="be"))
+                if not series:
+                    unmatched.append(tracker_name)
+                    continue
+                for (node_key, metric_name, labels), samples in series.items():
+                    if samples:
+                        node_stats = historical_stats.setdefault(node_key.split(":", 1)[1], {})
+                        node_stats[_series_name(metric_name, labels)] = self._summarize_samples(samples)
+            
+            result = {
                 "success": True,
                 "tracker_names": tracker_names,
                 "time_range": time_range,
                 "timestamp": datetime.now().isoformat(),
-                "historical_stats": {
-                    "data_points": 60,
-                    "interval": "1m",
-                    "memory_trend": "stable",
-                    "avg_usage": "4.2 GB",
-                    "peak_usage": "5.1 GB",
-                    "min_usage": "3.8 GB"
-                },
-                "note": "Historical memory tracking functionality requires BE bvar endpoints to be available"
+                "interval": f"{self.collector.interval}s",
+                "retention": f"{self.collector.retention}s",
+                "historical_stats": historical_stats
             }
+            if unmatched:
+                result["unmatched_tracker_names"] = unmatched
+            if window > self.collector.retention:
+                result["note"] = f"time_range exceeds the collector retention, only the last {self.collector.retention}s are available"
+            elif not historical_stats:
+                result["note"] = "No samples collected yet"
+            return result
             
         except Exception as e:
             logger.error(f"Failed to get historical memory stats: {str(e)}")
@@ -1273,4 +1323,32 @@ class MemoryTracker:
                 "tracker_names": tracker_names,
                 "time_range": time_range,
                 "timestamp": datetime.now().isoformat()
-            } 
+            }
+    
+    def _summarize_samples(self, samples: List[tuple]) -> Dict[str, Any]:
+        """Min/avg/peak and trend of one series, with a downsampled point list"""
+        values = [value for _, value in samples]
+        first, last = values[0], values[-1]
+        change = (last - first) / first if first else 0.0
+        trend = "rising" if change > 0.05 else "falling" if change < -0.05 else "stable"
+        step = max(1, -(-len(samples) // _HISTORY_MAX_POINTS))
+        return {
+            "data_points": len(samples),
+            "start": datetime.fromtimestamp(samples[0][0]).isoformat(),
+            "end": datetime.fromtimestamp(samples[-1][0]).isoformat(),
+            "min": min(values),
+            "avg": sum(values) / len(values),
+            "peak": max(values),
+            "last": last,
+            "memory_trend": trend,
+            "points": [
+                [datetime.fromtimestamp(timestamp).isoformat(), value]
+                for timestamp, value in samples[::step]
+            ]
+        }
+
+
+def _series_name(metric_name: str, labels: tuple) -> str:
+    if not labels:
+        return metric_name
+    return metric_name + "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
@@ -0,0 +1,68 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Precompiled ASGI path router
+
+Routes are compiled once into an exact-path table and a character trie of
+prefixes, so classifying a request path is a dictionary lookup or a single
+walk over at most the length of the longest registered prefix.
+"""
+
+from typing import Any, Dict, Iterable
+
+# Trie node key under which the target of a complete prefix is stored
+_TARGET = ""
+
+
+class PrefixRouter:
+    """Maps request paths to targets by exact match, then longest prefix"""
+
+    def __init__(self, default: Any = None):
+        self.default = default
+        self._exact: Dict[str, Any] = {}
+        self._trie: Dict[str, Any] = {}
+        self._max_prefix_length = 0
+
+    def add_exact(self, paths: Iterable[str], target: Any) -> "PrefixRouter":
+        for path in paths:
+            self._exact[path] = target
+        return self
+
+    def add_prefix(self, prefixes: Iterable[str], target: Any) -> "PrefixRouter":
+        for prefix in prefixes:
+            node = self._trie
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node[_TARGET] = target
+            self._max_prefix_length = max(self._max_prefix_length, len(prefix))
+        return self
+
+    def resolve(self, path: str) -> Any:
+        """Return the target for ``path``, or the default when nothing matches"""
+        target = self._exact.get(path, self)
+        if target is not self:
+            return target
+
+        match = self.default
+        node = self._trie
+        for char in path[:self._max_prefix_length]:
+            node = node.get(char)
+            if node is None:
+                break
+            if _TARGET in node:
+                match = node[_TARGET]
+        return match
@@ -22,7 +22,6 @@ Responsible for extracting table structures, relationships, and other metadata f
 
 import os
 import json
-import pandas as pd
 import re
 import uuid
 import time
@@ -34,6 +33,7 @@ from datetime import datetime, timedelta
 from .logger import get_logger
 from .sql_security_utils import (
     SQLSecurityError,
+    get_auth_context,
     validate_identifier,
     quote_identifier
 )
@@ -106,6 +106,9 @@ class MetadataExtractor:
         Returns:
             Query result data (list of dictionaries or pandas DataFrame)
         """
+        if return_dataframe:
+            # Only DataFrame results need pandas, which is slow to import
+            import pandas as pd
         try:
             if self.connection_manager:
                 # Use the injected connection manager directly (async)
@@ -119,10 +122,8 @@ class MetadataExtractor:
                 
                 # Convert to DataFrame if requested
                 if return_dataframe and data:
-                    import pandas as pd
                     return pd.DataFrame(data)
                 elif return_dataframe:
-                    import pandas as pd
                     return pd.DataFrame()
                 else:
                     return data
@@ -130,7 +131,6 @@ class MetadataExtractor:
                 # Fallback: Return empty result
                 logger.warning("No connection manager provided, returning empty result")
                 if return_dataframe:
-                    import pandas as pd
                     return pd.DataFrame()
                 else:
                     return []
@@ -138,7 +138,6 @@ class MetadataExtractor:
             logger.error(f"Error executing query: {str(e)}")
             # Return empty result instead of raising exception to prevent cascade failures
             if return_dataframe:
-                import pandas as pd
                 return pd.DataFrame()
             else:
                 return []
@@ -315,12 +314,15 @@ class MetadataExtractor:
         self,
         sql: str,
         max_rows: int = 100,
-        timeout: int = 30
+        timeout: int = 30,
+        result_format: str = "rows"
     ) -> Dict[str, Any]:
         """
         Execute SQL query and return results, supports catalog federation queries
         Unified interface for MCP tools
 
+        result_format: rows, columns, csv or markdown_table (layout of the returned data)
+
         FIX for Issue #62 Bug 1: Now retrieves auth_context from context variable to support token-bound database configuration
         FIX for Issue #62 Bug 3: Now uses db_name and catalog_name parameters to switch database context
         """
@@ -339,25 +341,9 @@ class MetadataExtractor:
                 sql = sql.replace(f"{INTERNAL_CATALOG_NAME}.{DEFAULT_DB_NAME}.", "")
                 sql = sql.replace(f"{INTERNAL_CATALOG_NAME}.", "")
             final_sql = sql
-            # FIX: Try to get auth_context from context variable (set by HTTP middleware)
+            # FIX: Get auth_context from the shared context variable (set by the HTTP handler)
             # This allows token-bound database configuration to work
-            auth_context = None
-            try:
-                from contextvars import ContextVar
-                from .security import AuthContext
-
-                # Try to get auth_context from context variable
-                # This will be set by the HTTP request handler in main.py
-                auth_context_var: ContextVar = ContextVar('mcp_auth_context', default=None)
-                auth_context = auth_context_var.get()
-
-                if auth_context:
-                    logger.debug(f"Retrieved auth_context from context variable with token: {bool(hasattr(auth_context, 'token') and auth_context.token)}")
-                else:
-                    logger.debug("No auth_context found in context variable, using default")
-            except Exception as ctx_error:
-                logger.debug(f"Could not retrieve auth_context from context variable: {ctx_error}")
-                auth_context = None
+            auth_context = get_auth_context()
 
             # Import query executor
             from .query_executor import execute_sql_query
@@ -368,7 +354,8 @@ class MetadataExtractor:
                 connection_manager=self.connection_manager,
                 limit=max_rows,
                 timeout=timeout,
-                auth_context=auth_context  # FIX: Pass auth_context with token
+                auth_context=auth_context,  # FIX: Pass auth_context with token
+                result_format=result_format
             )
 
             return exec_result
@@ -92,6 +92,8 @@ class SecurityConfig:
     enable_token_expiry: bool = True  # Enable token expiration
     default_token_expiry_hours: int = 24 * 30  # Default expiry: 30 days
     token_hash_algorithm: str = "sha256"  # Token hashing algorithm: sha256, sha512
+    auth_cache_ttl: int = 60  # Seconds a verified token stays cached (0 disables the fast path)
+    auth_cache_max_size: int = 10000  # Maximum number of cached verified tokens
     
     # Token Management Security (New in v0.6.0)
     enable_http_token_management: bool = False  # Enable HTTP token management endpoints (default: disabled for security)
@@ -110,7 +112,7 @@ class SecurityConfig:
     jwt_refresh_token_expiry: int = 86400  # 24 hours
     enable_token_refresh: bool = True
     enable_token_revocation: bool = True
-    key_rotation_interval: int = 30 * 24 * 3600  # 30 days in seconds
+    key_rotation_interval: int = 30 * 24 * 3600  # 30 days in seconds (0 disables rotation)
     
     # JWT Security Features
     jwt_require_iat: bool = True  # Require "issued at" claim
@@ -120,6 +122,11 @@ class SecurityConfig:
     jwt_verify_signature: bool = True  # Verify JWT signature
     jwt_verify_audience: bool = True  # Verify audience claim
     jwt_verify_issuer: bool = True  # Verify issuer claim
+    jwt_verification_cache_size: int = 10000  # Signature-verified JWTs cached until 'exp' (0 disables)
+    jwt_rate_limit_requests: int = 100  # Maximum validated requests per user within the rate limit window
+    jwt_rate_limit_window: int = 3600  # Rate limit window in seconds
+    rate_limit_backend: str = "memory"  # memory (per process) or shared (memory-mapped, shared by all workers)
+    rate_limit_shared_path: str = ""  # Backing file for the shared backend (default: one per worker pool)
 
     # SQL security configuration
     enable_security_check: bool = True  # Main switch: whether to enable SQL security check
@@ -221,6 +228,15 @@ class PerformanceConfig:
     # Response content size limit (characters)
     max_response_content_size: int = 4096
     
+    # Tool response JSON encoder: auto (orjson when installed), orjson, json (compact) or pretty
+    response_encoder: str = "auto"
+    
+    # Truncated query results kept for continuation cursors
+    result_spool_ttl: int = 300  # Seconds a spooled result stays available after its last page read
+    result_spool_max_entries: int = 64  # Maximum number of spooled results
+    result_spool_dir: str = ""  # Directory for compressed spool files (default: private temp directory)
+    result_spool_disk_quota_mb: int = 512  # Maximum disk space used by spool files
+    
     # Table and column filtering configuration
     table_filter_include: str = ""
     table_filter_exclude: str = ""
@@ -266,6 +282,12 @@ class ADBCConfig:
     # Connection timeout for ADBC
     connection_timeout: int = 30
     
+    # Connection pool and port check caching
+    pool_size: int = 4  # Maximum pooled Arrow Flight SQL connections
+    pool_idle_timeout: int = 300  # Seconds an idle pooled connection is kept
+    port_check_ttl: int = 60  # Seconds a successful FE/BE port check is reused
+    fetch_concurrency: int = 4  # Flight endpoints read in parallel per query (1 reads serially)
+    
     # Whether to enable ADBC tools
     enabled: bool = True
 
@@ -289,6 +311,11 @@ class LoggingConfig:
     max_age_days: int = 30
     cleanup_interval_hours: int = 24
 
+    # Hot path logging configuration
+    enable_async: bool = True  # Write log records from a background QueueListener thread
+    hot_path_sample_rate: float = 1.0  # Fraction of per-request log records kept
+    hot_path_max_per_second: int = 20  # Per-request log records emitted per second per logger, 0 for no limit
+
 
 @dataclass
 class MonitoringConfig:
@@ -296,8 +323,21 @@ class MonitoringConfig:
 
     # Metrics collection configuration
     enable_metrics: bool = True
-    metrics_port: int = 3001
-    metrics_path: str = "/metrics"
+    metrics_port: int = 3001  # Deprecated and unused: metrics are served on the HTTP transport port
+    metrics_path: str = "/metrics"  # Server metrics in Prometheus format (HTTP transport)
+
+    # FE/BE metrics scraping (get_monitoring_metrics tool)
+    scrape_concurrency: int = 16  # BE nodes scraped at the same time
+    scrape_timeout: int = 10  # Per-node request timeout in seconds
+
+    # Background FE/BE metrics collector (P0 results, counter rates, memory history)
+    collector_enabled: bool = False
+    collector_interval: int = 15  # Seconds between scrapes
+    collector_retention: int = 3600  # Seconds of samples kept per series
+
+    # Sampled per-stage tracing of tool calls (_execution_info["stages_ms"])
+    trace_sample_rate: float = 0.0  # Fraction of tool calls traced, 0 disables tracing
+    trace_exporter: str = "none"  # none, log or otel (requires opentelemetry-api)
 
     # Health check configuration
     health_check_port: int = 3002
@@ -487,6 +527,21 @@ class DorisConfig:
             os.getenv("DEFAULT_TOKEN_EXPIRY_HOURS", str(config.security.default_token_expiry_hours))
         )
         config.security.token_hash_algorithm = os.getenv("TOKEN_HASH_ALGORITHM", config.security.token_hash_algorithm)
+        config.security.auth_cache_ttl = int(
+            os.getenv("AUTH_CACHE_TTL", str(config.security.auth_cache_ttl))
+        )
+        config.security.auth_cache_max_size = int(
+            os.getenv("AUTH_CACHE_MAX_SIZE", str(config.security.auth_cache_max_size))
+        )
+        config.security.rate_limit_backend = os.getenv("RATE_LIMIT_BACKEND", config.security.rate_limit_backend)
+        config.security.rate_limit_shared_path = os.getenv(
+            "RATE_LIMIT_SHARED_PATH", config.security.rate_limit_shared_path
+        )
+        config.security.jwt_private_key_path = os.getenv("JWT_PRIVATE_KEY_PATH", config.security.jwt_private_key_path)
+        config.security.jwt_public_key_path = os.getenv("JWT_PUBLIC_KEY_PATH", config.security.jwt_public_key_path)
+        config.security.key_rotation_interval = int(
+            os.getenv("KEY_ROTATION_INTERVAL", str(config.security.key_rotation_interval))
+        )
         
         # Token Management Security Configuration (New in v0.6.0)
         config.security.enable_http_token_management = (
@@ -533,6 +588,17 @@ class DorisConfig:
         config.performance.max_response_content_size = int(
             os.getenv("MAX_RESPONSE_CONTENT_SIZE", str(config.performance.max_response_content_size))
         )
+        config.performance.response_encoder = os.getenv("RESPONSE_ENCODER", config.performance.response_encoder)
+        config.performance.result_spool_ttl = int(
+            os.getenv("RESULT_SPOOL_TTL", str(config.performance.result_spool_ttl))
+        )
+        config.performance.result_spool_max_entries = int(
+            os.getenv("RESULT_SPOOL_MAX_ENTRIES", str(config.performance.result_spool_max_entries))
+        )
+        config.performance.result_spool_dir = os.getenv("RESULT_SPOOL_DIR", config.performance.result_spool_dir)
+        config.performance.result_spool_disk_quota_mb = int(
+            os.getenv("RESULT_SPOOL_DISK_QUOTA_MB", str(config.performance.result_spool_disk_quota_mb))
+        )
         
         # Table and column filtering configuration
         config.performance.table_filter_include = os.getenv("TABLE_FILTER_INCLUDE", config.performance.table_filter_include)
@@ -555,6 +621,15 @@ class DorisConfig:
         config.logging.cleanup_interval_hours = int(
             os.getenv("LOG_CLEANUP_INTERVAL_HOURS", str(config.logging.cleanup_interval_hours))
         )
+        config.logging.enable_async = (
+            os.getenv("LOG_ASYNC", str(config.logging.enable_async).lower()).lower() == "true"
+        )
+        config.logging.hot_path_sample_rate = float(
+            os.getenv("LOG_HOT_PATH_SAMPLE_RATE", str(config.logging.hot_path_sample_rate))
+        )
+        config.logging.hot_path_max_per_second = int(
+            os.getenv("LOG_HOT_PATH_MAX_PER_SECOND", str(config.logging.hot_path_max_per_second))
+        )
 
         # Monitoring configuration
         config.monitoring.enable_metrics = (
@@ -563,6 +638,26 @@ class DorisConfig:
         config.monitoring.metrics_port = int(
             os.getenv("METRICS_PORT", str(config.monitoring.metrics_port))
         )
+        config.monitoring.metrics_path = os.getenv("METRICS_PATH", config.monitoring.metrics_path)
+        config.monitoring.scrape_concurrency = int(
+            os.getenv("METRICS_SCRAPE_CONCURRENCY", str(config.monitoring.scrape_concurrency))
+        )
+        config.monitoring.scrape_timeout = int(
+            os.getenv("METRICS_SCRAPE_TIMEOUT", str(config.monitoring.scrape_timeout))
+        )
+        config.monitoring.collector_enabled = (
+            os.getenv("METRICS_COLLECTOR_ENABLED", str(config.monitoring.collector_enabled).lower()).lower() == "true"
+        )
+        config.monitoring.collector_interval = int(
+            os.getenv("METRICS_COLLECTOR_INTERVAL", str(config.monitoring.collector_interval))
+        )
+        config.monitoring.collector_retention = int(
+            os.getenv("METRICS_COLLECTOR_RETENTION", str(config.monitoring.collector_retention))
+        )
+        config.monitoring.trace_sample_rate = float(
+            os.getenv("TRACE_SAMPLE_RATE", str(config.monitoring.trace_sample_rate))
+        )
+        config.monitoring.trace_exporter = os.getenv("TRACE_EXPORTER", config.monitoring.trace_exporter).lower()
         config.monitoring.health_check_port = int(
             os.getenv("HEALTH_CHECK_PORT", str(config.monitoring.health_check_port))
         )
@@ -582,6 +677,18 @@ class DorisConfig:
         config.adbc.connection_timeout = int(
             os.getenv("ADBC_CONNECTION_TIMEOUT", str(config.adbc.connection_timeout))
         )
+        config.adbc.pool_size = int(
+            os.getenv("ADBC_POOL_SIZE", str(config.adbc.pool_size))
+        )
+        config.adbc.pool_idle_timeout = int(
+            os.getenv("ADBC_POOL_IDLE_TIMEOUT", str(config.adbc.pool_idle_timeout))
+        )
+        config.adbc.port_check_ttl = int(
+            os.getenv("ADBC_PORT_CHECK_TTL", str(config.adbc.port_check_ttl))
+        )
+        config.adbc.fetch_concurrency = int(
+            os.getenv("ADBC_FETCH_CONCURRENCY", str(config.adbc.fetch_concurrency))
+        )
         config.adbc.enabled = (
             os.getenv("ADBC_ENABLED", str(config.adbc.enabled).lower()).lower() == "true"
         )
@@ -723,6 +830,9 @@ class DorisConfig:
             "enable_jwt_auth": self.security.enable_jwt_auth,
             "enable_oauth_auth": self.security.enable_oauth_auth,
             "enable_basic_auth": self.security.enable_basic_auth,
+            "jwt_private_key_path": self.security.jwt_private_key_path,
+            "jwt_public_key_path": self.security.jwt_public_key_path,
+            "key_rotation_interval": self.security.key_rotation_interval,
             "token_secret": "***",  # Hide secret key
             "token_expiry": self.security.token_expiry,
             "enable_security_check": self.security.enable_security_check,
@@ -743,6 +853,7 @@ class DorisConfig:
             "connection_pool_size": self.performance.connection_pool_size,
             "idle_timeout": self.performance.idle_timeout,
             "max_response_content_size": self.performance.max_response_content_size,
+            "response_encoder": self.performance.response_encoder,
         },
         "data_quality": {
             "max_columns_per_batch": self.data_quality.max_columns_per_batch,
@@ -768,11 +879,21 @@ class DorisConfig:
             "enable_cleanup": self.logging.enable_cleanup,
             "max_age_days": self.logging.max_age_days,
             "cleanup_interval_hours": self.logging.cleanup_interval_hours,
+            "enable_async": self.logging.enable_async,
+            "hot_path_sample_rate": self.logging.hot_path_sample_rate,
+            "hot_path_max_per_second": self.logging.hot_path_max_per_second,
         },
         "monitoring": {
             "enable_metrics": self.monitoring.enable_metrics,
             "metrics_port": self.monitoring.metrics_port,
             "metrics_path": self.monitoring.metrics_path,
+            "scrape_concurrency": self.monitoring.scrape_concurrency,
+            "scrape_timeout": self.monitoring.scrape_timeout,
+            "collector_enabled": self.monitoring.collector_enabled,
+            "collector_interval": self.monitoring.collector_interval,
+            "collector_retention": self.monitoring.collector_retention,
+            "trace_sample_rate": self.monitoring.trace_sample_rate,
+            "trace_exporter": self.monitoring.trace_exporter,
             "health_check_port": self.monitoring.health_check_port,
             "health_check_path": self.monitoring.health_check_path,
             "enable_alerts": self.monitoring.enable_alerts,
@@ -783,6 +904,10 @@ class DorisConfig:
             "default_timeout": self.adbc.default_timeout,
             "default_return_format": self.adbc.default_return_format,
             "connection_timeout": self.adbc.connection_timeout,
+            "pool_size": self.adbc.pool_size,
+            "pool_idle_timeout": self.adbc.pool_idle_timeout,
+            "port_check_ttl": self.adbc.port_check_ttl,
+            "fetch_concurrency": self.adbc.fetch_concurrency,
             "enabled": self.adbc.enabled,
         },
         "custom": self.custom_config,
@@ -833,6 +958,9 @@ class DorisConfig:
         if self.security.max_result_rows <= 0:
             errors.append("Maximum result rows must be greater than 0")
 
+        if self.security.key_rotation_interval < 0:
+            errors.append("Key rotation interval must be non-negative")
+
         # Validate performance configuration
         if self.performance.cache_ttl <= 0:
             errors.append("Cache TTL must be greater than 0")
@@ -883,11 +1011,38 @@ class DorisConfig:
         
         if self.logging.cleanup_interval_hours <= 0:
             errors.append("Log cleanup interval hours must be greater than 0")
+        
+        if not (0.0 <= self.logging.hot_path_sample_rate <= 1.0):
+            errors.append("Hot path log sample rate must be in the range 0-1")
+        
+        if self.logging.hot_path_max_per_second < 0:
+            errors.append("Hot path log rate limit cannot be negative")
 
         # Validate monitoring configuration
         if not (1 <= self.monitoring.metrics_port <= 65535):
             errors.append("Monitoring port must be in the range 1-65535")
 
+        if not self.monitoring.metrics_path.startswith("/"):
+            errors.append("Metrics path must start with '/'")
+
+        if self.monitoring.scrape_concurrency <= 0:
+            errors.append("Metrics scrape concurrency must be greater than 0")
+
+        if self.monitoring.scrape_timeout <= 0:
+            errors.append("Metrics scrape timeout must be greater than 0")
+
+        if self.monitoring.collector_interval <= 0:
+            errors.append("Metrics collector interval must be greater than 0")
+
+        if self.monitoring.collector_retention < self.monitoring.collector_interval:
+            errors.append("Metrics collector retention must be at least one interval")
+
+        if not (0.0 <= self.monitoring.trace_sample_rate <= 1.0):
+            errors.append("Trace sample rate must be between 0.0 and 1.0")
+
+        if self.monitoring.trace_exporter not in ("none", "log", "otel"):
+            errors.append("Trace exporter must be one of: none, log, otel")
+
         if not (1 <= self.monitoring.health_check_port <= 65535):
             errors.append("Health check port must be in the range 1-65535")
 
@@ -904,6 +1059,18 @@ class DorisConfig:
         if self.adbc.connection_timeout <= 0:
             errors.append("ADBC connection timeout must be greater than 0")
 
+        if self.adbc.pool_size <= 0:
+            errors.append("ADBC pool size must be greater than 0")
+
+        if self.adbc.pool_idle_timeout <= 0:
+            errors.append("ADBC pool idle timeout must be greater than 0")
+
+        if self.adbc.port_check_ttl < 0:
+            errors.append("ADBC port check TTL cannot be negative")
+
+        if self.adbc.fetch_concurrency <= 0:
+            errors.append("ADBC fetch concurrency must be greater than 0")
+
         return errors
 
     def get_connection_string(self) -> str:
@@ -1097,7 +1264,10 @@ class ConfigManager:
             backup_count=self.config.logging.backup_count,
             enable_cleanup=self.config.logging.enable_cleanup,
             max_age_days=self.config.logging.max_age_days,
-            cleanup_interval_hours=self.config.logging.cleanup_interval_hours
+            cleanup_interval_hours=self.config.logging.cleanup_interval_hours,
+            enable_async=self.config.logging.enable_async,
+            hot_path_sample_rate=self.config.logging.hot_path_sample_rate,
+            hot_path_max_per_second=self.config.logging.hot_path_max_per_second
         )
         
         # Update logger to use new system
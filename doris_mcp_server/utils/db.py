@@ -34,6 +34,8 @@ import aiomysql
 from aiomysql import Connection, Pool
 
 from .logger import get_logger
+from .server_metrics import POOL_ACQUIRE_SECONDS
+from .tracing import record_span, span
 
 
 
@@ -98,22 +100,23 @@ class DorisConnection:
                 }
 
             async with self.connection.cursor(aiomysql.DictCursor) as cursor:
-                await cursor.execute(sql, params)
-
-                # Check if it's a query statement (statement that returns result set)
-                # FIX for Issue #62 Bug 5: Added WITH support for Common Table Expressions (CTE)
-                sql_upper = sql.strip().upper()
-                if (sql_upper.startswith("SELECT") or
-                    sql_upper.startswith("SHOW") or
-                    sql_upper.startswith("DESCRIBE") or
-                    sql_upper.startswith("DESC") or
-                    sql_upper.startswith("EXPLAIN") or
-                    sql_upper.startswith("WITH")):  # FIX: Support CTE queries
-                    data = await cursor.fetchall()
-                    row_count = len(data)
-                else:
-                    data = []
-                    row_count = cursor.rowcount
+                with span("doris_execute"):
+                    await cursor.execute(sql, params)
+
+                    # Check if it's a query statement (statement that returns result set)
+                    # FIX for Issue #62 Bug 5: Added WITH support for Common Table Expressions (CTE)
+                    sql_upper = sql.strip().upper()
+                    if (sql_upper.startswith("SELECT") or
+                        sql_upper.startswith("SHOW") or
+                        sql_upper.startswith("DESCRIBE") or
+                        sql_upper.startswith("DESC") or
+                        sql_upper.startswith("EXPLAIN") or
+                        sql_upper.startswith("WITH")):  # FIX: Support CTE queries
+                        data = await cursor.fetchall()
+                        row_count = len(data)
+                    else:
+                        data = []
+                        row_count = cursor.rowcount
 
                 execution_time = time.time() - start_time
                 self.last_used = datetime.utcnow()
@@ -291,6 +294,8 @@ class DorisConnectionManager:
         # Connection pool state management
         self.pool_recovering = False
         self.pool_health_check_task = None
+        self._init_task = None  # Background initialization started by start_background_initialization
+        self._warmup_task = None
         self._health_check_in_progress = False  # Flag to prevent concurrent health checks
         
         # Metrics tracking
@@ -302,6 +307,7 @@ class DorisConnectionManager:
         
         # 🔧 FIX: Add connection acquisition queue to serialize requests
         self._connection_semaphore = asyncio.Semaphore(value=20)  # Max concurrent acquisitions
+        self.acquire_waiting = 0  # Callers currently waiting in get_connection()
         
         # Database connection parameters from config.database
         self.pool_recovery_lock = self._recovery_lock  # Compatibility alias
@@ -375,7 +381,9 @@ class DorisConnectionManager:
                 "in .env file (DB_HOST, DB_USER, etc.)"
             )
 
-    async def _initialize_connection_pool(self, timeout: float, mode: str, strict: bool = False) -> bool:
+    async def _initialize_connection_pool(
+        self, timeout: float, mode: str, strict: bool = False, background_warmup: bool = False
+    ) -> bool:
         """
         Internal method to initialize connection pool with configurable parameters
         
@@ -383,6 +391,8 @@ class DorisConnectionManager:
             timeout: Maximum time to wait for connection establishment
             mode: Mode identifier for logging ("stdio" or "http")
             strict: If True, raises exceptions on failure; if False, returns False on failure
+            background_warmup: If True, the pool is reported ready once it passes the health
+                test and warmup continues in a background task
             
         Returns:
             bool: True if initialization succeeded, False otherwise
@@ -470,7 +480,10 @@ class DorisConnectionManager:
                 return False
             
             # Perform initial pool warmup
-            await self._warmup_pool()
+            if background_warmup:
+                self._warmup_task = asyncio.create_task(self._warmup_pool())
+            else:
+                await self._warmup_pool()
 
             # Start background monitoring tasks
             self.pool_health_check_task = asyncio.create_task(self._pool_health_monitor())
@@ -500,6 +513,60 @@ class DorisConnectionManager:
             RuntimeError: If configuration is invalid or connection fails
         """
         success = await self._initialize_connection_pool(timeout, "stdio", strict=True)
+
+    def start_background_initialization(self, timeout: float = 30.0, mode: str = "stdio") -> None:
+        """
+        Validate configuration and initialize the connection pool in the background
+        
+        The configuration is checked immediately so that a misconfigured server still
+        fails at startup. Connectivity testing, pool creation and warmup run in a task;
+        get_connection() waits for it, so only callers that need a connection before it
+        finishes are delayed.
+        
+        Args:
+            timeout: Maximum time to wait for connection establishment
+            mode: Mode identifier for logging
+            
+        Raises:
+            RuntimeError: If the database configuration is invalid
+        """
+        is_valid, error_message = self.validate_database_configuration()
+        if not is_valid:
+            self.logger.error(f"{mode} mode database initialization failed: {error_message}")
+            raise RuntimeError(error_message)
+
+        self._init_task = asyncio.create_task(
+            self._initialize_connection_pool(timeout, mode, strict=True, background_warmup=True)
+        )
+        self._init_task.add_done_callback(self._on_background_initialization_done)
+
+    def _on_background_initialization_done(self, task: asyncio.Task) -> None:
+        """Retrieve the outcome so a failure nobody waited for is not reported as unhandled"""
+        if not task.cancelled() and task.exception() is None:
+            self.logger.info("Background database initialization completed")
+
+    async def wait_until_ready(self) -> None:
+        """
+        Wait for the background initialization, if one is still pending
+        
+        Raises:
+            RuntimeError: If the background initialization failed. Later calls fall
+                back to the regular pool recovery path.
+        """
+        init_task = self._init_task
+        if init_task is None:
+            return
+        try:
+            await asyncio.shield(init_task)
+        except asyncio.CancelledError:
+            if not init_task.cancelled():
+                raise
+            raise RuntimeError("Database initialization was cancelled")
+        except Exception as e:
+            raise RuntimeError(f"Database initialization failed: {e}") from e
+        finally:
+            if init_task.done() and self._init_task is init_task:
+                self._init_task = None
     
     async def initialize_for_http_mode(self) -> bool:
         success = await self._initialize_connection_pool(10.0, "HTTP", strict=True)
@@ -900,6 +967,10 @@ class DorisConnectionManager:
         Uses only semaphore to prevent too many concurrent acquisitions.
         If the connection is successfully obtained, it will be added to the connection pool cache.
         """
+        # Wait for a pending background initialization (stdio fast startup)
+        if self._init_task is not None:
+            await self.wait_until_ready()
+
         # # 🔧 TEST: Add mock error log for testing diagnosis UI
         # self.log_connection_error(
         #     'test_error',
@@ -911,6 +982,17 @@ class DorisConnectionManager:
         if cached_conn:
             return cached_conn
 
+        self.acquire_waiting += 1
+        started = time.perf_counter()
+        try:
+            return await self._acquire_connection(session_id)
+        finally:
+            self.acquire_waiting -= 1
+            POOL_ACQUIRE_SECONDS.observe_since(started)
+            record_span("pool_acquire", started)
+
+    async def _acquire_connection(self, session_id: str) -> DorisConnection:
+        """Take a connection from the pool, recovering the pool when needed"""
         # 🔧 FIX: Use only semaphore to limit concurrent acquisitions (remove double locking)
         async with self._connection_semaphore:
             try:
@@ -1181,6 +1263,15 @@ class DorisConnectionManager:
         """Close connection manager"""
         try:
             # Cancel background tasks
+            for task in (self._init_task, self._warmup_task):
+                if task and not task.done():
+                    task.cancel()
+                    try:
+                        await task
+                    except (asyncio.CancelledError, Exception):
+                        pass
+            self._init_task = None
+
             if self.pool_health_check_task:
                 self.pool_health_check_task.cancel()
                 try:
@@ -0,0 +1,65 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Shared HTTP Client
+
+One keep-alive aiohttp ClientSession for requests to the FE and BE web
+servers (metrics endpoints), so repeated scrapes reuse TCP connections
+instead of opening a session per request. aiohttp is imported on first use.
+"""
+
+import asyncio
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# Connections kept per FE/BE host and how long an idle one stays open (seconds)
+HTTP_CONNECTIONS_PER_HOST = 4
+HTTP_KEEPALIVE_TIMEOUT = 60
+
+_session = None
+_session_loop = None
+
+
+async def get_http_session():
+    """Return the shared ClientSession, creating it for the running event loop"""
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        import aiohttp
+
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=0,  # fan-out is bounded by the callers
+                limit_per_host=HTTP_CONNECTIONS_PER_HOST,
+                keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            )
+        )
+        _session_loop = loop
+    return _session
+
+
+async def close_http_session() -> None:
+    """Close the shared ClientSession, if one was created"""
+    global _session, _session_loop
+    session, _session, _session_loop = _session, None, None
+    if session is not None and not session.closed:
+        try:
+            await session.close()
+        except Exception as e:
+            logger.debug(f"Error closing shared HTTP session: {e}")
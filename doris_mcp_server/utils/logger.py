@@ -21,11 +21,16 @@ Features:
 - Timestamped log entries
 - Automatic log rotation
 - Comprehensive logging coverage
+- Asynchronous queue-based handlers so callers never block on disk writes
+- Sampled, rate-limited logging for per-request hot paths
 """
 
+import atexit
 import logging
 import logging.config
 import logging.handlers
+import queue
+import random
 import sys
 import os
 import asyncio
@@ -128,6 +133,65 @@ class LevelBasedFileHandler(logging.Handler):
         super().close()
 
 
+class HotPathLogger:
+    """
+    Sampled, rate-limited logger for messages emitted on every request.
+    
+    Records are kept with probability ``sample_rate`` and at most
+    ``max_per_second`` are emitted per second (0 disables the limit). The
+    number of suppressed records is appended to the next emitted one. Message
+    arguments are only formatted for records that are actually emitted.
+    """
+    
+    def __init__(self, logger: logging.Logger, sample_rate: float = 1.0, max_per_second: int = 0):
+        self.logger = logger
+        self.sample_rate = sample_rate
+        self.max_per_second = max_per_second
+        self._window = 0
+        self._emitted = 0
+        self._suppressed = 0
+        self._lock = threading.Lock()
+    
+    def _admit(self) -> int:
+        """Return -1 to drop the record, otherwise the suppressed count to report"""
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return -1
+        if self.max_per_second <= 0:
+            return 0
+        window = int(time.monotonic())
+        with self._lock:
+            if window != self._window:
+                self._window = window
+                self._emitted = 0
+            if self._emitted >= self.max_per_second:
+                self._suppressed += 1
+                return -1
+            self._emitted += 1
+            suppressed, self._suppressed = self._suppressed, 0
+            return suppressed
+    
+    def _log(self, level: int, msg: str, args: tuple, kwargs: dict):
+        if not self.logger.isEnabledFor(level):
+            return
+        suppressed = self._admit()
+        if suppressed < 0:
+            return
+        if suppressed:
+            msg = f"{msg} ({suppressed} similar messages suppressed)"
+        # Attribute the record to the caller of debug()/info()/log()
+        kwargs.setdefault("stacklevel", 3)
+        self.logger.log(level, msg, *args, **kwargs)
+    
+    def log(self, level: int, msg: str, *args, **kwargs):
+        self._log(level, msg, args, kwargs)
+    
+    def debug(self, msg: str, *args, **kwargs):
+        self._log(logging.DEBUG, msg, args, kwargs)
+    
+    def info(self, msg: str, *args, **kwargs):
+        self._log(logging.INFO, msg, args, kwargs)
+
+
 class LogCleanupManager:
     """Log file cleanup manager for automatic maintenance"""
     
@@ -286,6 +350,10 @@ class DorisLoggerManager:
         self.config = None
         self.loggers = {}
         self.cleanup_manager = None
+        self.listeners = []
+        self.hot_path_sample_rate = 1.0
+        self.hot_path_max_per_second = 0
+        self.hot_path_loggers = {}
     
     def setup_logging(self, 
                      level: str = "INFO",
@@ -298,7 +366,10 @@ class DorisLoggerManager:
                      backup_count: int = 5,
                      enable_cleanup: bool = True,
                      max_age_days: int = 30,
-                     cleanup_interval_hours: int = 24) -> None:
+                     cleanup_interval_hours: int = 24,
+                     enable_async: bool = True,
+                     hot_path_sample_rate: float = 1.0,
+                     hot_path_max_per_second: int = 0) -> None:
         """
         Setup comprehensive logging configuration.
         
@@ -314,10 +385,19 @@ class DorisLoggerManager:
             enable_cleanup: Enable automatic log cleanup
             max_age_days: Maximum age of log files in days (default: 30)
             cleanup_interval_hours: Cleanup interval in hours (default: 24)
+            enable_async: Write records from a background QueueListener thread
+            hot_path_sample_rate: Fraction of hot-path records kept (default: 1.0)
+            hot_path_max_per_second: Hot-path records emitted per second per logger, 0 for no limit
         """
         if self.is_initialized:
             return
         
+        self.hot_path_sample_rate = hot_path_sample_rate
+        self.hot_path_max_per_second = hot_path_max_per_second
+        for hot_path_logger in self.hot_path_loggers.values():
+            hot_path_logger.sample_rate = hot_path_sample_rate
+            hot_path_logger.max_per_second = hot_path_max_per_second
+        
         self.log_dir = Path(log_dir)
         log_dir_writable = True  # Initialize the variable
         
@@ -402,12 +482,15 @@ class DorisLoggerManager:
                 datefmt="%Y-%m-%d %H:%M:%S"
             )
             mcp_handler.setFormatter(mcp_formatter)
-            mcp_logger.addHandler(mcp_handler)
+            mcp_logger.addHandler(self._queue_handlers([mcp_handler]) if enable_async else mcp_handler)
             mcp_logger.propagate = False  # Don't propagate to root logger
         
         # Add all handlers to root logger
-        for handler in handlers:
-            root_logger.addHandler(handler)
+        if enable_async and handlers:
+            root_logger.addHandler(self._queue_handlers(handlers))
+        else:
+            for handler in handlers:
+                root_logger.addHandler(handler)
         
         # Setup package-specific loggers
         self._setup_package_loggers(level)
@@ -434,6 +517,7 @@ class DorisLoggerManager:
             logger.info("Log Directory: Not available (console-only mode)")
         logger.info(f"Console Logging: {'Enabled' if enable_console else 'Disabled'}")
         logger.info(f"File Logging: {'Enabled' if enable_file else 'Disabled (fallback mode)'}")
+        logger.info(f"Async Logging: {'Enabled' if enable_async else 'Disabled'}")
         logger.info(f"Audit Logging: {'Enabled' if enable_audit else 'Disabled (fallback mode)'}")
         logger.info(f"Log Cleanup: {'Enabled' if enable_cleanup and enable_file else 'Disabled (fallback mode)'}")
         if enable_cleanup and enable_file:
@@ -443,6 +527,38 @@ class DorisLoggerManager:
             logger.warning(f"Could not create log directory '{log_dir}' - stdio mode fallback enabled")
         logger.info("=" * 80)
     
+    def _queue_handlers(self, handlers: list) -> logging.Handler:
+        """
+        Move ``handlers`` behind a queue drained by a background listener thread.
+        
+        Returns the QueueHandler to attach in their place; formatting and file
+        I/O then happen on the listener thread instead of the logging caller.
+        """
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        if not self.listeners:
+            # Listener threads are daemons; drain their queues at interpreter exit
+            atexit.register(self._stop_listeners)
+        self.listeners.append((listener, handlers))
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(min(handler.level for handler in handlers))
+        return queue_handler
+    
+    def _stop_listeners(self):
+        """Drain the log queues and close the handlers behind them"""
+        while self.listeners:
+            listener, handlers = self.listeners.pop()
+            try:
+                listener.stop()
+            except Exception as e:
+                print(f"Error stopping log listener: {e}")
+            for handler in handlers:
+                try:
+                    handler.close()
+                except Exception as e:
+                    print(f"Error closing handler: {e}")
+    
     def _setup_package_loggers(self, level: str):
         """Setup specific loggers for different modules"""
         package_loggers = [
@@ -474,6 +590,25 @@ class DorisLoggerManager:
         
         return self.loggers[name]
     
+    def get_hot_path_logger(self, name: str) -> HotPathLogger:
+        """
+        Get a sampled, rate-limited logger for per-request messages.
+        
+        Args:
+            name: Logger name (usually __name__)
+            
+        Returns:
+            HotPathLogger wrapping the named logger
+        """
+        if name not in self.hot_path_loggers:
+            self.hot_path_loggers[name] = HotPathLogger(
+                self.get_logger(name),
+                sample_rate=self.hot_path_sample_rate,
+                max_per_second=self.hot_path_max_per_second,
+            )
+        
+        return self.hot_path_loggers[name]
+    
     def get_mcp_logger(self) -> logging.Logger:
         """Get the MCP logger"""
         return logging.getLogger("bimcp")
@@ -520,6 +655,9 @@ class DorisLoggerManager:
         if self.cleanup_manager:
             self.cleanup_manager.stop_cleanup_scheduler()
         
+        # Flush queued records before closing their handlers
+        self._stop_listeners()
+        
         # Close all handlers
         root_logger = logging.getLogger()
         for handler in root_logger.handlers[:]:
@@ -553,7 +691,10 @@ def setup_logging(level: str = "INFO",
                  backup_count: int = 5,
                  enable_cleanup: bool = True,
                  max_age_days: int = 30,
-                 cleanup_interval_hours: int = 24) -> None:
+                 cleanup_interval_hours: int = 24,
+                 enable_async: bool = True,
+                 hot_path_sample_rate: float = 1.0,
+                 hot_path_max_per_second: int = 0) -> None:
     """
     Setup logging configuration (convenience function).
     
@@ -569,6 +710,9 @@ def setup_logging(level: str = "INFO",
         enable_cleanup: Enable automatic log cleanup
         max_age_days: Maximum age of log files in days (default: 30)
         cleanup_interval_hours: Cleanup interval in hours (default: 24)
+        enable_async: Write records from a background QueueListener thread
+        hot_path_sample_rate: Fraction of hot-path records kept (default: 1.0)
+        hot_path_max_per_second: Hot-path records emitted per second per logger, 0 for no limit
     """
     _logger_manager.setup_logging(
         level=level,
@@ -581,7 +725,10 @@ def setup_logging(level: str = "INFO",
         backup_count=backup_count,
         enable_cleanup=enable_cleanup,
         max_age_days=max_age_days,
-        cleanup_interval_hours=cleanup_interval_hours
+        cleanup_interval_hours=cleanup_interval_hours,
+        enable_async=enable_async,
+        hot_path_sample_rate=hot_path_sample_rate,
+        hot_path_max_per_second=hot_path_max_per_second
     )
 
 
@@ -598,6 +745,11 @@ def get_logger(name: str) -> logging.Logger:
     return _logger_manager.get_logger(name)
 
 
+def get_hot_path_logger(name: str) -> HotPathLogger:
+    """Get a sampled, rate-limited logger for per-request messages"""
+    return _logger_manager.get_hot_path_logger(name)
+
+
 def get_audit_logger() -> logging.Logger:
     """Get the audit logger"""
     return _logger_manager.get_audit_logger()
@@ -0,0 +1,260 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Background Metrics Collector
+
+Scrapes the FE and BE ``/metrics`` endpoints on a fixed interval and keeps
+the samples of every collected series in a bounded ring buffer. Monitoring
+tool calls are answered from the latest scrape instead of re-scraping every
+node, counter rates are computed from real deltas between scrapes, and
+memory history is read back from the buffered samples.
+
+Only the metrics the monitoring tools use (P0 and dashboard metrics) are
+kept, so memory stays bounded at roughly
+``series x retention / interval x 16`` bytes.
+"""
+
+import asyncio
+import time
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# Series key: (node key, metric name, sorted label pairs)
+SeriesKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+class SeriesRing:
+    """Fixed-capacity ring buffer of (timestamp, value) samples"""
+
+    __slots__ = ("capacity", "_times", "_values", "_next", "_count")
+
+    def __init__(self, capacity: int):
+        self.capacity = max(2, capacity)
+        self._times = array("d", bytes(8 * self.capacity))
+        self._values = array("d", bytes(8 * self.capacity))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp: float, value: float) -> None:
+        self._times[self._next] = timestamp
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def samples(self, since: float = 0.0) -> List[Tuple[float, float]]:
+        """Samples taken at or after ``since``, oldest first"""
+        start = (self._next - self._count) % self.capacity
+        result = []
+        for offset in range(self._count):
+            index = (start + offset) % self.capacity
+            if self._times[index] >= since:
+                result.append((self._times[index], self._values[index]))
+        return result
+
+    def latest(self, n: int = 1) -> List[Tuple[float, float]]:
+        """The last ``n`` samples, oldest first"""
+        n = min(n, self._count)
+        return [
+            (self._times[(self._next - i) % self.capacity], self._values[(self._next - i) % self.capacity])
+            for i in range(n, 0, -1)
+        ]
+
+    def rate(self) -> Optional[float]:
+        """Per-second increase between the last two samples
+
+        A drop in value is treated as a counter reset (node restart), in which
+        case the new value is the increase since the reset.
+        """
+        if self._count < 2:
+            return None
+        (t0, v0), (t1, v1) = self.latest(2)
+        if t1 <= t0:
+            return None
+        delta = v1 - v0 if v1 >= v0 else v1
+        return delta / (t1 - t0)
+
+
+class MetricsCollector:
+    """Periodic FE/BE scraper backed by per-series ring buffers"""
+
+    def __init__(self, monitoring_tools, interval: int = 15, retention: int = 3600):
+        """
+        Args:
+            monitoring_tools: DorisMonitoringTools used to discover and scrape nodes
+            interval: Seconds between scrapes
+            retention: Seconds of samples kept per series
+        """
+        self.monitoring_tools = monitoring_tools
+        self.interval = max(1, interval)
+        self.retention = max(self.interval, retention)
+        self.capacity = self.retention // self.interval + 1
+        self._series: Dict[SeriesKey, SeriesRing] = {}
+        # Latest scrape result per node, keyed by role then node key
+        self._snapshots: Dict[str, Dict[str, Dict[str, Any]]] = {"fe": {}, "be": {}}
+        self._task: Optional[asyncio.Task] = None
+        self.last_collected_at: Optional[float] = None
+        self.collections = 0
+        self.failures = 0
+
+    def start(self) -> None:
+        """Start collecting in the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="metrics-collector")
+            logger.info(
+                f"Metrics collector started (interval {self.interval}s, retention {self.retention}s)"
+            )
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def is_fresh(self) -> bool:
+        """True when the last scrape finished within two intervals"""
+        return (
+            self.last_collected_at is not None
+            and time.time() - self.last_collected_at <= 2 * self.interval
+        )
+
+    async def _run(self) -> None:
+        while True:
+            started = time.monotonic()
+            try:
+                await self.collect_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                logger.warning(f"Metrics collection failed: {e}")
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+    async def collect_once(self) -> None:
+        """Scrape every FE and BE node once and record the samples"""
+        fe_result, be_results = await asyncio.gather(
+            self.monitoring_tools.scrape_fe_node(self.monitoring_tools.collected_metric_names("fe")),
+            self.monitoring_tools.scrape_be_nodes(self.monitoring_tools.collected_metric_names("be")),
+        )
+        collected_at = time.time()
+        fe_snapshots = {}
+        be_snapshots = {}
+        for role, results, snapshots in (("fe", [fe_result], fe_snapshots), ("be", be_results, be_snapshots)):
+            for result in results:
+                node_key = node_key_for(role, result.get("node_info") or {})
+                snapshots[node_key] = result
+                if result.get("success"):
+                    self._record(node_key, result.get("metrics") or {}, collected_at)
+        self._snapshots = {"fe": fe_snapshots, "be": be_snapshots}
+        self._prune(collected_at - self.retention)
+        self.last_collected_at = collected_at
+        self.collections += 1
+
+    def _record(self, node_key: str, metrics: Dict[str, Any], timestamp: float) -> None:
+        for name, value in metrics.items():
+            if isinstance(value, list):
+                for sample in value:
+                    self._append((node_key, name, tuple(sorted(sample["labels"].items()))), timestamp, sample["value"])
+            else:
+                self._append((node_key, name, ()), timestamp, value)
+
+    def _append(self, key: SeriesKey, timestamp: float, value) -> None:
+        ring = self._series.get(key)
+        if ring is None:
+            ring = self._series[key] = SeriesRing(self.capacity)
+        ring.append(timestamp, float(value))
+
+    def _prune(self, before: float) -> None:
+        # Drop series of nodes or label values that have not been seen for a full retention period
+        stale = [key for key, ring in self._series.items() if ring.latest()[0][0] < before]
+        for key in stale:
+            del self._series[key]
+
+    def snapshots(self, role: str) -> List[Dict[str, Any]]:
+        """Copies of the latest scrape results for ``role`` ("fe" or "be")"""
+        return [dict(result) for result in self._snapshots.get(role, {}).values()]
+
+    def matching_series(
+        self, node_key: Optional[str], name: str, labels: Optional[Dict[str, str]] = None
+    ) -> Iterable[Tuple[SeriesKey, SeriesRing]]:
+        """Series of metric ``name`` whose labels include ``labels``, optionally on one node"""
+        for key, ring in self._series.items():
+            if key[1] != name or (node_key is not None and key[0] != node_key):
+                continue
+            if labels:
+                series_labels = dict(key[2])
+                if any(series_labels.get(k) != v for k, v in labels.items()):
+                    continue
+            yield key, ring
+
+    def rate(self, node_key: str, name: str, labels: Optional[Dict[str, str]] = None) -> Optional[float]:
+        """Per-second rate of a counter on one node
+
+        With ``labels`` the first matching series is used; without, the rates of
+        all series of the metric are summed (mirroring the current-value lookup).
+        """
+        rates = []
+        for _, ring in self.matching_series(node_key, name, labels):
+            value = ring.rate()
+            if value is not None:
+                rates.append(value)
+                if labels:
+                    break
+        return sum(rates) if rates else None
+
+    def history(
+        self, name: str, window: float, labels: Optional[Dict[str, str]] = None, role: Optional[str] = None
+    ) -> Dict[SeriesKey, List[Tuple[float, float]]]:
+        """Samples of metric ``name`` from the last ``window`` seconds, per series"""
+        since = time.time() - window
+        prefix = f"{role}:" if role else ""
+        return {
+            key: ring.samples(since)
+            for key, ring in self.matching_series(None, name, labels)
+            if key[0].startswith(prefix)
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "interval": self.interval,
+            "retention": self.retention,
+            "series": len(self._series),
+            "collections": self.collections,
+            "failures": self.failures,
+            "last_collected_at": self.last_collected_at,
+        }
+
+
+def node_key_for(role: str, node_info: Dict[str, Any]) -> str:
+    """Stable key of a node across scrapes: ``role:host:port``"""
+    port = node_info.get("http_port") or node_info.get("port")
+    return f"{role}:{node_info.get('host')}:{port}"
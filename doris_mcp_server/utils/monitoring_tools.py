@@ -20,18 +20,36 @@ Provides monitoring and metrics collection functions for FE and BE nodes
 """
 
 import re
-import aiohttp
 import asyncio
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from .db import DorisConnectionManager
+from .http_client import get_http_session
 from .logger import get_logger
+from .metrics_collector import MetricsCollector, node_key_for
+from .prometheus_parser import PrometheusTextParser, parse_prometheus_text
 from .sql_security_utils import get_auth_context
 
 logger = get_logger(__name__)
 
+# Bytes read from a metrics response at a time
+METRICS_READ_CHUNK_SIZE = 64 * 1024
+
+# Metrics read by the dashboard calculations that are not P0 metrics; the
+# background collector keeps them too so their rates can be computed
+DASHBOARD_EXTRA_METRICS = {
+    "fe": (
+        "doris_fe_query_latency_ms", "doris_fe_request_total", "doris_fe_tablet_status_count",
+        "doris_fe_txn_counter", "doris_fe_editlog_write_latency_ms", "jvm_old_gc", "jvm_young_gc",
+    ),
+    "be": (
+        "doris_be_disks_local_used_capacity", "doris_be_disks_total_capacity",
+        "doris_be_stream_load", "doris_be_stream_load_txn_request",
+    ),
+}
+
 
 class P0MetricInfo:
     """P0级监控项信息类"""
@@ -681,6 +699,35 @@ class DorisMonitoringTools:
     
     def __init__(self, connection_manager: DorisConnectionManager):
         self.connection_manager = connection_manager
+        monitoring = connection_manager.config.monitoring
+        self.scrape_concurrency = max(1, monitoring.scrape_concurrency)
+        self.scrape_timeout = monitoring.scrape_timeout
+        # Background scraper serving P0 requests, rates and memory history (optional)
+        self.collector: Optional[MetricsCollector] = None
+        if monitoring.collector_enabled:
+            self.collector = MetricsCollector(
+                self, interval=monitoring.collector_interval, retention=monitoring.collector_retention
+            )
+
+    def start_collector(self) -> None:
+        """Start the background metrics collector, if enabled"""
+        if self.collector is not None:
+            self.collector.start()
+
+    async def close(self) -> None:
+        if self.collector is not None:
+            await self.collector.stop()
+
+    def collected_metric_names(self, role: str) -> List[str]:
+        """Metric names kept by the background collector for ``role``"""
+        p0_metrics = P0Metrics.get_fe_p0_metrics() if role == "fe" else P0Metrics.get_be_p0_metrics()
+        return list(p0_metrics) + list(DASHBOARD_EXTRA_METRICS[role])
+
+    def _collected_results(self, role: str, priority: str) -> Optional[List[Dict[str, Any]]]:
+        # The collector only keeps P0 and dashboard metrics, so "all" is always scraped live
+        if priority != "p0" or self.collector is None or not self.collector.is_fresh():
+            return None
+        return self.collector.snapshots(role)
     
     async def get_be_nodes(self) -> List[Dict[str, Any]]:
         """Get BE node information, prioritize configured be_hosts, fallback to SHOW BACKENDS"""
@@ -713,9 +760,9 @@ class DorisMonitoringTools:
             
             # Fallback to SHOW BACKENDS if no BE hosts configured
             logger.info("No BE hosts configured, using SHOW BACKENDS to discover BE nodes")
-            connection = await self.connection_manager.get_connection("query")
             auth_context = get_auth_context()
-            result = await connection.execute("SHOW BACKENDS", auth_context=auth_context)
+            async with self.connection_manager.get_connection_context("query") as connection:
+                result = await connection.execute("SHOW BACKENDS", auth_context=auth_context)
             
             be_nodes = []
             for row in result.data:
@@ -742,40 +789,61 @@ class DorisMonitoringTools:
             logger.error(f"Failed to get BE nodes: {str(e)}")
             return []
     
-    async def fetch_metrics_from_url(self, url: str, node_type: str, node_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Fetch monitoring metrics from specified URL"""
+    async def fetch_metrics_from_url(
+        self, url: str, node_type: str, node_info: Dict[str, Any], name_prefixes: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Fetch monitoring metrics from specified URL
+
+        The body is parsed as it streams in. When ``name_prefixes`` is given, only
+        metrics whose name starts with one of them are kept.
+        """
         try:
             # Get database configuration for authentication
             db_config = self.connection_manager.config.database
+            # aiohttp is imported on first use; it dominates module import time
+            import aiohttp
             auth = aiohttp.BasicAuth(db_config.user, db_config.password)
             
-            logger.info(f"Fetching metrics from {node_type} node: {url}")
+            timeout = aiohttp.ClientTimeout(total=self.scrape_timeout)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, auth=auth, timeout=30) as response:
-                    if response.status == 200:
-                        # Parse Prometheus format
-                        metrics_text = await response.text()
-                        metrics_data = self._parse_prometheus_metrics(metrics_text)
-                        
-                        return {
-                            "success": True,
-                            "node_type": node_type,
-                            "node_info": node_info,
-                            "metrics": metrics_data,
-                            "url": url,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                    else:
-                        logger.error(f"HTTP request failed with status {response.status} for {url}")
-                        return {
-                            "success": False,
-                            "error": f"HTTP {response.status}",
-                            "node_type": node_type,
-                            "node_info": node_info,
-                            "url": url
-                        }
+            logger.debug(f"Fetching metrics from {node_type} node: {url}")
+            
+            session = await get_http_session()
+            async with session.get(url, auth=auth, timeout=timeout) as response:
+                if response.status == 200:
+                    # Parse Prometheus format incrementally
+                    parser = PrometheusTextParser(name_prefixes)
+                    async for chunk in response.content.iter_chunked(METRICS_READ_CHUNK_SIZE):
+                        parser.feed(chunk)
+                    metrics_data = parser.close()
+                    
+                    return {
+                        "success": True,
+                        "node_type": node_type,
+                        "node_info": node_info,
+                        "metrics": metrics_data,
+                        "url": url,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                else:
+                    logger.error(f"HTTP request failed with status {response.status} for {url}")
+                    return {
+                        "success": False,
+                        "error": f"HTTP {response.status}",
+                        "node_type": node_type,
+                        "node_info": node_info,
+                        "url": url
+                    }
                         
+        except asyncio.TimeoutError:
+            logger.error(f"Timed out fetching metrics from {url} after {self.scrape_timeout}s")
+            return {
+                "success": False,
+                "error": f"Timed out after {self.scrape_timeout} seconds",
+                "node_type": node_type,
+                "node_info": node_info,
+                "url": url
+            }
         except Exception as e:
             logger.error(f"Failed to fetch metrics from {url}: {str(e)}")
             return {
@@ -788,60 +856,7 @@ class DorisMonitoringTools:
     
     def _parse_prometheus_metrics(self, metrics_text: str) -> Dict[str, Any]:
         """Parse Prometheus format monitoring metrics"""
-        metrics = {}
-        
-        for line in metrics_text.strip().split('\n'):
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            
-            # Parse format: metric_name{labels} value
-            try:
-                if '{' in line:
-                    # Metrics with labels
-                    metric_part, value_part = line.rsplit(' ', 1)
-                    metric_name = metric_part.split('{')[0]
-                    labels_part = metric_part[metric_part.find('{'):metric_part.rfind('}')+1]
-                    
-                    # Parse labels
-                    labels = {}
-                    labels_content = labels_part[1:-1]  # Remove {}
-                    if labels_content:
-                        for label_pair in labels_content.split(','):
-                            if '=' in label_pair:
-                                key, value = label_pair.split('=', 1)
-                                labels[key.strip()] = value.strip().strip('"')
-                    
-                    # Store metrics
-                    if metric_name not in metrics:
-                        metrics[metric_name] = []
-                    elif not isinstance(metrics[metric_name], list):
-                        # Convert existing single value to list format
-                        old_value = metrics[metric_name]
-                        metrics[metric_name] = [{"labels": {}, "value": old_value}]
-                    
-                    metrics[metric_name].append({
-                        "labels": labels,
-                        "value": float(value_part) if '.' in value_part else int(value_part)
-                    })
-                else:
-                    # Metrics without labels
-                    metric_name, value_part = line.rsplit(' ', 1)
-                    value = float(value_part) if '.' in value_part else int(value_part)
-                    
-                    # Check if this metric already exists as a list (with labels)
-                    if metric_name in metrics and isinstance(metrics[metric_name], list):
-                        # Add as an entry with empty labels
-                        metrics[metric_name].append({"labels": {}, "value": value})
-                    else:
-                        # Store as simple value
-                        metrics[metric_name] = value
-                    
-            except Exception as e:
-                logger.warning(f"Failed to parse metric line: {line}, error: {e}")
-                continue
-        
-        return metrics
+        return parse_prometheus_text(metrics_text)
     
     async def get_monitoring_metrics(
         self,
@@ -930,16 +945,16 @@ class DorisMonitoringTools:
                 
                 return result
             
-            # Get actual monitoring data
+            # Get actual monitoring data, scraping FE and BE nodes concurrently
+            scrapes = {}
             if role in ["fe", "all"]:
-                fe_data = await self._get_fe_metrics(monitor_type, priority, format_type, include_raw_metrics)
-                if fe_data:
-                    result["data"]["fe"] = fe_data
-            
+                scrapes["fe"] = self._get_fe_metrics(monitor_type, priority, format_type, include_raw_metrics)
             if role in ["be", "all"]:
-                be_data = await self._get_be_metrics(monitor_type, priority, format_type, include_raw_metrics)
-                if be_data:
-                    result["data"]["be"] = be_data
+                scrapes["be"] = self._get_be_metrics(monitor_type, priority, format_type, include_raw_metrics)
+            
+            for key, data in zip(scrapes, await asyncio.gather(*scrapes.values())):
+                if data:
+                    result["data"][key] = data
             
             return result
             
@@ -951,96 +966,115 @@ class DorisMonitoringTools:
                 "timestamp": datetime.now().isoformat()
             }
 
+    async def scrape_fe_node(self, name_prefixes: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Fetch the FE metrics page, keeping only ``name_prefixes`` when given"""
+        db_config = self.connection_manager.config.database
+        fe_url = f"http://{db_config.host}:{db_config.fe_http_port}/metrics"
+        return await self.fetch_metrics_from_url(
+            fe_url,
+            "fe",
+            {"host": db_config.host, "port": db_config.fe_http_port},
+            name_prefixes=name_prefixes
+        )
+
+    async def scrape_be_nodes(self, name_prefixes: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Fetch the metrics page of every alive BE node
+
+        Nodes are scraped concurrently, at most ``scrape_concurrency`` at a time,
+        each bounded by ``scrape_timeout``. A node that fails or times out is
+        reported as a failed entry alongside the others.
+        """
+        be_nodes = await self.get_be_nodes()
+        alive_nodes = [be_node for be_node in be_nodes if be_node.get("alive") == "true"]  # Only get alive BE nodes
+        semaphore = asyncio.Semaphore(self.scrape_concurrency)
+
+        async def scrape(be_node: Dict[str, Any]) -> Dict[str, Any]:
+            be_url = f"http://{be_node['host']}:{be_node['http_port']}/metrics"
+            async with semaphore:
+                return await self.fetch_metrics_from_url(be_url, "be", be_node, name_prefixes=name_prefixes)
+
+        return list(await asyncio.gather(*(scrape(be_node) for be_node in alive_nodes)))
+
     async def _get_fe_metrics(self, monitor_type: str, priority: str, format_type: str, include_raw_metrics: bool) -> Dict[str, Any]:
-        """Get FE monitoring metrics"""
+        """Get FE monitoring metrics, from the background collector when it is fresh"""
         try:
-            db_config = self.connection_manager.config.database
-            fe_url = f"http://{db_config.host}:{db_config.fe_http_port}/metrics"
-            
-            fe_result = await self.fetch_metrics_from_url(
-                fe_url, 
-                "fe", 
-                {"host": db_config.host, "port": db_config.fe_http_port}
-            )
-            
-            if fe_result.get("success") and priority == "p0":
-                fe_p0_metrics = self._get_metrics_by_type("fe", monitor_type)
-                fe_result["metrics"] = self._filter_p0_metrics(
-                    fe_result["metrics"], 
-                    fe_p0_metrics
-                )
-                fe_result["p0_metrics_info"] = {
-                    name: metric.to_dict() 
-                    for name, metric in fe_p0_metrics.items()
-                }
-                
-                # Add aggregated summary
-                fe_result["summary"] = self._calculate_aggregated_metrics(
-                    fe_result["metrics"], "fe"
+            fe_p0_metrics = self._get_metrics_by_type("fe", monitor_type) if priority == "p0" else None
+            collected = self._collected_results("fe", priority)
+            if collected:
+                fe_result = collected[0]
+            else:
+                fe_result = await self.scrape_fe_node(
+                    list(fe_p0_metrics) if fe_p0_metrics is not None else None
                 )
             
-            # Calculate dashboard-style metrics
-            dashboard_metrics = self._calculate_dashboard_metrics(fe_result["metrics"], "fe")
-            fe_result["dashboard_metrics"] = dashboard_metrics
+            if not fe_result.get("success"):
+                return fe_result
             
-            if include_raw_metrics:
-                fe_result["raw_metrics"] = fe_result["metrics"]
-            else:
-                # Replace detailed metrics with dashboard summary
-                fe_result["metrics"] = dashboard_metrics
-            
-            return fe_result
+            return self._process_node_result(fe_result, "fe", priority, fe_p0_metrics, include_raw_metrics)
             
         except Exception as e:
             logger.error(f"Failed to get FE metrics: {str(e)}")
             return {"success": False, "error": str(e)}
 
     async def _get_be_metrics(self, monitor_type: str, priority: str, format_type: str, include_raw_metrics: bool) -> List[Dict[str, Any]]:
-        """Get BE monitoring metrics from all BE nodes"""
+        """Get BE monitoring metrics from all BE nodes, from the background collector when it is fresh"""
         try:
-            be_nodes = await self.get_be_nodes()
-            be_results = []
-            
-            for be_node in be_nodes:
-                if be_node.get("alive") == "true":  # Only get alive BE nodes
-                    be_url = f"http://{be_node['host']}:{be_node['http_port']}/metrics"
-                    
-                    be_result = await self.fetch_metrics_from_url(be_url, "be", be_node)
-                    
-                    if be_result.get("success") and priority == "p0":
-                        be_p0_metrics = self._get_metrics_by_type("be", monitor_type)
-                        be_result["metrics"] = self._filter_p0_metrics(
-                            be_result["metrics"], 
-                            be_p0_metrics
-                        )
-                        be_result["p0_metrics_info"] = {
-                            name: metric.to_dict() 
-                            for name, metric in be_p0_metrics.items()
-                        }
-                        
-                        # Add aggregated summary
-                        be_result["summary"] = self._calculate_aggregated_metrics(
-                            be_result["metrics"], "be"
-                        )
-                    
-                    # Calculate dashboard-style metrics
-                    dashboard_metrics = self._calculate_dashboard_metrics(be_result["metrics"], "be")
-                    be_result["dashboard_metrics"] = dashboard_metrics
-                    
-                    if include_raw_metrics:
-                        be_result["raw_metrics"] = be_result["metrics"]
-                    else:
-                        # Replace detailed metrics with dashboard summary
-                        be_result["metrics"] = dashboard_metrics
-                    
-                    be_results.append(be_result)
+            # Only P0 metrics are kept, so skip everything else while parsing
+            be_p0_metrics = self._get_metrics_by_type("be", monitor_type) if priority == "p0" else None
+            be_results = self._collected_results("be", priority)
+            if be_results is None:
+                be_results = await self.scrape_be_nodes(
+                    list(be_p0_metrics) if be_p0_metrics is not None else None
+                )
             
-            return be_results
+            return [
+                self._process_node_result(be_result, "be", priority, be_p0_metrics, include_raw_metrics)
+                if be_result.get("success") else be_result
+                for be_result in be_results
+            ]
             
         except Exception as e:
             logger.error(f"Failed to get BE metrics: {str(e)}")
             return [{"success": False, "error": str(e)}]
 
+    def _process_node_result(
+        self,
+        node_result: Dict[str, Any],
+        role: str,
+        priority: str,
+        p0_metrics: Optional[Dict[str, P0MetricInfo]],
+        include_raw_metrics: bool
+    ) -> Dict[str, Any]:
+        """Add P0 filtering, summary and dashboard metrics to a successful scrape result"""
+        if priority == "p0":
+            node_result["metrics"] = self._filter_p0_metrics(
+                node_result["metrics"], 
+                p0_metrics
+            )
+            node_result["p0_metrics_info"] = {
+                name: metric.to_dict() 
+                for name, metric in p0_metrics.items()
+            }
+            
+            # Add aggregated summary
+            node_result["summary"] = self._calculate_aggregated_metrics(
+                node_result["metrics"], role
+            )
+        
+        # Calculate dashboard-style metrics
+        dashboard_metrics = self._calculate_dashboard_metrics(
+            node_result["metrics"], role, node_key=node_key_for(role, node_result.get("node_info") or {})
+        )
+        node_result["dashboard_metrics"] = dashboard_metrics
+        
+        if include_raw_metrics:
+            node_result["raw_metrics"] = node_result["metrics"]
+        else:
+            # Replace detailed metrics with dashboard summary
+            node_result["metrics"] = dashboard_metrics
+        
+        return node_result
+
     def _calculate_aggregated_metrics(self, metrics: Dict[str, Any], node_type: str) -> Dict[str, Any]:
         """
         Calculate aggregated and human-readable metrics from raw data
@@ -1347,13 +1381,14 @@ class DorisMonitoringTools:
                 
         return simplified
 
-    def _calculate_dashboard_metrics(self, raw_metrics: Dict[str, Any], role: str) -> Dict[str, Any]:
+    def _calculate_dashboard_metrics(self, raw_metrics: Dict[str, Any], role: str, node_key: Optional[str] = None) -> Dict[str, Any]:
         """
         Calculate dashboard-style aggregated metrics based on Doris Dashboard configuration
         
         Args:
             raw_metrics: Raw metrics data from Prometheus endpoint
             role: Node role (fe/be)
+            node_key: Collector key of the node, used to look up counter rates
             
         Returns:
             Dashboard-style aggregated metrics
@@ -1361,29 +1396,29 @@ class DorisMonitoringTools:
         dashboard_metrics = {}
         
         if role == "fe":
-            dashboard_metrics.update(self._calculate_fe_dashboard_metrics(raw_metrics))
+            dashboard_metrics.update(self._calculate_fe_dashboard_metrics(raw_metrics, node_key))
         elif role == "be":
-            dashboard_metrics.update(self._calculate_be_dashboard_metrics(raw_metrics))
+            dashboard_metrics.update(self._calculate_be_dashboard_metrics(raw_metrics, node_key))
             
         return dashboard_metrics
     
-    def _calculate_fe_dashboard_metrics(self, raw_metrics: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_fe_dashboard_metrics(self, raw_metrics: Dict[str, Any], node_key: Optional[str] = None) -> Dict[str, Any]:
         """
         Calculate FE dashboard metrics based on Dashboard configuration
         """
         fe_metrics = {}
         
         # Query metrics
-        fe_metrics["query_total_rate"] = self._get_rate_value(raw_metrics, "doris_fe_query_total")
+        fe_metrics["query_total_rate"] = self._get_rate_value(raw_metrics, "doris_fe_query_total", node_key=node_key)
         fe_metrics["query_latency_99p_ms"] = self._get_quantile_value(raw_metrics, "doris_fe_query_latency_ms", "0.99")
         fe_metrics["query_error_count"] = self._get_simple_value(raw_metrics, "doris_fe_query_err")
-        fe_metrics["query_error_rate"] = self._get_rate_value(raw_metrics, "doris_fe_query_err")
+        fe_metrics["query_error_rate"] = self._get_rate_value(raw_metrics, "doris_fe_query_err", node_key=node_key)
         
         # Connection metrics
         fe_metrics["connection_total"] = self._get_simple_value(raw_metrics, "doris_fe_connection_total")
         
         # Request metrics
-        fe_metrics["request_total_rate"] = self._get_rate_value(raw_metrics, "doris_fe_request_total")
+        fe_metrics["request_total_rate"] = self._get_rate_value(raw_metrics, "doris_fe_request_total", node_key=node_key)
         
         # JVM metrics
         fe_metrics["jvm_heap_used_bytes"] = self._get_simple_value(raw_metrics, "jvm_heap_size_bytes", labels={"type": "used"})
@@ -1404,14 +1439,14 @@ class DorisMonitoringTools:
         # Transaction metrics
         fe_metrics["txn_begin_total"] = self._get_simple_value(raw_metrics, "doris_fe_txn_counter", labels={"type": "begin"})
         fe_metrics["txn_success_total"] = self._get_simple_value(raw_metrics, "doris_fe_txn_counter", labels={"type": "success"})
-        fe_metrics["txn_begin_rate"] = self._get_rate_value(raw_metrics, "doris_fe_txn_counter", labels={"type": "begin"})
-        fe_metrics["txn_success_rate"] = self._get_rate_value(raw_metrics, "doris_fe_txn_counter", labels={"type": "success"})
-        fe_metrics["txn_reject_rate"] = self._get_rate_value(raw_metrics, "doris_fe_txn_counter", labels={"type": "reject"})
-        fe_metrics["txn_failed_rate"] = self._get_rate_value(raw_metrics, "doris_fe_txn_counter", labels={"type": "failed"})
+        fe_metrics["txn_begin_rate"] = self._get_rate_value(raw_metrics, "doris_fe_txn_counter", labels={"type": "begin"}, node_key=node_key)
+        fe_metrics["txn_success_rate"] = self._get_rate_value(raw_metrics, "doris_fe_txn_counter", labels={"type": "success"}, node_key=node_key)
+        fe_metrics["txn_reject_rate"] = self._get_rate_value(raw_metrics, "doris_fe_txn_counter", labels={"type": "reject"}, node_key=node_key)
+        fe_metrics["txn_failed_rate"] = self._get_rate_value(raw_metrics, "doris_fe_txn_counter", labels={"type": "failed"}, node_key=node_key)
         
         # Edit log metrics
-        fe_metrics["edit_log_write_rate"] = self._get_rate_value(raw_metrics, "doris_fe_edit_log", labels={"type": "write"})
-        fe_metrics["edit_log_read_rate"] = self._get_rate_value(raw_metrics, "doris_fe_edit_log", labels={"type": "read"})
+        fe_metrics["edit_log_write_rate"] = self._get_rate_value(raw_metrics, "doris_fe_edit_log", labels={"type": "write"}, node_key=node_key)
+        fe_metrics["edit_log_read_rate"] = self._get_rate_value(raw_metrics, "doris_fe_edit_log", labels={"type": "read"}, node_key=node_key)
         fe_metrics["edit_log_write_latency_99p_ms"] = self._get_quantile_value(raw_metrics, "doris_fe_editlog_write_latency_ms", "0.99")
         
         # Report queue
@@ -1419,20 +1454,20 @@ class DorisMonitoringTools:
         
         return {k: v for k, v in fe_metrics.items() if v is not None}
     
-    def _calculate_be_dashboard_metrics(self, raw_metrics: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_be_dashboard_metrics(self, raw_metrics: Dict[str, Any], node_key: Optional[str] = None) -> Dict[str, Any]:
         """
         Calculate BE dashboard metrics based on Dashboard configuration
         """
         be_metrics = {}
         
         # Stream load metrics
-        be_metrics["stream_load_receive_bytes_rate"] = self._get_rate_value(raw_metrics, "doris_be_stream_load", labels={"type": "receive_bytes"})
-        be_metrics["stream_load_rows_rate"] = self._get_rate_value(raw_metrics, "doris_be_stream_load", labels={"type": "load_rows"})
-        be_metrics["stream_load_txn_request_rate"] = self._get_rate_value(raw_metrics, "doris_be_stream_load_txn_request")
+        be_metrics["stream_load_receive_bytes_rate"] = self._get_rate_value(raw_metrics, "doris_be_stream_load", labels={"type": "receive_bytes"}, node_key=node_key)
+        be_metrics["stream_load_rows_rate"] = self._get_rate_value(raw_metrics, "doris_be_stream_load", labels={"type": "load_rows"}, node_key=node_key)
+        be_metrics["stream_load_txn_request_rate"] = self._get_rate_value(raw_metrics, "doris_be_stream_load_txn_request", node_key=node_key)
         
         # Engine request metrics
         be_metrics["engine_publish_total"] = self._get_simple_value(raw_metrics, "doris_be_engine_requests_total", labels={"type": "publish", "status": "total"})
-        be_metrics["engine_publish_failed_rate"] = self._get_rate_value(raw_metrics, "doris_be_engine_requests_total", labels={"type": "publish", "status": "failed"})
+        be_metrics["engine_publish_failed_rate"] = self._get_rate_value(raw_metrics, "doris_be_engine_requests_total", labels={"type": "publish", "status": "failed"}, node_key=node_key)
         
         # Disk metrics
         be_metrics["disks_used_capacity_bytes"] = self._get_simple_value(raw_metrics, "doris_be_disks_local_used_capacity")
@@ -1486,11 +1521,16 @@ class DorisMonitoringTools:
         except (ValueError, TypeError, KeyError):
             return None
     
-    def _get_rate_value(self, raw_metrics: Dict[str, Any], metric_name: str, labels: Dict[str, str] = None) -> float:
+    def _get_rate_value(self, raw_metrics: Dict[str, Any], metric_name: str, labels: Dict[str, str] = None, node_key: Optional[str] = None) -> float:
         """
-        Get rate value (would need historical data for actual rate calculation, using current value as approximation)
+        Get per-second rate value
+
+        With the background collector running, the rate is computed from the last
+        two scrapes (None until two samples exist). Without it there is no history,
+        so the current counter value is returned as an approximation.
         """
-        # For now, return the current value as rate calculation needs time series data
+        if self.collector is not None and node_key is not None:
+            return self.collector.rate(node_key, metric_name, labels)
         return self._get_simple_value(raw_metrics, metric_name, labels)
     
     def _get_quantile_value(self, raw_metrics: Dict[str, Any], metric_name: str, quantile: str) -> float:
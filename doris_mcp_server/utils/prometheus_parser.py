@@ -0,0 +1,141 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Streaming Prometheus Text Parser
+
+Parses the Prometheus text exposition format as it arrives, chunk by chunk.
+Lines are matched against the requested metric-name prefixes while still
+bytes, so samples that will be discarded are never decoded, split or
+label-parsed. Label values are unescaped per the exposition format.
+
+The result maps each metric name to its value, or to a list of
+``{"labels": {...}, "value": ...}`` entries when the metric carries labels.
+"""
+
+import re
+from typing import Any, Dict, Iterable, Optional
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+_LABEL_PAIR = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*"((?:[^"\\]|\\.)*)"')
+_ESCAPE = re.compile(r"\\(.)")
+
+
+def _unescape(value: str) -> str:
+    if "\\" not in value:
+        return value
+    return _ESCAPE.sub(lambda m: "\n" if m.group(1) == "n" else m.group(1), value)
+
+
+def _parse_value(text: str):
+    if text.isdigit() or (text[:1] == "-" and text[1:].isdigit()):
+        return int(text)
+    return float(text)  # also handles NaN, +Inf and exponents
+
+
+class PrometheusTextParser:
+    """Incremental parser for one metrics page"""
+
+    def __init__(self, name_prefixes: Optional[Iterable[str]] = None):
+        """
+        Args:
+            name_prefixes: Keep only metrics whose name starts with one of these;
+                None keeps every metric
+        """
+        self._prefixes = None if name_prefixes is None else tuple(p.encode() for p in name_prefixes)
+        self._pending = b""
+        self.metrics: Dict[str, Any] = {}
+        self.lines_seen = 0
+        self.samples_kept = 0
+
+    def feed(self, chunk: bytes) -> None:
+        """Consume a chunk of the response body"""
+        if self._pending:
+            chunk = self._pending + chunk
+        lines = chunk.split(b"\n")
+        self._pending = lines.pop()
+        self._parse_lines(lines)
+
+    def close(self) -> Dict[str, Any]:
+        """Parse any trailing partial line and return the metrics"""
+        if self._pending:
+            self._parse_lines([self._pending])
+            self._pending = b""
+        return self.metrics
+
+    def feed_line(self, line: bytes) -> None:
+        """Parse one complete line"""
+        self._parse_lines([line])
+
+    def _parse_lines(self, lines) -> None:
+        # Hot loop over every line of the page, so lookups are kept local
+        prefixes = self._prefixes
+        find_labels = _LABEL_PAIR.findall
+        add_labeled = self._add_labeled
+        add_plain = self._add_plain
+        kept = 0
+        for line in lines:
+            line = line.strip()
+            if not line or line[0] == 0x23:  # b"#": HELP, TYPE and comments
+                continue
+            if prefixes is not None and not line.startswith(prefixes):
+                continue
+            try:
+                text = line.decode("utf-8")
+                brace = text.find("{")
+                if brace >= 0:
+                    # name{labels} value [timestamp]; label values may contain "}" so
+                    # the closing brace is the last one on the line
+                    close = text.rindex("}")
+                    labels = dict(find_labels(text, brace + 1, close))
+                    if "\\" in text:
+                        labels = {key: _unescape(value) for key, value in labels.items()}
+                    add_labeled(text[:brace].strip(), labels, _parse_value(text[close + 1:].split(None, 1)[0]))
+                else:
+                    parts = text.split()
+                    add_plain(parts[0], _parse_value(parts[1]))
+                kept += 1
+            except (ValueError, IndexError, UnicodeDecodeError) as e:
+                logger.warning(f"Failed to parse metric line: {line[:200]!r}, error: {e}")
+        self.lines_seen += len(lines)
+        self.samples_kept += kept
+
+    def _add_labeled(self, name: str, labels: Dict[str, str], value) -> None:
+        samples = self.metrics.get(name)
+        if samples is None:
+            self.metrics[name] = [{"labels": labels, "value": value}]
+            return
+        if not isinstance(samples, list):
+            # An unlabeled sample came first, keep it as an entry with empty labels
+            samples = self.metrics[name] = [{"labels": {}, "value": samples}]
+        samples.append({"labels": labels, "value": value})
+
+    def _add_plain(self, name: str, value) -> None:
+        samples = self.metrics.get(name)
+        if isinstance(samples, list):
+            samples.append({"labels": {}, "value": value})
+        else:
+            self.metrics[name] = value
+
+
+def parse_prometheus_text(text, name_prefixes: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """Parse a complete metrics page (str or bytes)"""
+    parser = PrometheusTextParser(name_prefixes)
+    parser.feed(text.encode("utf-8") if isinstance(text, str) else text)
+    return parser.close()
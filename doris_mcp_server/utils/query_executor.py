@@ -21,7 +21,9 @@ Implements query optimization, cache management and performance monitoring funct
 """
 
 import asyncio
+import csv
 import hashlib
+import io
 import json
 import logging
 import time
@@ -29,13 +31,20 @@ import os
 import uuid
 import traceback
 from dataclasses import dataclass
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta
 from typing import Any, Dict
-from decimal import Decimal
 
 from .db import DorisConnectionManager, QueryResult
 from .logger import get_logger
+from .response_encoder import json_default
 from .sql_security_utils import get_auth_context
+from .tracing import span
+
+# Result layouts supported by execute_sql_for_mcp:
+# rows - list of {column: value} dicts (default)
+# columns - column names once, then one value array per row
+# csv / markdown_table - a single text table with a header line
+RESULT_FORMATS = ("rows", "columns", "csv", "markdown_table")
 
 
 @dataclass
@@ -549,12 +558,22 @@ class DorisQueryExecutor:
         timeout: int = 30,
         session_id: str = "mcp_session",
         user_id: str = "mcp_user",
-        auth_context = None  # FIX for Issue #62 Bug 1: Accept auth_context with token
+        auth_context = None,  # FIX for Issue #62 Bug 1: Accept auth_context with token
+        result_format: str = "rows"
     ) -> Dict[str, Any]:
         """Execute SQL query for MCP interface - unified method
 
         FIX for Issue #62 Bug 1: Now accepts auth_context parameter to support token-bound database configuration
+        result_format selects the layout of ``data`` (see RESULT_FORMATS)
         """
+        if result_format not in RESULT_FORMATS:
+            return {
+                "success": False,
+                "error": f"Unsupported result format '{result_format}', expected one of: {', '.join(RESULT_FORMATS)}",
+                "error_type": "invalid_argument",
+                "data": None
+            }
+
         max_retries = 2
         retry_count = 0
 
@@ -647,19 +666,20 @@ class DorisQueryExecutor:
                 # Execute query with retry logic
                 result = await self.execute_query(query_request, auth_context)
                 
-                # Serialize data for JSON response
-                serialized_data = []
-                for row in result.data:
-                    serialized_data.append(self._serialize_row_data(row))
-
+                # Rows are returned as-is; Decimal/datetime/bytes values are converted
+                # by the tool response encoder while the result is serialized
+                columns = result.metadata.get("columns", [])
+                with span("format_rows"):
+                    data = self._format_result_data(result.data, columns, result_format)
                 return {
                     "success": True,
-                    "data": serialized_data,
+                    "data": data,
                     "row_count": result.row_count,
                     "execution_time": result.execution_time,
                     "metadata": {
-                        "columns": result.metadata.get("columns", []),
-                        "query": sql
+                        "columns": columns,
+                        "query": sql,
+                        "format": result_format
                     }
                 }
                 
@@ -715,28 +735,49 @@ class DorisQueryExecutor:
             }
         }
 
-    def _serialize_row_data(self, row_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Serialize row data for JSON response"""
-        serialized = {}
-        
-        for key, value in row_data.items():
-            if value is None:
-                serialized[key] = None
-            elif isinstance(value, (str, int, float, bool)):
-                serialized[key] = value
-            elif isinstance(value, Decimal):
-                serialized[key] = float(value)
-            elif isinstance(value, (datetime, date)):
-                serialized[key] = value.isoformat()
-            elif isinstance(value, bytes):
-                try:
-                    serialized[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    serialized[key] = str(value)
-            else:
-                serialized[key] = str(value)
-                
-        return serialized
+    def _format_result_data(self, rows: list, columns: list, result_format: str) -> Any:
+        """Lay out result rows in the requested result format"""
+        if result_format == "rows":
+            return rows
+
+        # Row dict keys are authoritative; cursor columns are used for empty results
+        names = list(rows[0].keys()) if rows else list(columns)
+        if result_format == "columns":
+            return {
+                "columns": names,
+                "rows": [[row.get(name) for name in names] for row in rows]
+            }
+
+        if result_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator="\n")
+            writer.writerow(names)
+            for row in rows:
+                writer.writerow([self._format_text_cell(row.get(name)) for name in names])
+            return buffer.getvalue()
+
+        # markdown_table
+        def markdown_cell(value: Any) -> str:
+            return self._format_text_cell(value).replace("|", "\\|").replace("\r\n", " ").replace("\n", " ")
+
+        lines = [
+            "| " + " | ".join(markdown_cell(name) for name in names) + " |",
+            "|" + "---|" * len(names)
+        ]
+        for row in rows:
+            lines.append("| " + " | ".join(markdown_cell(row.get(name)) for name in names) + " |")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _format_text_cell(value: Any) -> str:
+        """Render a single value for text result formats"""
+        if value is None:
+            return ""
+        if isinstance(value, str):
+            return value
+        if isinstance(value, (bool, int, float)):
+            return str(value)
+        return str(json_default(value))
 
     def _analyze_error(self, error_message: str) -> Dict[str, str]:
         """Analyze error message and provide user-friendly feedback"""
@@ -906,6 +947,7 @@ async def execute_sql_query(sql: str, connection_manager: DorisConnectionManager
         session_id = kwargs.get("session_id", "mcp_session")
         user_id = kwargs.get("user_id", "mcp_user")
         auth_context = kwargs.get("auth_context", None)  # FIX: Extract auth_context
+        result_format = kwargs.get("result_format", "rows")
 
         # The execute_sql_for_mcp method now includes security validation
         result = await executor.execute_sql_for_mcp(
@@ -914,7 +956,8 @@ async def execute_sql_query(sql: str, connection_manager: DorisConnectionManager
             timeout=timeout,
             session_id=session_id,
             user_id=user_id,
-            auth_context=auth_context  # FIX: Pass auth_context with token
+            auth_context=auth_context,  # FIX: Pass auth_context with token
+            result_format=result_format
         )
 
         # FIX for Issue #58 Problem 2: Do NOT close executor here
@@ -0,0 +1,240 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Response Budget Module
+
+Enforces PerformanceConfig.max_response_content_size on query results. Rows are
+measured one at a time and serialization stops once the character budget is
+reached; the remaining rows stay in the result spool behind an opaque
+continuation cursor, so the next page is served without re-running the query.
+A cursor is only honoured for the caller (token and user) it was issued to.
+"""
+
+import base64
+import binascii
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from .logger import get_logger
+from .response_encoder import ResponseEncoder
+from .result_spool import SPOOL_BLOCK_ROWS, ResultSpool, SpooledResult
+from .sql_security_utils import get_auth_context
+
+logger = get_logger(__name__)
+
+# Length of an encoded continuation cursor, reserved while measuring a page
+_CURSOR_RESERVE = 48
+
+
+def _split_csv_records(text: str) -> List[str]:
+    """Split CSV text into records, keeping quoted line breaks inside their record"""
+    records = []
+    pending = None
+    for line in text[:-1].split("\n") if text.endswith("\n") else text.split("\n"):
+        pending = line if pending is None else f"{pending}\n{line}"
+        # csv.writer doubles embedded quotes, so a complete record has an even count
+        if pending.count('"') % 2 == 0:
+            records.append(pending)
+            pending = None
+    if pending is not None:
+        records.append(pending)
+    return records
+
+
+def _caller_identity() -> Optional[str]:
+    """Identify the caller of the current request (None without authentication context)"""
+    auth_context = get_auth_context()
+    if auth_context is None:
+        return None
+    return f"{getattr(auth_context, 'token_id', '')}:{getattr(auth_context, 'user_id', '')}"
+
+
+class ResponseBudgeter:
+    """Truncates query results to the response budget and paginates the rest"""
+
+    def __init__(self, encoder: ResponseEncoder, spool: ResultSpool, max_chars: int):
+        self.encoder = encoder
+        self.spool = spool
+        self.max_chars = max_chars
+
+    @classmethod
+    def from_config(cls, config, encoder: ResponseEncoder) -> "ResponseBudgeter":
+        """Create a budgeter from ``config.performance``"""
+        performance = config.performance
+        spool = ResultSpool(
+            ttl=performance.result_spool_ttl,
+            max_entries=performance.result_spool_max_entries,
+            spool_dir=performance.result_spool_dir,
+            disk_quota_bytes=performance.result_spool_disk_quota_mb * 1024 * 1024,
+        )
+        return cls(encoder, spool, performance.max_response_content_size)
+
+    async def apply(self, result: Any) -> Any:
+        """Return the first page of a query result that fits the budget
+
+        Results that failed, carry no row data or were already paginated are
+        returned unchanged.
+        """
+        if (self.max_chars <= 0 or not isinstance(result, dict) or not result.get("success")
+                or "truncated" in result):
+            return result
+
+        entry = self._split(result)
+        if entry is None:
+            return result
+        # Rows were filtered and masked for this caller, so only this caller may page through them
+        entry.caller = _caller_identity()
+        return await self._page(entry, 0, None)
+
+    async def fetch_page(self, cursor: str) -> Dict[str, Any]:
+        """Serve the page a continuation cursor points at from the spool"""
+        decoded = self._decode_cursor(cursor)
+        entry = await self.spool.get(decoded[0]) if decoded else None
+        if entry is None or entry.caller != _caller_identity():
+            return {
+                "success": False,
+                "error": "Continuation cursor is invalid or has expired, please run the query again",
+                "error_type": "invalid_cursor",
+                "data": None,
+            }
+        spool_id, offset = decoded
+        try:
+            return await self._page(entry, min(offset, entry.row_total), spool_id)
+        except (OSError, zlib.error, ValueError) as e:
+            logger.warning(f"Failed to read spooled result {spool_id}: {e}")
+            await self.spool.discard(spool_id)
+            return {
+                "success": False,
+                "error": "Spooled result is no longer available, please run the query again",
+                "error_type": "invalid_cursor",
+                "data": None,
+            }
+
+    async def _page(self, entry: SpooledResult, offset: int, spool_id: Optional[str]) -> Dict[str, Any]:
+        page = await self._fit(entry, offset)
+        end = offset + len(page)
+        truncated = end < entry.row_total
+
+        result = self._assemble(entry, page)
+        result.update(truncated=truncated, returned_rows=len(page), row_offset=offset)
+        if truncated:
+            if spool_id is None:
+                spool_id = await self.spool.put(entry)
+            if spool_id is None:
+                result["next_cursor"] = None
+                result["message"] = (
+                    "Result is too large to keep for pagination, narrow the query or lower max_rows"
+                )
+            else:
+                result["next_cursor"] = self._encode_cursor(spool_id, end)
+        elif spool_id is not None:
+            await self.spool.discard(spool_id)
+        return result
+
+    async def _fit(self, entry: SpooledResult, offset: int) -> List[Any]:
+        """Collect the rows from ``offset`` that fit the budget (at least one)"""
+        used = self._measure(entry, [], offset)
+        encode = self.encoder.encode
+
+        # Rows are measured on their own first; nested in the page they can encode
+        # larger (the pretty encoder indents them), so the page is checked whole below
+        page: List[Any] = []
+        position = offset
+        while position < entry.row_total:
+            window = await entry.read_units(position, SPOOL_BLOCK_ROWS)
+            if not window:
+                break
+            for unit in window:
+                used += len(encode(unit)) + 1
+                if used > self.max_chars and page:
+                    return self._shrink(entry, page, offset)
+                page.append(unit)
+            position += len(window)
+        return self._shrink(entry, page, offset)
+
+    def _shrink(self, entry: SpooledResult, page: List[Any], offset: int) -> List[Any]:
+        """Drop rows from the end of ``page`` until the encoded page fits the budget"""
+        if len(page) <= 1 or self._measure(entry, page, offset) <= self.max_chars:
+            return page
+        # Longest prefix that fits, by binary search (at least one row)
+        low, high = 1, len(page) - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._measure(entry, page[:middle], offset) <= self.max_chars:
+                low = middle
+            else:
+                high = middle - 1
+        return page[:low]
+
+    def _measure(self, entry: SpooledResult, page: List[Any], offset: int) -> int:
+        """Encoded size of a truncated page holding ``page``, with room for its cursor"""
+        probe = self._assemble(entry, page)
+        probe.update(
+            truncated=True, returned_rows=entry.row_total, row_offset=offset,
+            next_cursor="x" * _CURSOR_RESERVE,
+        )
+        return len(self.encoder.encode(probe))
+
+    @staticmethod
+    def _split(result: Dict[str, Any]) -> Optional[SpooledResult]:
+        """Split a result into its template, header and per-row units"""
+        data = result.get("data")
+        result_format = (result.get("metadata") or {}).get("format", "rows")
+        template = {key: value for key, value in result.items() if key != "data"}
+
+        if result_format == "rows" and isinstance(data, list):
+            header, units = None, data
+        elif result_format == "columns" and isinstance(data, dict):
+            header, units = data["columns"], data["rows"]
+        elif result_format == "csv" and isinstance(data, str):
+            records = _split_csv_records(data)
+            header, units = records[0], records[1:]
+        elif result_format == "markdown_table" and isinstance(data, str):
+            lines = data.split("\n")
+            header, units = lines[:2], lines[2:]
+        else:
+            return None
+        return SpooledResult(template=template, result_format=result_format, header=header, units=units)
+
+    @staticmethod
+    def _assemble(entry: SpooledResult, page: List[Any]) -> Dict[str, Any]:
+        """Build a result holding ``page`` in the entry's result format"""
+        result = dict(entry.template)
+        if entry.result_format == "columns":
+            result["data"] = {"columns": entry.header, "rows": list(page)}
+        elif entry.result_format == "csv":
+            result["data"] = "\n".join([entry.header, *page]) + "\n"
+        elif entry.result_format == "markdown_table":
+            result["data"] = "\n".join([*entry.header, *page])
+        else:
+            result["data"] = list(page)
+        return result
+
+    @staticmethod
+    def _encode_cursor(spool_id: str, offset: int) -> str:
+        return base64.urlsafe_b64encode(f"{spool_id}:{offset}".encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: Any) -> Optional[Tuple[str, int]]:
+        if not isinstance(cursor, str) or not cursor:
+            return None
+        try:
+            decoded = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+            spool_id, offset = decoded.rsplit(":", 1)
+            return spool_id, max(0, int(offset))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            return None
@@ -0,0 +1,116 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Tool Response Encoder Module
+
+Encodes tool results to JSON text in a single pass. Values JSON does not support
+natively (Decimal, datetime, bytes, numpy scalars and arrays) are converted inline
+by a default hook instead of a separate pre-walk over every row.
+"""
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+
+from .logger import get_logger
+from .server_metrics import RESPONSE_BYTES
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib encoder is used without it
+    orjson = None
+
+logger = get_logger(__name__)
+
+# auto: orjson when installed, else compact stdlib json
+# pretty: stdlib json indented for human reading (larger payloads)
+RESPONSE_ENCODERS = ("auto", "orjson", "json", "pretty")
+
+
+def json_default(value: Any) -> Any:
+    """Convert a value that is not natively JSON serializable"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        raw = bytes(value)
+        try:
+            return raw.decode('utf-8')
+        except UnicodeDecodeError:
+            return str(raw)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    # numpy scalars and arrays, detected without importing numpy
+    if hasattr(value, 'tolist') and hasattr(value, 'dtype'):
+        return value.tolist()
+    return str(value)
+
+
+class ResponseEncoder:
+    """Pluggable JSON encoder for tool responses"""
+
+    def __init__(self, encoder: str = "auto"):
+        if encoder not in RESPONSE_ENCODERS:
+            logger.warning(f"Unknown response encoder '{encoder}', using 'auto'")
+            encoder = "auto"
+        if encoder in ("auto", "orjson"):
+            if orjson is not None:
+                encoder = "orjson"
+            else:
+                if encoder == "orjson":
+                    logger.warning("orjson is not installed, falling back to the json response encoder")
+                encoder = "json"
+
+        self.name = encoder
+        self._encode = {
+            "orjson": self._encode_orjson,
+            "json": self._encode_json,
+            "pretty": self._encode_pretty,
+        }[encoder]
+
+    @classmethod
+    def from_config(cls, config) -> "ResponseEncoder":
+        """Create the encoder selected by ``config.performance.response_encoder``"""
+        return cls(config.performance.response_encoder)
+
+    def encode(self, result: Any) -> str:
+        """Encode a tool result to JSON text"""
+        text = self._encode(result)
+        # isascii() is a flag check, so only non-ASCII results pay for a UTF-8 length
+        RESPONSE_BYTES.inc(self.name, len(text) if text.isascii() else len(text.encode('utf-8')))
+        return text
+
+    def _encode_orjson(self, result: Any) -> str:
+        try:
+            return orjson.dumps(
+                result,
+                default=json_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            ).decode('utf-8')
+        except TypeError:
+            # e.g. integers beyond 64 bits, which the stdlib encoder supports
+            return self._encode_json(result)
+
+    @staticmethod
+    def _encode_json(result: Any) -> str:
+        return json.dumps(result, ensure_ascii=False, separators=(',', ':'), default=json_default)
+
+    @staticmethod
+    def _encode_pretty(result: Any) -> str:
+        return json.dumps(result, ensure_ascii=False, indent=2, default=json_default)
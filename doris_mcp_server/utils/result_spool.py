@@ -0,0 +1,353 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Result Spool Module
+
+Keeps truncated query results on the server for a short time so follow-up
+pages can be served from a continuation cursor with no database load.
+
+Spooled rows are written to a temporary file as zlib-compressed JSON blocks
+with an in-memory block index, so a page read only decompresses the blocks it
+covers. Entries expire after a TTL and total disk usage is bounded by a quota.
+
+When a spool directory is configured, each entry's index is also written next
+to its rows, so a cursor issued by one process can be served by any process
+sharing the directory (HTTP worker mode). Reads touch the index file, which
+is what the TTL of shared entries is measured from.
+"""
+
+import asyncio
+import atexit
+import contextlib
+import json
+import os
+import re
+import secrets
+import shutil
+import tempfile
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .logger import get_logger
+from .response_encoder import json_default
+
+logger = get_logger(__name__)
+
+# Rows per compressed block; also the read granularity for pages
+SPOOL_BLOCK_ROWS = 256
+_SPOOL_SUFFIX = ".spool"
+_INDEX_SUFFIX = ".idx"
+# Spool IDs are secrets.token_urlsafe() values; anything else in a cursor is rejected
+_SPOOL_ID = re.compile(r"[A-Za-z0-9_-]{16,64}")
+
+
+@dataclass
+class SpooledResult:
+    """A result held for pagination, split into its row units"""
+
+    template: Dict[str, Any]  # Result fields other than the row data
+    result_format: str
+    header: Any  # Column names or text table header, depending on format
+    units: Optional[List[Any]]  # One entry per result row; None once written to the spool file
+    row_total: int = -1
+    expires_at: float = 0.0
+    path: Optional[str] = None
+    blocks: List[Tuple[int, int]] = field(default_factory=list)  # (file offset, length) per block
+    disk_size: int = 0
+    caller: Optional[str] = None  # Identity of the caller the rows were filtered and masked for
+    owned: bool = True  # False for entries loaded from another process's index
+    index_mtime: float = 0.0  # Index file mtime as last set by this process (shared spools)
+
+    def __post_init__(self):
+        if self.row_total < 0:
+            self.row_total = len(self.units or [])
+
+    async def read_units(self, start: int, count: int) -> List[Any]:
+        """Read up to ``count`` row units starting at row ``start``"""
+        if self.units is not None:
+            return self.units[start:start + count]
+        if start >= self.row_total or count <= 0:
+            return []
+        return await asyncio.to_thread(self._read_blocks, start, count)
+
+    def _read_blocks(self, start: int, count: int) -> List[Any]:
+        first_block = start // SPOOL_BLOCK_ROWS
+        last_block = (min(start + count, self.row_total) - 1) // SPOOL_BLOCK_ROWS
+        rows: List[Any] = []
+        with open(self.path, "rb") as f:
+            for offset, length in self.blocks[first_block:last_block + 1]:
+                f.seek(offset)
+                rows.extend(json.loads(zlib.decompress(f.read(length))))
+        skip = start - first_block * SPOOL_BLOCK_ROWS
+        return rows[skip:skip + count]
+
+
+class ResultSpool:
+    """Short-lived on-disk store for paginated results
+
+    Entries expire ``ttl`` seconds after they were last read. The number of
+    held results and their total compressed size are bounded; the least
+    recently used entries are dropped first.
+    """
+
+    def __init__(
+        self,
+        ttl: int = 300,
+        max_entries: int = 64,
+        spool_dir: str = "",
+        disk_quota_bytes: int = 512 * 1024 * 1024,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.disk_quota_bytes = disk_quota_bytes
+        self._configured_dir = spool_dir
+        self._spool_dir: Optional[str] = None
+        self._entries: "OrderedDict[str, SpooledResult]" = OrderedDict()
+        self._disk_usage = 0
+
+    def _get_spool_dir(self) -> str:
+        """Create the spool directory on first use"""
+        if self._spool_dir is None:
+            if self._configured_dir:
+                os.makedirs(self._configured_dir, exist_ok=True)
+                self._remove_stale_files(self._configured_dir)
+                self._spool_dir = self._configured_dir
+            else:
+                self._spool_dir = tempfile.mkdtemp(prefix="doris_mcp_spool_")
+                atexit.register(shutil.rmtree, self._spool_dir, True)
+        return self._spool_dir
+
+    def _remove_stale_files(self, directory: str):
+        """Remove spool files left behind by earlier processes"""
+        cutoff = time.time() - self.ttl
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            with contextlib.suppress(OSError):
+                if name.endswith(_INDEX_SUFFIX) and os.path.getmtime(path) < cutoff:
+                    os.unlink(path)
+                    os.unlink(path[:-len(_INDEX_SUFFIX)] + _SPOOL_SUFFIX)
+                elif (name.endswith(_SPOOL_SUFFIX) and os.path.getmtime(path) < cutoff
+                      and not os.path.exists(path[:-len(_SPOOL_SUFFIX)] + _INDEX_SUFFIX)):
+                    os.unlink(path)
+
+    @property
+    def shared(self) -> bool:
+        """Whether entries are published for other processes using the directory"""
+        return bool(self._configured_dir)
+
+    async def put(self, entry: SpooledResult) -> Optional[str]:
+        """Write a result to the spool and return its spool ID
+
+        Returns None when the result alone exceeds the disk quota.
+        """
+        self._purge_expired()
+        while len(self._entries) >= self.max_entries:
+            self._evict_oldest()
+
+        spool_id = secrets.token_urlsafe(16)
+        path = os.path.join(self._get_spool_dir(), f"{spool_id}{_SPOOL_SUFFIX}")
+        await asyncio.to_thread(self._write, entry, path)
+
+        if entry.disk_size > self.disk_quota_bytes:
+            self._unlink(path)
+            logger.warning(
+                f"Result of {entry.row_total} rows ({entry.disk_size} bytes compressed) exceeds the spool quota"
+            )
+            return None
+        while self._entries and self._disk_usage + entry.disk_size > self.disk_quota_bytes:
+            self._evict_oldest()
+
+        if self.shared:
+            try:
+                await asyncio.to_thread(self._write_index, entry, self._index_path(spool_id))
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning(f"Failed to publish spool index {spool_id}: {e}")
+                self._unlink(path)
+                return None
+
+        entry.units = None  # Rows are now served from the spool file
+        entry.expires_at = time.monotonic() + self.ttl
+        self._entries[spool_id] = entry
+        self._disk_usage += entry.disk_size
+        return spool_id
+
+    def _index_path(self, spool_id: str) -> str:
+        return os.path.join(self._get_spool_dir(), f"{spool_id}{_INDEX_SUFFIX}")
+
+    @staticmethod
+    def _write_index(entry: SpooledResult, index_path: str):
+        """Atomically publish everything but the rows, which stay in the spool file"""
+        index = {
+            "template": entry.template,
+            "result_format": entry.result_format,
+            "header": entry.header,
+            "row_total": entry.row_total,
+            "path": os.path.basename(entry.path),
+            "blocks": entry.blocks,
+            "disk_size": entry.disk_size,
+            "caller": entry.caller,
+        }
+        fd, tmp_path = tempfile.mkstemp(prefix=".index-", dir=os.path.dirname(index_path))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(index, f, ensure_ascii=False, default=json_default)
+            os.replace(tmp_path, index_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+        entry.index_mtime = os.path.getmtime(index_path)
+
+    def _read_index(self, spool_id: str) -> Optional[SpooledResult]:
+        """Load an entry published by another process, None if it is missing or expired"""
+        index_path = self._index_path(spool_id)
+        try:
+            if os.path.getmtime(index_path) + self.ttl <= time.time():
+                return None
+            with open(index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return SpooledResult(
+            template=index["template"],
+            result_format=index["result_format"],
+            header=index["header"],
+            units=None,
+            row_total=index["row_total"],
+            path=os.path.join(os.path.dirname(index_path), index["path"]),
+            blocks=[tuple(block) for block in index["blocks"]],
+            disk_size=index["disk_size"],
+            caller=index.get("caller"),
+            owned=False,
+        )
+
+    def _touch_index(self, spool_id: str, entry: SpooledResult):
+        index_path = self._index_path(spool_id)
+        with contextlib.suppress(OSError):
+            os.utime(index_path)
+            entry.index_mtime = os.path.getmtime(index_path)
+
+    @staticmethod
+    def _write(entry: SpooledResult, path: str):
+        """Write row units as independently compressed blocks"""
+        blocks = []
+        offset = 0
+        with open(path, "wb") as f:
+            for start in range(0, entry.row_total, SPOOL_BLOCK_ROWS):
+                block = json.dumps(
+                    entry.units[start:start + SPOOL_BLOCK_ROWS],
+                    ensure_ascii=False, separators=(",", ":"), default=json_default,
+                ).encode("utf-8")
+                data = zlib.compress(block, 1)
+                f.write(data)
+                blocks.append((offset, len(data)))
+                offset += len(data)
+        entry.path = path
+        entry.blocks = blocks
+        entry.disk_size = offset
+
+    async def get(self, spool_id: str) -> Optional[SpooledResult]:
+        """Return a spooled result and extend its lifetime, or None if it expired"""
+        self._purge_expired()
+        entry = self._entries.get(spool_id)
+        if entry is None:
+            if not self.shared or not _SPOOL_ID.fullmatch(spool_id):
+                return None
+            # Issued by another process sharing the spool directory
+            entry = await asyncio.to_thread(self._read_index, spool_id)
+            if entry is None:
+                return None
+            while len(self._entries) >= self.max_entries:
+                self._evict_oldest()
+            self._entries[spool_id] = entry
+        elif self.shared:
+            await asyncio.to_thread(self._touch_index, spool_id, entry)
+        entry.expires_at = time.monotonic() + self.ttl
+        self._entries.move_to_end(spool_id)
+        return entry
+
+    async def discard(self, spool_id: str):
+        """Drop a spooled result once its last page was served"""
+        entry = self._entries.pop(spool_id, None)
+        if entry is not None:
+            self._release(spool_id, entry, remove_files=True)
+
+    def _evict_oldest(self):
+        spool_id, entry = self._entries.popitem(last=False)
+        self._release(spool_id, entry)
+        logger.debug(f"Result spool evicted {spool_id}")
+
+    def _purge_expired(self):
+        now = time.monotonic()
+        expired = [spool_id for spool_id, entry in self._entries.items() if entry.expires_at <= now]
+        for spool_id in expired:
+            entry = self._entries[spool_id]
+            if entry.owned and self._read_elsewhere(spool_id, entry):
+                entry.expires_at = now + self.ttl
+                continue
+            self._release(spool_id, self._entries.pop(spool_id))
+
+    def _read_elsewhere(self, spool_id: str, entry: SpooledResult) -> bool:
+        """Whether another process read a shared entry within the TTL"""
+        if not self.shared:
+            return False
+        try:
+            mtime = os.path.getmtime(self._index_path(spool_id))
+        except OSError:
+            return False
+        if mtime > entry.index_mtime and mtime + self.ttl > time.time():
+            entry.index_mtime = mtime
+            return True
+        return False
+
+    def _release(self, spool_id: str, entry: SpooledResult, remove_files: bool = False):
+        """Forget an entry; its files are removed by the owning process or once fully read"""
+        if entry.owned:
+            self._disk_usage -= entry.disk_size
+        elif not remove_files:
+            return
+        if entry.path:
+            self._unlink(entry.path)
+        if self.shared:
+            self._unlink(self._index_path(spool_id))
+
+    @staticmethod
+    def _unlink(path: str):
+        with contextlib.suppress(OSError):
+            os.unlink(path)
+
+    def close(self):
+        """Remove all spooled results and the temporary spool directory"""
+        for spool_id, entry in self._entries.items():
+            self._release(spool_id, entry)
+        self._entries.clear()
+        if self._spool_dir and not self._configured_dir:
+            shutil.rmtree(self._spool_dir, ignore_errors=True)
+        self._spool_dir = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get spool statistics"""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "disk_usage_bytes": self._disk_usage,
+            "disk_quota_bytes": self.disk_quota_bytes,
+        }
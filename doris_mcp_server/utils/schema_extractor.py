@@ -22,18 +22,22 @@ Responsible for extracting table structures, relationships, and other metadata f
 
 import os
 import json
-import pandas as pd
 import re
 import uuid
 import time
-from typing import Dict, List, Any, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
 
+if TYPE_CHECKING:
+    # pandas is imported where DataFrames are built; it dominates module import time
+    import pandas as pd
+
 # Import unified logging configuration
 from .logger import get_logger
 from .sql_security_utils import (
     SQLSecurityError,
+    get_auth_context,
     validate_identifier,
     quote_identifier
 )
@@ -799,7 +803,7 @@ class MetadataExtractor:
             return []
     
     # Deprecated: sync method (kept for compatibility, will be removed)
-    def get_recent_audit_logs(self, days: int = 7, limit: int = 100) -> pd.DataFrame:
+    def get_recent_audit_logs(self, days: int = 7, limit: int = 100) -> "pd.DataFrame":
         """
         Get recent audit logs
         
@@ -810,6 +814,7 @@ class MetadataExtractor:
         Returns:
             pd.DataFrame: Audit log DataFrame
         """
+        import pandas as pd
         try:
             start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
             
@@ -1192,6 +1197,9 @@ class MetadataExtractor:
         Returns:
             Query result data (list of dictionaries or pandas DataFrame)
         """
+        if return_dataframe:
+            # Only DataFrame results need pandas, which is slow to import
+            import pandas as pd
         try:
             if self.connection_manager:
                 # Use the injected connection manager directly (async)
@@ -1205,10 +1213,8 @@ class MetadataExtractor:
                 
                 # Convert to DataFrame if requested
                 if return_dataframe and data:
-                    import pandas as pd
                     return pd.DataFrame(data)
                 elif return_dataframe:
-                    import pandas as pd
                     return pd.DataFrame()
                 else:
                     return data
@@ -1216,7 +1222,6 @@ class MetadataExtractor:
                 # Fallback: Return empty result
                 logger.warning("No connection manager provided, returning empty result")
                 if return_dataframe:
-                    import pandas as pd
                     return pd.DataFrame()
                 else:
                     return []
@@ -1224,7 +1229,6 @@ class MetadataExtractor:
             logger.error(f"Error executing query: {str(e)}")
             # Return empty result instead of raising exception to prevent cascade failures
             if return_dataframe:
-                import pandas as pd
                 return pd.DataFrame()
             else:
                 return []
@@ -1531,6 +1535,7 @@ class MetadataExtractor:
 
     async def get_recent_audit_logs_async(self, days: int = 7, limit: int = 100):
         """Async version: get recent audit logs and return a pandas DataFrame."""
+        import pandas as pd
         try:
             start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
             query = f"""
@@ -1546,11 +1551,9 @@ class MetadataExtractor:
             LIMIT {limit}
             """
             rows = await self._execute_query_async(query)
-            import pandas as pd
             return pd.DataFrame(rows or [])
         except Exception as e:
             logger.error(f"Error getting audit logs asynchronously: {str(e)}")
-            import pandas as pd
             return pd.DataFrame()
 
     # ==================== Business layer methods (original metadata_tools.py functionality) ====================
@@ -1576,12 +1579,15 @@ class MetadataExtractor:
         db_name: str = None,
         catalog_name: str = None,
         max_rows: int = 100,
-        timeout: int = 30
+        timeout: int = 30,
+        result_format: str = "rows"
     ) -> Dict[str, Any]:
         """
         Execute SQL query and return results, supports catalog federation queries
         Unified interface for MCP tools
 
+        result_format: rows, columns, csv or markdown_table (layout of the returned data)
+
         FIX for Issue #62 Bug 1: Now retrieves auth_context from context variable to support token-bound database configuration
         FIX for Issue #62 Bug 3: Now uses db_name and catalog_name parameters to switch database context
         """
@@ -1642,25 +1648,9 @@ class MetadataExtractor:
                     final_sql = f"{context_sql}; {sql_clean}"
                     logger.debug(f"Modified SQL with context switching: {final_sql[:200]}...")
 
-            # FIX: Try to get auth_context from context variable (set by HTTP middleware)
+            # FIX: Get auth_context from the shared context variable (set by the HTTP handler)
             # This allows token-bound database configuration to work
-            auth_context = None
-            try:
-                from contextvars import ContextVar
-                from .security import AuthContext
-
-                # Try to get auth_context from context variable
-                # This will be set by the HTTP request handler in main.py
-                auth_context_var: ContextVar = ContextVar('mcp_auth_context', default=None)
-                auth_context = auth_context_var.get()
-
-                if auth_context:
-                    logger.debug(f"Retrieved auth_context from context variable with token: {bool(hasattr(auth_context, 'token') and auth_context.token)}")
-                else:
-                    logger.debug("No auth_context found in context variable, using default")
-            except Exception as ctx_error:
-                logger.debug(f"Could not retrieve auth_context from context variable: {ctx_error}")
-                auth_context = None
+            auth_context = get_auth_context()
 
             # Import query executor
             from .query_executor import execute_sql_query
@@ -1671,7 +1661,8 @@ class MetadataExtractor:
                 connection_manager=self.connection_manager,
                 limit=max_rows,
                 timeout=timeout,
-                auth_context=auth_context  # FIX: Pass auth_context with token
+                auth_context=auth_context,  # FIX: Pass auth_context with token
+                result_format=result_format
             )
 
             return exec_result
@@ -1996,9 +1987,9 @@ class MetadataManager:
     def __init__(self, connection_manager=None):
         self.extractor = MetadataExtractor(connection_manager=connection_manager)
     
-    async def exec_query(self, sql: str, db_name: str = None, catalog_name: str = None, max_rows: int = 100, timeout: int = 30) -> Dict[str, Any]:
+    async def exec_query(self, sql: str, db_name: str = None, catalog_name: str = None, max_rows: int = 100, timeout: int = 30, result_format: str = "rows") -> Dict[str, Any]:
         """Execute SQL query and return results, supports catalog federation queries"""
-        return await self.extractor.exec_query_for_mcp(sql, db_name, catalog_name, max_rows, timeout)
+        return await self.extractor.exec_query_for_mcp(sql, db_name, catalog_name, max_rows, timeout, result_format)
     
     async def get_table_schema(self, table_name: str, db_name: str = None, catalog_name: str = None) -> Dict[str, Any]:
         """Get detailed schema information for specified table (columns, types, comments, etc.)"""
@@ -20,9 +20,12 @@ Doris Security Management Module
 Implements enterprise-level authentication, authorization, SQL security validation and data masking functionality
 """
 
+import hashlib
 import logging
 import re
-from dataclasses import dataclass, field
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
@@ -33,6 +36,8 @@ from sqlparse.tokens import Keyword, Name
 
 from .logger import get_logger
 from .config import DatabaseConfig
+from .server_metrics import MASKING_SECONDS, SECURITY_VALIDATION_SECONDS
+from .tracing import record_span
 
 
 class SecurityLevel(Enum):
@@ -106,6 +111,10 @@ class DorisSecurityManager:
         self.sensitive_tables = self._load_sensitive_tables()
         self.masking_rules = self._load_masking_rules()
         
+        # Cached authorization decisions are stale once tokens.json is hot-reloaded
+        if self.auth_provider.token_manager:
+            self.auth_provider.token_manager.add_reload_listener(self.authz_provider.invalidate_cache)
+        
         # Track initialization state
         self._initialized = False
 
@@ -285,13 +294,23 @@ class DorisSecurityManager:
         self, sql: str, auth_context: AuthContext
     ) -> ValidationResult:
         """Validate SQL query security"""
-        return await self.sql_validator.validate(sql, auth_context)
+        started = time.perf_counter()
+        try:
+            return await self.sql_validator.validate(sql, auth_context)
+        finally:
+            SECURITY_VALIDATION_SECONDS.observe_since(started)
+            record_span("security_validation", started)
 
     async def apply_data_masking(
         self, data: list[dict[str, Any]], auth_context: AuthContext
     ) -> list[dict[str, Any]]:
         """Apply data masking processing"""
-        return await self.masking_processor.process(data, auth_context)
+        started = time.perf_counter()
+        try:
+            return await self.masking_processor.process(data, auth_context)
+        finally:
+            MASKING_SECONDS.observe_since(started)
+            record_span("masking", started)
 
     # OAuth-specific methods
     def get_oauth_authorization_url(self) -> tuple[str, str]:
@@ -418,10 +437,16 @@ class AuthenticationProvider:
         self.logger = get_logger(__name__)
         self.session_cache = {}
         self.jwt_manager = None
+        self._jwt_middleware = None
         self.oauth_provider = None
         self.token_manager = None
         self.security_manager = security_manager
         
+        # Verified-token fast path: token digest -> (AuthContext template, TokenInfo, deadline, generation)
+        self.auth_cache_ttl = getattr(config.security, 'auth_cache_ttl', 60)
+        self.auth_cache_max_size = getattr(config.security, 'auth_cache_max_size', 10000)
+        self._verified_tokens: OrderedDict[bytes, tuple] = OrderedDict()
+        
         # Initialize authentication providers based on individual switches
         auth_methods_enabled = []
         
@@ -550,10 +575,11 @@ class AuthenticationProvider:
             raise ValueError("Missing JWT token")
 
         try:
-            # Use JWT middleware for authentication
-            from ..auth.auth_middleware import AuthMiddleware
-            middleware = AuthMiddleware(self.jwt_manager)
-            return await middleware.authenticate_request(auth_info)
+            # Use JWT middleware for authentication (created once, it only wraps jwt_manager)
+            if self._jwt_middleware is None:
+                from ..auth.auth_middleware import AuthMiddleware
+                self._jwt_middleware = AuthMiddleware(self.jwt_manager)
+            return await self._jwt_middleware.authenticate_request(auth_info)
             
         except Exception as e:
             self.logger.error(f"JWT authentication failed: {e}")
@@ -591,6 +617,15 @@ class AuthenticationProvider:
         if not token:
             raise ValueError("Missing authentication token")
 
+        # Fast path: token was verified recently and the token table has not changed since
+        cache_key = None
+        if self.auth_cache_ttl > 0:
+            cache_key = hashlib.blake2b(token.encode('utf-8'), digest_size=16).digest()
+            cached = self._get_verified_token(cache_key)
+            if cached is not None:
+                template, token_info = cached
+                return self._build_token_auth_context(template, token_info, auth_info)
+
         try:
             # Validate token using TokenManager
             validation_result = await self.token_manager.validate_token(token)
@@ -602,23 +637,71 @@ class AuthenticationProvider:
             
             # Token database configuration validation has been removed
             
-            return AuthContext(
+            template = AuthContext(
                 token_id=token_info.token_id,
                 user_id=token_info.token_id,  # Use token_id as user_id for token auth
                 roles=["token_user"],  # Default role for token users
                 permissions=["read", "write"],  # Default permissions for token users
                 security_level=SecurityLevel.INTERNAL,
-                client_ip=auth_info.get("client_ip", "unknown"),
-                session_id=auth_info.get("session_id", f"session_{token_info.token_id}"),
-                login_time=datetime.utcnow(),
-                last_activity=token_info.last_used,
                 token=token  # Store raw token for token-bound database configuration
             )
+            if cache_key is not None:
+                self._store_verified_token(cache_key, template, token_info)
+            
+            return self._build_token_auth_context(template, token_info, auth_info)
             
         except Exception as e:
             self.logger.error(f"Token authentication failed: {e}")
             raise ValueError(f"Token authentication failed: {str(e)}")
 
+    def _build_token_auth_context(self, template: AuthContext, token_info, auth_info: dict[str, Any]) -> AuthContext:
+        """Create a per-request AuthContext from a cached, never-exposed template"""
+        return replace(
+            template,
+            roles=list(template.roles),
+            permissions=list(template.permissions),
+            client_ip=auth_info.get("client_ip", "unknown"),
+            session_id=auth_info.get("session_id", f"session_{template.token_id}"),
+            login_time=datetime.utcnow(),
+            last_activity=token_info.last_used,
+        )
+
+    def _get_verified_token(self, cache_key: bytes) -> tuple[AuthContext, Any] | None:
+        """Look up a verified token, dropping it if expired, revoked or reloaded"""
+        entry = self._verified_tokens.get(cache_key)
+        if entry is None:
+            return None
+
+        template, token_info, deadline, generation = entry
+        if (
+            generation != self.token_manager.generation
+            or time.monotonic() >= deadline
+            or not token_info.is_active
+        ):
+            self._verified_tokens.pop(cache_key, None)
+            return None
+
+        self._verified_tokens.move_to_end(cache_key)
+        token_info.last_used = datetime.utcnow()
+        return template, token_info
+
+    def _store_verified_token(self, cache_key: bytes, template: AuthContext, token_info) -> None:
+        """Cache a verified token for at most auth_cache_ttl seconds, never beyond its expiry"""
+        now = time.monotonic()
+        deadline = now + self.auth_cache_ttl
+        if token_info.expires_at:
+            remaining = (token_info.expires_at - datetime.utcnow()).total_seconds()
+            deadline = min(deadline, now + remaining)
+
+        self._verified_tokens[cache_key] = (template, token_info, deadline, self.token_manager.generation)
+        self._verified_tokens.move_to_end(cache_key)
+        while len(self._verified_tokens) > self.auth_cache_max_size:
+            self._verified_tokens.popitem(last=False)
+
+    def invalidate_token_cache(self) -> None:
+        """Drop all cached token verifications"""
+        self._verified_tokens.clear()
+
     async def _authenticate_basic(self, auth_info: dict[str, Any]) -> AuthContext:
         """Basic authentication (username password)"""
         username = auth_info.get("username")
@@ -693,14 +776,43 @@ class AuthenticationProvider:
 
 
 class AuthorizationProvider:
-    """Authorization provider"""
+    """Authorization provider
+
+    Permission decisions only depend on the caller's roles, permissions and
+    security level plus the requested resource and action, so they are cached
+    under that key. The cache must be invalidated whenever the inputs that are
+    not part of the key change (token hot reload, sensitive table config).
+    """
+
+    # Upper bound on cached (principal, resource, action) decisions
+    DECISION_CACHE_SIZE = 4096
+
+    # Role permission mapping
+    ROLE_PERMISSIONS = {
+        "data_analyst": {"table": frozenset({"read"}), "view": frozenset({"read"})},
+        "data_admin": {
+            "table": frozenset({"read", "write", "admin"}),
+            "view": frozenset({"read", "write", "admin"}),
+        },
+    }
+
+    # Security level hierarchy
+    SECURITY_HIERARCHY = {
+        SecurityLevel.PUBLIC: 0,
+        SecurityLevel.INTERNAL: 1,
+        SecurityLevel.CONFIDENTIAL: 2,
+        SecurityLevel.SECRET: 3,
+    }
 
     def __init__(self, config):
         self.config = config
         self.logger = get_logger(__name__)
-        self.permission_cache = {}
+        # Decision cache: (roles, permissions, security_level, resource_uri, action) -> bool
+        self.permission_cache: OrderedDict[tuple, bool] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
         
-        # Load sensitive tables configuration
+        # Load sensitive tables configuration (keys are lower-cased for O(1) lookups)
         self.sensitive_tables = self._load_sensitive_tables()
     
     def _load_sensitive_tables(self) -> dict[str, SecurityLevel]:
@@ -714,23 +826,70 @@ class AuthorizationProvider:
         
         if hasattr(self.config, 'get'):
             config_tables = self.config.get("sensitive_tables", {})
-            # Convert string values to SecurityLevel enum
-            for table_name, level in config_tables.items():
-                if isinstance(level, str):
-                    try:
-                        default_tables[table_name] = SecurityLevel(level.lower())
-                    except ValueError:
-                        default_tables[table_name] = SecurityLevel.INTERNAL
-                else:
-                    default_tables[table_name] = level
-            return default_tables
+        elif hasattr(self.config, 'security') and hasattr(self.config.security, 'sensitive_tables'):
+            config_tables = self.config.security.sensitive_tables or {}
         else:
-            return default_tables
+            config_tables = {}
+
+        # Convert string values to SecurityLevel enum
+        for table_name, level in config_tables.items():
+            if isinstance(level, str):
+                try:
+                    default_tables[table_name] = SecurityLevel(level.lower())
+                except ValueError:
+                    default_tables[table_name] = SecurityLevel.INTERNAL
+            else:
+                default_tables[table_name] = level
+
+        return {name.lower(): level for name, level in default_tables.items()}
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached authorization decisions"""
+        if self.permission_cache:
+            self.logger.debug(f"Invalidating {len(self.permission_cache)} cached authorization decisions")
+        self.permission_cache.clear()
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get authorization decision cache statistics"""
+        total = self.cache_hits + self.cache_misses
+        return {
+            "size": len(self.permission_cache),
+            "max_size": self.DECISION_CACHE_SIZE,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_ratio": self.cache_hits / total if total else 0.0,
+        }
 
     async def check_permission(
         self, auth_context: AuthContext, resource_uri: str, action: str
     ) -> bool:
         """Check permissions"""
+        cache_key = (
+            frozenset(auth_context.roles),
+            frozenset(auth_context.permissions),
+            auth_context.security_level,
+            resource_uri,
+            action,
+        )
+        decision = self.permission_cache.get(cache_key)
+        if decision is not None:
+            self.permission_cache.move_to_end(cache_key)
+            self.cache_hits += 1
+            return decision
+
+        self.cache_misses += 1
+        decision = await self._evaluate_permission(auth_context, resource_uri, action)
+
+        self.permission_cache[cache_key] = decision
+        if len(self.permission_cache) > self.DECISION_CACHE_SIZE:
+            self.permission_cache.popitem(last=False)
+
+        return decision
+
+    async def _evaluate_permission(
+        self, auth_context: AuthContext, resource_uri: str, action: str
+    ) -> bool:
+        """Evaluate permissions without consulting the decision cache"""
         # Parse resource information
         resource_info = self._parse_resource_uri(resource_uri)
 
@@ -763,19 +922,9 @@ class AuthorizationProvider:
         self, auth_context: AuthContext, resource_info: dict[str, str], action: str
     ) -> bool:
         """Check role-based permissions"""
-        # Role permission mapping
-        role_permissions = {
-            "data_analyst": {"table": ["read"], "view": ["read"]},
-            "data_admin": {
-                "table": ["read", "write", "admin"],
-                "view": ["read", "write", "admin"],
-            },
-        }
-
         for role in auth_context.roles:
-            role_perms = role_permissions.get(role, {})
-            resource_perms = role_perms.get(resource_info["type"], [])
-            if action in resource_perms:
+            role_perms = self.ROLE_PERMISSIONS.get(role)
+            if role_perms and action in role_perms.get(resource_info["type"], ()):
                 return True
 
         return False
@@ -800,16 +949,8 @@ class AuthorizationProvider:
         # Get resource security level
         resource_security_level = self._get_resource_security_level(resource_info)
 
-        # Check if user security level is sufficient
-        security_hierarchy = {
-            SecurityLevel.PUBLIC: 0,
-            SecurityLevel.INTERNAL: 1,
-            SecurityLevel.CONFIDENTIAL: 2,
-            SecurityLevel.SECRET: 3,
-        }
-
-        user_level = security_hierarchy.get(auth_context.security_level, 0)
-        resource_level = security_hierarchy.get(resource_security_level, 0)
+        user_level = self.SECURITY_HIERARCHY.get(auth_context.security_level, 0)
+        resource_level = self.SECURITY_HIERARCHY.get(resource_security_level, 0)
 
         # User must have higher or equal security level to access resource
         return user_level >= resource_level
@@ -819,20 +960,8 @@ class AuthorizationProvider:
     ) -> SecurityLevel:
         """Get resource security level"""
         # Get table security level from configuration
-        table_name = resource_info.get("name", "")
-        
-        # Use the loaded sensitive tables
-        sensitive_tables = self.sensitive_tables
-            
-        # Convert string values to SecurityLevel enum if needed
-        security_level = sensitive_tables.get(table_name, SecurityLevel.INTERNAL)
-        if isinstance(security_level, str):
-            try:
-                security_level = SecurityLevel(security_level.lower())
-            except ValueError:
-                security_level = SecurityLevel.INTERNAL
-                
-        return security_level
+        table_name = resource_info.get("name", "").lower()
+        return self.sensitive_tables.get(table_name, SecurityLevel.INTERNAL)
 
 
 class SQLSecurityValidator:
@@ -864,6 +993,9 @@ class SQLSecurityValidator:
             self.max_query_complexity = 100
             self.enable_security_check = True
 
+        # Tables that require the admin role, precompiled for O(1) membership checks
+        self.restricted_tables = frozenset({"sensitive_data", "admin_logs"})
+
     async def validate(self, sql: str, auth_context: AuthContext) -> ValidationResult:
         """Validate SQL query security"""
         # If security check is disabled, always return valid
@@ -1130,16 +1262,15 @@ class SQLSecurityValidator:
         # Extract table names from query
         tables = self._extract_table_names(parsed)
 
+        # Admins may access every table
+        if "admin" in auth_context.roles:
+            return ValidationResult(is_valid=True)
+
         # Check access permissions for each table
-        unauthorized_tables = []
-        for table in tables:
-            # Should call authorization provider to check permissions
-            # Simplified implementation, assume some tables require special permissions
-            if (
-                table.lower() in ["sensitive_data", "admin_logs"]
-                and "admin" not in auth_context.roles
-            ):
-                unauthorized_tables.append(table)
+        restricted_tables = self.restricted_tables
+        unauthorized_tables = [
+            table for table in tables if table.lower() in restricted_tables
+        ]
 
         if unauthorized_tables:
             return ValidationResult(
@@ -0,0 +1,250 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+MCP Server Metrics
+
+Prometheus metrics about the MCP server itself, served on
+``monitoring.metrics_path``. Only a handful of timings are recorded on the
+request path (connection acquire, SQL security validation, masking and
+response bytes), each as a few integer additions without locks; everything
+else, such as per-tool call counts and latency, pool occupancy and cache hit
+ratios, is read from the existing counters when the endpoint is scraped.
+prometheus_client is imported on the first scrape.
+"""
+
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# Upper bounds in seconds for sub-second operations (a final +Inf bucket follows)
+FAST_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 10.0)
+
+
+class DurationHistogram:
+    """Fixed-bucket histogram of durations in seconds"""
+
+    __slots__ = ("name", "documentation", "buckets", "bucket_counts", "count", "total")
+
+    def __init__(self, name: str, documentation: str, buckets: Tuple[float, ...] = FAST_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.bucket_counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def observe_since(self, started: float) -> None:
+        """Record the time elapsed since ``started`` (a time.perf_counter() value)"""
+        self.observe(time.perf_counter() - started)
+
+    def cumulative_buckets(self) -> List[Tuple[str, int]]:
+        result = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, self.bucket_counts):
+            cumulative += bucket_count
+            result.append((str(bound), cumulative))
+        result.append(("+Inf", self.count))
+        return result
+
+
+class LabeledCounter:
+    """Monotonic counter per label value"""
+
+    __slots__ = ("name", "documentation", "label", "values")
+
+    def __init__(self, name: str, documentation: str, label: str):
+        self.name = name
+        self.documentation = documentation
+        self.label = label
+        self.values: Dict[str, float] = {}
+
+    def inc(self, label_value: str, amount: float = 1) -> None:
+        self.values[label_value] = self.values.get(label_value, 0) + amount
+
+
+POOL_ACQUIRE_SECONDS = DurationHistogram(
+    "doris_mcp_pool_acquire_seconds", "Time to obtain a database connection from the pool"
+)
+SECURITY_VALIDATION_SECONDS = DurationHistogram(
+    "doris_mcp_security_validation_seconds", "Time spent validating SQL against the security policies"
+)
+MASKING_SECONDS = DurationHistogram(
+    "doris_mcp_masking_seconds", "Time spent applying data masking rules to results"
+)
+RESPONSE_BYTES = LabeledCounter(
+    "doris_mcp_response_bytes", "UTF-8 bytes of tool results serialized to JSON", "encoder"
+)
+_HISTOGRAMS = (POOL_ACQUIRE_SECONDS, SECURITY_VALIDATION_SECONDS, MASKING_SECONDS)
+_COUNTERS = (RESPONSE_BYTES,)
+
+
+class ServerMetricsCollector:
+    """Reads server state at scrape time: tools, connection pool and caches"""
+
+    def __init__(self, tools_manager=None, connection_manager=None, cache_manager=None, request_counters=None):
+        self.tools_manager = tools_manager
+        self.connection_manager = connection_manager
+        self.cache_manager = cache_manager
+        self.request_counters = request_counters
+
+    def describe(self) -> Iterable:
+        # Metrics are generated from live state, nothing to describe up front
+        return []
+
+    def collect(self) -> Iterable:
+        for collect in (
+            self._collect_instruments, self._collect_tools, self._collect_pool,
+            self._collect_caches, self._collect_requests,
+        ):
+            try:
+                yield from collect()
+            except Exception as e:
+                logger.warning(f"Failed to collect {collect.__name__[9:]} metrics: {e}")
+
+    def _collect_instruments(self) -> Iterable:
+        from prometheus_client.core import CounterMetricFamily, HistogramMetricFamily
+
+        for histogram in _HISTOGRAMS:
+            family = HistogramMetricFamily(histogram.name, histogram.documentation)
+            family.add_metric([], histogram.cumulative_buckets(), histogram.total)
+            yield family
+        for counter in _COUNTERS:
+            family = CounterMetricFamily(counter.name, counter.documentation, labels=[counter.label])
+            for label_value, value in sorted(counter.values.items()):
+                family.add_metric([label_value], value)
+            yield family
+
+    def _collect_tools(self) -> Iterable:
+        from prometheus_client.core import CounterMetricFamily, HistogramMetricFamily
+
+        if self.tools_manager is None:
+            return
+        calls = CounterMetricFamily("doris_mcp_tool_calls", "MCP tool calls", labels=["tool"])
+        errors = CounterMetricFamily("doris_mcp_tool_errors", "MCP tool calls that raised or timed out", labels=["tool"])
+        latency = HistogramMetricFamily("doris_mcp_tool_duration_seconds", "MCP tool call latency", labels=["tool"])
+        for tool, stats in sorted(self.tools_manager.get_tool_latency_stats().items()):
+            calls.add_metric([tool], stats["count"])
+            errors.add_metric([tool], stats["errors"])
+            latency.add_metric([tool], list(stats["buckets"].items()), stats["sum"])
+        yield from (calls, errors, latency)
+
+    def _collect_pool(self) -> Iterable:
+        from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+        manager = self.connection_manager
+        if manager is None:
+            return
+        pool = getattr(manager, "pool", None)
+        size = pool.size if pool is not None else 0
+        free = pool.freesize if pool is not None else 0
+        gauges = (
+            ("doris_mcp_pool_size", "Open connections in the database pool", size),
+            ("doris_mcp_pool_max_size", "Maximum connections in the database pool", pool.maxsize if pool is not None else 0),
+            ("doris_mcp_pool_free_connections", "Idle connections in the database pool", free),
+            ("doris_mcp_pool_active_connections", "Connections checked out of the database pool", size - free),
+            ("doris_mcp_pool_waiting", "Callers waiting for a database connection", getattr(manager, "acquire_waiting", 0)),
+        )
+        for name, documentation, value in gauges:
+            yield GaugeMetricFamily(name, documentation, value=value)
+        metrics = getattr(manager, "metrics", None)
+        if metrics is not None:
+            yield CounterMetricFamily(
+                "doris_mcp_pool_connection_errors", "Database connection errors", value=metrics.connection_errors
+            )
+
+    def _collect_caches(self) -> Iterable:
+        from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+        hits = CounterMetricFamily("doris_mcp_cache_hits", "Cache hits", labels=["cache"])
+        misses = CounterMetricFamily("doris_mcp_cache_misses", "Cache misses", labels=["cache"])
+        ratio = GaugeMetricFamily("doris_mcp_cache_hit_ratio", "Cache hits / lookups since start", labels=["cache"])
+        entries = GaugeMetricFamily("doris_mcp_cache_entries", "Entries held in the cache", labels=["cache"])
+
+        caches = []
+        query_executor = getattr(self.tools_manager, "query_executor", None)
+        if query_executor is not None:
+            caches.append((
+                "query",
+                query_executor.metrics.cache_hits,
+                query_executor.metrics.cache_misses,
+                len(query_executor.query_cache.cache),
+            ))
+        if self.cache_manager is not None:
+            caches.append((
+                "metadata",
+                self.cache_manager.hits,
+                self.cache_manager.misses,
+                len(self.cache_manager.metadata_cache),
+            ))
+        for cache, cache_hits, cache_misses, size in caches:
+            lookups = cache_hits + cache_misses
+            hits.add_metric([cache], cache_hits)
+            misses.add_metric([cache], cache_misses)
+            ratio.add_metric([cache], cache_hits / lookups if lookups else 0.0)
+            entries.add_metric([cache], size)
+        yield from (hits, misses, ratio, entries)
+
+    def _collect_requests(self) -> Iterable:
+        from prometheus_client.core import CounterMetricFamily
+
+        if self.request_counters is not None:
+            yield CounterMetricFamily(
+                "doris_mcp_http_requests", "HTTP requests received",
+                value=self.request_counters.get("http_requests", 0),
+            )
+
+
+_server_collector = ServerMetricsCollector()
+_registry = None
+
+
+def register_server(**components: Any) -> ServerMetricsCollector:
+    """Export the state of one server instance (tools_manager, connection_manager, ...)"""
+    global _server_collector
+    _server_collector = ServerMetricsCollector(**components)
+    return _server_collector
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Render every server metric, returning the body and its content type"""
+    global _registry
+    from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, generate_latest
+
+    if _registry is None:
+        from prometheus_client.process_collector import ProcessCollector
+
+        # Separate from the prometheus_client default registry so only server metrics are exported
+        _registry = CollectorRegistry(auto_describe=False)
+        ProcessCollector(registry=_registry)
+        _registry.register(_ServerCollectorProxy())
+    return generate_latest(_registry), CONTENT_TYPE_LATEST
+
+
+class _ServerCollectorProxy:
+    """Registered once; forwards to the most recently registered server"""
+
+    def collect(self) -> Iterable:
+        return _server_collector.collect()
@@ -0,0 +1,197 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Tool Call Tracing
+
+Sampled per-call timing of the stages a tool call goes through (HTTP auth,
+SQL security validation, pool acquire, Doris execution, masking, row
+formatting, response budgeting and JSON encoding). The sampling decision is
+made once per call in ``Tracer.start``; instrumented code only looks up the
+active trace in a context variable, so calls that are not sampled pay a
+single lookup per stage.
+
+Sampled calls get a ``stages_ms`` breakdown in ``_execution_info`` and are
+handed to the configured exporter: ``log`` writes one line per call and
+``otel`` emits OpenTelemetry spans through the globally configured tracer
+provider (opentelemetry-api is imported when the tracer is created).
+"""
+
+import random
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+TRACE_EXPORTERS = ("none", "log", "otel")
+
+# (stage name, perf_counter start, perf_counter end)
+Span = Tuple[str, float, float]
+
+_active_trace: ContextVar[Optional["Trace"]] = ContextVar("doris_mcp_trace", default=None)
+# Spans measured before the trace of a call starts, e.g. authentication of the HTTP request
+_carried_spans: ContextVar[Tuple[Span, ...]] = ContextVar("doris_mcp_carried_spans", default=())
+
+
+class Trace:
+    """Spans of one sampled tool call"""
+
+    __slots__ = ("name", "started", "started_ns", "spans", "_token")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started = time.perf_counter()
+        self.started_ns = time.time_ns()
+        self.spans: List[Span] = []
+        self._token = None
+
+    def breakdown(self) -> Dict[str, float]:
+        """Milliseconds per stage; repeated stages (e.g. retries) are summed"""
+        stages: Dict[str, float] = {}
+        for name, started, ended in self.spans:
+            stages[name] = stages.get(name, 0.0) + (ended - started) * 1000
+        return {name: round(ms, 3) for name, ms in stages.items()}
+
+    def wall_time_ns(self, perf_time: float) -> int:
+        """Convert a perf_counter value to nanoseconds since the epoch"""
+        return self.started_ns + int((perf_time - self.started) * 1e9)
+
+
+class _StageSpan:
+    __slots__ = ("trace", "name", "started")
+
+    def __init__(self, trace: Trace, name: str):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.trace.spans.append((self.name, self.started, time.perf_counter()))
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name: str):
+    """Context manager timing stage ``name`` of the active trace, if any"""
+    trace = _active_trace.get()
+    if trace is None:
+        return _NOOP_SPAN
+    return _StageSpan(trace, name)
+
+
+def record_span(name: str, started: float, ended: Optional[float] = None) -> None:
+    """Record stage ``name`` timed by the caller (time.perf_counter() values)"""
+    trace = _active_trace.get()
+    if trace is not None:
+        trace.spans.append((name, started, time.perf_counter() if ended is None else ended))
+
+
+def carry_span(name: str, started: float, ended: float) -> None:
+    """Attach a stage measured before the call started to the next trace in this context"""
+    _carried_spans.set(_carried_spans.get() + ((name, started, ended),))
+
+
+class Tracer:
+    """Samples tool calls and exports their traces"""
+
+    def __init__(self, sample_rate: float = 0.0, exporter: str = "none"):
+        self.sample_rate = sample_rate
+        self.exporter = exporter if exporter in TRACE_EXPORTERS else "none"
+        self._otel_tracer = None
+        if self.exporter != exporter:
+            logger.warning(f"Unknown trace exporter '{exporter}', expected one of: {', '.join(TRACE_EXPORTERS)}")
+        if self.exporter == "otel":
+            try:
+                from opentelemetry import trace as otel_trace
+
+                self._otel_tracer = otel_trace.get_tracer("doris_mcp_server")
+            except ImportError:
+                logger.warning("opentelemetry-api is not installed, falling back to the log trace exporter")
+                self.exporter = "log"
+
+    @classmethod
+    def from_config(cls, config) -> "Tracer":
+        """Create a tracer from ``config.monitoring.trace_sample_rate`` and ``trace_exporter``"""
+        return cls(config.monitoring.trace_sample_rate, config.monitoring.trace_exporter)
+
+    def start(self, name: str) -> Optional[Trace]:
+        """Begin tracing a call if it is sampled; returns None otherwise"""
+        carried = _carried_spans.get()
+        if carried:
+            _carried_spans.set(())
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return None
+        trace = Trace(name)
+        trace.spans.extend(carried)
+        trace._token = _active_trace.set(trace)
+        return trace
+
+    def finish(self, trace: Trace) -> None:
+        """Stop tracing the call and export it"""
+        ended = time.perf_counter()
+        _active_trace.reset(trace._token)
+        try:
+            if self.exporter == "log":
+                self._export_log(trace, ended)
+            elif self.exporter == "otel":
+                self._export_otel(trace, ended)
+        except Exception as e:
+            logger.warning(f"Failed to export trace of {trace.name}: {e}")
+
+    def _export_log(self, trace: Trace, ended: float) -> None:
+        stages = " ".join(f"{name}={ms}" for name, ms in trace.breakdown().items())
+        logger.info(f"Trace {trace.name} {(ended - trace.started) * 1000:.3f}ms: {stages}")
+
+    def _export_otel(self, trace: Trace, ended: float) -> None:
+        from opentelemetry import trace as otel_trace
+
+        tracer = self._otel_tracer
+        # Carried spans (auth) start before the call, so the root span covers them too
+        started = min([trace.started] + [span_start for _, span_start, _ in trace.spans])
+        root = tracer.start_span(
+            f"tools/call {trace.name}",
+            start_time=trace.wall_time_ns(started),
+            attributes={"mcp.tool.name": trace.name},
+        )
+        context = otel_trace.set_span_in_context(root)
+        for name, span_start, span_end in trace.spans:
+            child = tracer.start_span(name, context=context, start_time=trace.wall_time_ns(span_start))
+            child.end(end_time=trace.wall_time_ns(span_end))
+        root.end(end_time=trace.wall_time_ns(ended))
+
+
+def current_trace() -> Optional[Trace]:
+    """The trace of the call running in this context, if it is sampled"""
+    return _active_trace.get()
+
@@ -0,0 +1,267 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Multi-process HTTP serving
+
+WorkerSupervisor runs N worker processes that each bind their own listening
+socket with SO_REUSEPORT, so the kernel balances connections across them with
+no shared accept lock. Workers that exit unexpectedly are restarted, with a
+backoff when they keep failing at startup. Each worker publishes a small stats
+snapshot to a shared directory, which /health aggregates across the pool.
+"""
+
+import json
+import multiprocessing
+import os
+import shutil
+import signal
+import socket
+import tempfile
+import time
+from multiprocessing.connection import wait
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+REUSE_PORT_SUPPORTED = hasattr(socket, "SO_REUSEPORT")
+
+# Worker stats older than this many seconds are reported as stale
+STATS_STALE_AFTER = 30.0
+
+SUPERVISOR_STATS_FILE = "supervisor.json"
+
+
+def create_reuseport_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """Create a listening socket that other workers can bind to the same address"""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind((host, port))
+        sock.listen(backlog)
+        sock.setblocking(False)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _write_json(path: str, payload: Dict[str, Any]):
+    """Atomically replace ``path`` with ``payload`` encoded as JSON"""
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=".stats-", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, default=str)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _read_json(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_worker_stats(stats_dir: str, worker_index: int, stats: Dict[str, Any]):
+    """Publish the stats snapshot of one worker"""
+    payload = dict(stats, worker=worker_index, pid=os.getpid(), updated_at=time.time())
+    _write_json(os.path.join(stats_dir, f"worker-{worker_index}.json"), payload)
+
+
+def read_pool_stats(stats_dir: str) -> Dict[str, Any]:
+    """Aggregate the published worker stats and supervisor state"""
+    supervisor = _read_json(os.path.join(stats_dir, SUPERVISOR_STATS_FILE)) or {}
+    restarts = supervisor.get("restarts", {})
+    now = time.time()
+
+    per_worker = []
+    totals: Dict[str, float] = {}
+    for index in range(supervisor.get("worker_count", 0)):
+        stats = _read_json(os.path.join(stats_dir, f"worker-{index}.json"))
+        if stats is None:
+            per_worker.append({"worker": index, "status": "starting", "restarts": restarts.get(str(index), 0)})
+            continue
+        stale = now - stats.get("updated_at", 0) > STATS_STALE_AFTER
+        stats["status"] = "stale" if stale else "running"
+        stats["restarts"] = restarts.get(str(index), 0)
+        per_worker.append(stats)
+        if not stale:
+            for key, value in stats.get("counters", {}).items():
+                totals[key] = totals.get(key, 0) + value
+
+    return {
+        "worker_count": supervisor.get("worker_count", 0),
+        "running": sum(1 for stats in per_worker if stats["status"] == "running"),
+        "restarts": sum(restarts.values()),
+        "supervisor_pid": supervisor.get("pid"),
+        "totals": totals,
+        "workers": per_worker,
+    }
+
+
+class WorkerSupervisor:
+    """Runs and restarts a fixed pool of worker processes"""
+
+    def __init__(
+        self,
+        worker_count: int,
+        target: Callable[..., Any],
+        args: Tuple[Any, ...] = (),
+        stats_dir: Optional[str] = None,
+        min_uptime: float = 10.0,
+        max_restart_delay: float = 30.0,
+        shutdown_timeout: float = 10.0,
+    ):
+        """
+        Args:
+            worker_count: Number of worker processes
+            target: Module-level worker entry point, called as
+                ``target(*args, worker_index, stats_dir)`` in a spawned process
+            args: Leading positional arguments for ``target`` (must be picklable)
+            stats_dir: Directory for worker stats (default: a temporary directory)
+            min_uptime: Workers exiting sooner than this are restarted with backoff
+            max_restart_delay: Upper bound of the restart backoff in seconds
+            shutdown_timeout: Seconds to wait for workers after SIGTERM before killing them
+        """
+        self.worker_count = worker_count
+        self.target = target
+        self.args = args
+        self._owns_stats_dir = stats_dir is None
+        self.stats_dir = stats_dir or tempfile.mkdtemp(prefix="doris-mcp-workers-")
+        self.min_uptime = min_uptime
+        self.max_restart_delay = max_restart_delay
+        self.shutdown_timeout = shutdown_timeout
+
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: Dict[int, Any] = {}
+        self._started_at: Dict[int, float] = {}
+        self._restarts: Dict[int, int] = {index: 0 for index in range(worker_count)}
+        self._fast_failures: Dict[int, int] = {index: 0 for index in range(worker_count)}
+        self._pending_restarts: Dict[int, float] = {}
+        self._stopping = False
+
+    def run(self) -> int:
+        """Start the pool and supervise it until SIGINT or SIGTERM; must run in the main thread"""
+        previous_handlers = {
+            signum: signal.signal(signum, self._request_stop)
+            for signum in (signal.SIGINT, signal.SIGTERM)
+        }
+        try:
+            for index in range(self.worker_count):
+                self._spawn(index)
+            self._publish_state()
+            logger.info(f"Supervisor {os.getpid()} started {self.worker_count} workers, stats in {self.stats_dir}")
+
+            while not self._stopping:
+                sentinels = {process.sentinel: index for index, process in self._processes.items()}
+                for sentinel in wait(list(sentinels), timeout=1.0):
+                    self._on_exit(sentinels[sentinel])
+                self._restart_due()
+            return 0
+        finally:
+            self._stop_workers()
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+            if self._owns_stats_dir:
+                shutil.rmtree(self.stats_dir, ignore_errors=True)
+
+    def stop(self):
+        """Ask the supervision loop to stop (takes effect within a second)"""
+        self._stopping = True
+
+    def _request_stop(self, signum, frame):
+        logger.info(f"Supervisor received signal {signum}, stopping workers")
+        self._stopping = True
+
+    def _spawn(self, index: int):
+        process = self._context.Process(
+            target=self.target,
+            args=(*self.args, index, self.stats_dir),
+            name=f"doris-mcp-worker-{index}",
+        )
+        process.start()
+        self._processes[index] = process
+        self._started_at[index] = time.monotonic()
+        logger.info(f"Started worker {index} (pid {process.pid})")
+
+    def _on_exit(self, index: int):
+        process = self._processes.pop(index)
+        process.join()
+        if self._stopping:
+            return
+
+        uptime = time.monotonic() - self._started_at[index]
+        if uptime < self.min_uptime:
+            self._fast_failures[index] += 1
+            delay = min(self.max_restart_delay, 2 ** (self._fast_failures[index] - 1))
+        else:
+            self._fast_failures[index] = 0
+            delay = 0.0
+        logger.warning(
+            f"Worker {index} (pid {process.pid}) exited with code {process.exitcode} "
+            f"after {uptime:.1f}s, restarting in {delay:.0f}s"
+        )
+        self._pending_restarts[index] = time.monotonic() + delay
+
+    def _restart_due(self):
+        now = time.monotonic()
+        for index, due in list(self._pending_restarts.items()):
+            if due <= now and not self._stopping:
+                del self._pending_restarts[index]
+                self._restarts[index] += 1
+                self._spawn(index)
+                self._publish_state()
+
+    def _publish_state(self):
+        try:
+            _write_json(
+                os.path.join(self.stats_dir, SUPERVISOR_STATS_FILE),
+                {
+                    "pid": os.getpid(),
+                    "worker_count": self.worker_count,
+                    "restarts": {str(index): count for index, count in self._restarts.items()},
+                    "pids": {str(index): process.pid for index, process in self._processes.items()},
+                },
+            )
+        except OSError as e:
+            logger.warning(f"Failed to publish supervisor state: {e}")
+
+    def _stop_workers(self):
+        self._stopping = True
+        processes = list(self._processes.values())
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        deadline = time.monotonic() + self.shutdown_timeout
+        for process in processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning(f"Worker pid {process.pid} did not stop in time, killing it")
+                process.kill()
+                process.join()
+        self._processes.clear()
@@ -21,6 +21,7 @@ Authentication module tests
 
 import pytest
 from datetime import datetime
+from unittest.mock import patch
 
 from doris_mcp_server.utils.security import (
     AuthenticationProvider,
@@ -100,4 +101,46 @@ class TestAuthenticationProvider:
         }
         
         with pytest.raises(Exception):
-            await auth_provider.authenticate(auth_info) 
\ No newline at end of file
+            await auth_provider.authenticate(auth_info) 
+
+class TestTokenAuthenticationCache:
+    """Verified-token fast path tests"""
+
+    @pytest.fixture
+    def token_config(self, test_config, tmp_path):
+        """Enable token auth with an isolated token file"""
+        test_config.security.enable_token_auth = True
+        test_config.security.token_file_path = str(tmp_path / "tokens.json")
+        return test_config
+
+    @pytest.mark.asyncio
+    async def test_verified_token_served_from_cache(self, token_config):
+        """Test repeated authentication skips TokenManager validation"""
+        provider = AuthenticationProvider(token_config)
+        try:
+            token = await provider.token_manager.create_token("cached", custom_token="cached_token_value")
+            first = await provider.authenticate_token({"token": token, "client_ip": "10.0.0.1"})
+
+            with patch.object(provider.token_manager, "validate_token", side_effect=AssertionError):
+                second = await provider.authenticate_token({"token": token, "client_ip": "10.0.0.2"})
+
+            assert second is not first
+            assert second.token_id == "cached"
+            assert second.client_ip == "10.0.0.2"
+        finally:
+            provider.token_manager.stop_hot_reload()
+
+    @pytest.mark.asyncio
+    async def test_revoked_token_not_served_from_cache(self, token_config):
+        """Test revocation invalidates cached verifications"""
+        provider = AuthenticationProvider(token_config)
+        try:
+            token = await provider.token_manager.create_token("revoked", custom_token="revoked_token_value")
+            await provider.authenticate_token({"token": token})
+
+            await provider.token_manager.revoke_token("revoked")
+
+            with pytest.raises(ValueError):
+                await provider.authenticate_token({"token": token})
+        finally:
+            provider.token_manager.stop_hot_reload()
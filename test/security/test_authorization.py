@@ -144,4 +144,35 @@ class TestAuthorizationProvider:
         
         level = authz_provider._get_resource_security_level(resource_info)
         
-        assert level == SecurityLevel.CONFIDENTIAL 
\ No newline at end of file
+        assert level == SecurityLevel.CONFIDENTIAL
+
+    def test_sensitive_table_lookup_is_case_insensitive(self, authz_provider):
+        """Test sensitive table lookup ignores table name case"""
+        level = authz_provider._get_resource_security_level({"name": "Payment_Records", "type": "table"})
+
+        assert level == SecurityLevel.SECRET
+
+    @pytest.mark.asyncio
+    async def test_decision_cache_hit(self, authz_provider, analyst_context):
+        """Test repeated permission checks are served from the decision cache"""
+        resource_uri = "/api/table/some_table"
+
+        first = await authz_provider.check_permission(analyst_context, resource_uri, "read")
+        second = await authz_provider.check_permission(analyst_context, resource_uri, "read")
+
+        assert first is True and second is True
+        stats = authz_provider.get_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_decision_cache_invalidation(self, authz_provider, analyst_context):
+        """Test invalidation forces decisions to be re-evaluated"""
+        resource_uri = "/api/table/some_table"
+        await authz_provider.check_permission(analyst_context, resource_uri, "read")
+
+        authz_provider.sensitive_tables["some_table"] = SecurityLevel.SECRET
+        authz_provider.invalidate_cache()
+
+        result = await authz_provider.check_permission(analyst_context, resource_uri, "read")
+        assert result is False
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+JWT manager tests
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from doris_mcp_server.auth.jwt_manager import JWTManager
+
+
+class TestJWTManager:
+    """JWT manager verification cache tests"""
+
+    @pytest.fixture
+    async def jwt_manager(self, test_config):
+        """Create an initialized HS256 JWT manager"""
+        test_config.security.jwt_algorithm = "HS256"
+        test_config.security.jwt_secret_key = "test_jwt_secret_key_for_unit_tests"
+        manager = JWTManager(test_config)
+        assert await manager.initialize()
+        yield manager
+        await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_verified_token_skips_signature_check(self, jwt_manager):
+        """Test repeated validation reuses the verified payload"""
+        tokens = await jwt_manager.generate_tokens({"user_id": "analyst1", "roles": ["data_analyst"]})
+        token = tokens["access_token"]
+
+        first = await jwt_manager.validate_token(token)
+
+        with patch("doris_mcp_server.auth.jwt_manager.jwt.decode", side_effect=AssertionError):
+            second = await jwt_manager.validate_token(token)
+
+        assert first["user_id"] == second["user_id"] == "analyst1"
+
+    @pytest.mark.asyncio
+    async def test_revoked_token_rejected_after_caching(self, jwt_manager):
+        """Test blacklisted tokens are rejected even when cached"""
+        tokens = await jwt_manager.generate_tokens({"user_id": "analyst1"})
+        token = tokens["access_token"]
+        await jwt_manager.validate_token(token)
+
+        assert await jwt_manager.revoke_token(token)
+
+        with pytest.raises(ValueError):
+            await jwt_manager.validate_token(token)
+
+    @pytest.mark.asyncio
+    async def test_key_rotation_invalidates_cache(self, jwt_manager):
+        """Test tokens signed with a rotated-out key are rejected"""
+        tokens = await jwt_manager.generate_tokens({"user_id": "analyst1"})
+        token = tokens["access_token"]
+        await jwt_manager.validate_token(token)
+
+        await jwt_manager.key_manager.rotate_keys()
+        jwt_manager._build_verification_context()
+
+        with pytest.raises(ValueError):
+            await jwt_manager.validate_token(token)
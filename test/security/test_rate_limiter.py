@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Rate limiter tests
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from doris_mcp_server.auth.token_validators import (
+    RateLimiter,
+    SharedRateLimiter,
+    create_rate_limiter,
+)
+
+
+class TestRateLimiter:
+    """Sliding-window rate limiter tests"""
+
+    @pytest.mark.asyncio
+    async def test_limit_enforced_within_window(self):
+        """Requests beyond the limit are rejected"""
+        limiter = RateLimiter(max_requests=3, time_window=60)
+        with patch("doris_mcp_server.auth.token_validators.time.time", return_value=6000.0):
+            assert [await limiter.is_allowed("alice") for _ in range(4)] == [True, True, True, False]
+            assert await limiter.is_allowed("bob")
+
+            usage = await limiter.get_usage("alice")
+        assert usage["requests_in_window"] == 3
+        assert usage["remaining_requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_previous_window_is_weighted(self):
+        """The previous window counts in proportion to its overlap"""
+        limiter = RateLimiter(max_requests=4, time_window=60)
+        time_path = "doris_mcp_server.auth.token_validators.time.time"
+        with patch(time_path, return_value=6000.0):
+            for _ in range(4):
+                assert await limiter.is_allowed("alice")
+        # Halfway through the next window half of the previous requests still count
+        with patch(time_path, return_value=6090.0):
+            assert (await limiter.get_usage("alice"))["requests_in_window"] == 2
+            assert await limiter.is_allowed("alice")
+            assert await limiter.is_allowed("alice")
+            assert not await limiter.is_allowed("alice")
+
+    @pytest.mark.asyncio
+    async def test_idle_keys_are_evicted(self):
+        """Keys idle for a full window and keys over the budget are dropped"""
+        limiter = RateLimiter(max_requests=10, time_window=60, max_keys=2)
+        time_path = "doris_mcp_server.auth.token_validators.time.time"
+        with patch(time_path, return_value=6000.0):
+            for user in ("a", "b", "c"):
+                await limiter.is_allowed(user)
+        assert list(limiter._windows) == ["b", "c"]
+
+        with patch(time_path, return_value=6200.0):
+            await limiter.is_allowed("d")
+        assert list(limiter._windows) == ["d"]
+
+
+class TestSharedRateLimiter:
+    """Shared-memory rate limiter tests"""
+
+    @pytest.mark.asyncio
+    async def test_limit_shared_between_instances(self, tmp_path):
+        """Separate attachments (as in separate workers) share one budget"""
+        path = str(tmp_path / "rate_limit.bin")
+        first = SharedRateLimiter(path, max_requests=3, time_window=60, slots=64)
+        second = SharedRateLimiter(path, max_requests=3, time_window=60, slots=64)
+        try:
+            assert await first.is_allowed("alice")
+            assert await second.is_allowed("alice")
+            assert await first.is_allowed("alice")
+            assert not await second.is_allowed("alice")
+            assert await second.is_allowed("bob")
+            assert (await first.get_usage("alice"))["remaining_requests"] == 0
+        finally:
+            first.close()
+            second.close()
+
+    @pytest.mark.asyncio
+    async def test_full_probe_run_recycles_slots(self, tmp_path):
+        """More users than slots never fails, old slots are recycled"""
+        limiter = SharedRateLimiter(str(tmp_path / "rate_limit.bin"), max_requests=1, time_window=60, slots=4)
+        try:
+            for index in range(20):
+                assert await limiter.is_allowed(f"user_{index}")
+        finally:
+            limiter.close()
+
+    def test_backend_selected_from_config(self, test_config, tmp_path):
+        """The security configuration selects the backend"""
+        assert type(create_rate_limiter(test_config.security)) is RateLimiter
+
+        test_config.security.rate_limit_backend = "shared"
+        test_config.security.rate_limit_shared_path = str(tmp_path / "rate_limit.bin")
+        limiter = create_rate_limiter(test_config.security)
+        try:
+            assert isinstance(limiter, SharedRateLimiter)
+        finally:
+            limiter.close()
+
+    def test_shared_backend_requires_path(self, test_config):
+        """Without a configured path the shared backend never uses a host-wide file"""
+        test_config.security.rate_limit_backend = "shared"
+        test_config.security.rate_limit_shared_path = ""
+        assert type(create_rate_limiter(test_config.security)) is RateLimiter
@@ -19,6 +19,8 @@
 Security manager integration tests
 """
 
+import json
+
 import pytest
 
 from doris_mcp_server.utils.security import (
@@ -169,4 +171,35 @@ class TestDorisSecurityManager:
         # Each level should be properly defined
         for level in levels:
             assert isinstance(level, SecurityLevel)
-            assert level.value in ["public", "internal", "confidential", "secret"] 
\ No newline at end of file
+            assert level.value in ["public", "internal", "confidential", "secret"]
+
+    @pytest.mark.asyncio
+    async def test_token_file_reload_invalidates_authorization_cache(self, test_config, tmp_path):
+        """Hot-reloading tokens.json drops cached authorization decisions"""
+        token_file = tmp_path / "tokens.json"
+        token_file.write_text(json.dumps({"tokens": [
+            {"token_id": "alpha", "token": "alpha_token_value", "expires_hours": None},
+        ]}))
+        test_config.security.enable_token_auth = True
+        test_config.security.token_file_path = str(token_file)
+        security_manager = DorisSecurityManager(test_config)
+        token_manager = security_manager.auth_provider.token_manager
+        try:
+            auth_context = AuthContext(
+                user_id="analyst1",
+                roles=["data_analyst"],
+                permissions=["read_data"],
+                session_id="session_123",
+                security_level=SecurityLevel.INTERNAL
+            )
+            await security_manager.authorize_resource_access(auth_context, "/api/table/public_reports")
+            assert security_manager.authz_provider.get_cache_stats()["size"] == 1
+
+            token_file.write_text(json.dumps({"tokens": [
+                {"token_id": "beta", "token": "beta_token_value", "expires_hours": None},
+            ]}))
+            token_manager._file_last_modified = 0
+            await token_manager._reload_token_file()
+            assert security_manager.authz_provider.get_cache_stats()["size"] == 0
+        finally:
+            token_manager.stop_hot_reload()
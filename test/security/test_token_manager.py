@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Token manager persistence and hot reload tests
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from doris_mcp_server.auth.token_manager import TokenManager
+
+
+class TestTokenManagerPersistence:
+    """Token file persistence and incremental hot reload tests"""
+
+    @pytest.fixture
+    async def token_manager(self, test_config, tmp_path):
+        """Create a token manager backed by an isolated token file"""
+        token_file = tmp_path / "tokens.json"
+        token_file.write_text(json.dumps({"tokens": [
+            {"token_id": "alpha", "token": "alpha_token_value", "expires_hours": None},
+            {"token_id": "beta", "token": "beta_token_value", "expires_hours": None},
+        ]}))
+        test_config.security.token_file_path = str(token_file)
+        manager = TokenManager(test_config)
+        yield manager
+        manager.stop_hot_reload()
+
+    def _write_tokens(self, manager, tokens):
+        with open(manager.token_file_path, "w", encoding="utf-8") as f:
+            json.dump({"tokens": tokens}, f)
+
+    @pytest.mark.asyncio
+    async def test_create_and_revoke_persist_atomically(self, token_manager, tmp_path):
+        """Created and revoked tokens are written through without leftover temp files"""
+        await token_manager.create_token("gamma", custom_token="gamma_token_value")
+        with open(token_manager.token_file_path, encoding="utf-8") as f:
+            assert "gamma" in [t["token_id"] for t in json.load(f)["tokens"]]
+
+        await token_manager.revoke_token("alpha")
+        with open(token_manager.token_file_path, encoding="utf-8") as f:
+            assert [t["token_id"] for t in json.load(f)["tokens"]] == ["beta", "gamma"]
+        # Only the token file and the lock file serializing updates across workers remain
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["tokens.json", "tokens.json.lock"]
+
+    @pytest.mark.asyncio
+    async def test_reload_applies_diff(self, token_manager):
+        """Reload adds, removes and changes entries while keeping unchanged state"""
+        beta_info = (await token_manager.validate_token("beta_token_value")).token_info
+
+        self._write_tokens(token_manager, [
+            {"token_id": "alpha", "token": "alpha_rotated_value", "expires_hours": None},
+            {"token_id": "beta", "token": "beta_token_value", "expires_hours": None},
+            {"token_id": "delta", "token": "delta_token_value", "expires_hours": None},
+        ])
+        assert token_manager._apply_token_file(token_manager._read_token_file()) == (1, 0, 1)
+        assert not (await token_manager.validate_token("alpha_token_value")).is_valid
+        assert (await token_manager.validate_token("alpha_rotated_value")).is_valid
+        assert (await token_manager.validate_token("delta_token_value")).is_valid
+        assert (await token_manager.validate_token("beta_token_value")).token_info is beta_info
+
+        self._write_tokens(token_manager, [
+            {"token_id": "beta", "token": "beta_token_value", "expires_hours": None},
+        ])
+        assert token_manager._apply_token_file(token_manager._read_token_file()) == (0, 2, 0)
+        assert len(token_manager._tokens) == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_file_leaves_tokens_untouched(self, token_manager):
+        """A malformed entry aborts the reload before any token is removed"""
+        generation = token_manager.generation
+        self._write_tokens(token_manager, [{"description": "missing token fields"}])
+
+        with pytest.raises(KeyError):
+            token_manager._apply_token_file(token_manager._read_token_file())
+        assert token_manager.generation == generation
+        assert (await token_manager.validate_token("alpha_token_value")).is_valid
+
+    @pytest.mark.asyncio
+    async def test_reload_does_not_undo_concurrent_create(self, token_manager):
+        """A reload that read the file before a create finished keeps the new token"""
+        self._write_tokens(token_manager, [
+            {"token_id": "alpha", "token": "alpha_token_value", "expires_hours": None},
+        ])
+        token_manager._file_last_modified = 0
+        reload_task = asyncio.create_task(token_manager._reload_token_file())
+        await asyncio.sleep(0)  # the reload holds the file lock while reading
+
+        raw_token = await token_manager.create_token("gamma", custom_token="gamma_token_value")
+        await reload_task
+        assert (await token_manager.validate_token(raw_token)).is_valid
+        assert not (await token_manager.validate_token("beta_token_value")).is_valid
+
+        # The server's own write is not applied again as an external change
+        generation = token_manager.generation
+        await token_manager._reload_token_file()
+        assert token_manager.generation == generation
+
+    @pytest.mark.asyncio
+    async def test_concurrent_updates_from_workers_are_not_lost(self, token_manager, test_config):
+        """Managers sharing the token file (HTTP workers) never overwrite each other's updates"""
+        other = TokenManager(test_config)
+        try:
+            await asyncio.gather(*(
+                manager.create_token(f"{name}_{i}", custom_token=f"{name}_token_value_{i}")
+                for i in range(10)
+                for name, manager in (("first", token_manager), ("second", other))
+            ))
+        finally:
+            other.stop_hot_reload()
+        with open(token_manager.token_file_path, encoding="utf-8") as f:
+            token_ids = {t["token_id"] for t in json.load(f)["tokens"]}
+        assert {f"{name}_{i}" for i in range(10) for name in ("first", "second")} <= token_ids
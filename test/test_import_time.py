@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Import time tests
+
+Guards the cold start of ``doris-mcp-server --transport stdio``, where desktop MCP
+hosts spawn a server process per client session.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Cumulative import time budget of doris_mcp_server.main in milliseconds
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "3000"))
+
+# Dependencies that must only be imported when a tool needs them
+LAZY_MODULES = (
+    "pandas",
+    "numpy",
+    "pyarrow",
+    "aiohttp",
+    "adbc_driver_manager",
+    "adbc_driver_flightsql",
+    "jwt",
+    "doris_mcp_server.utils.data_governance_tools",
+    "doris_mcp_server.utils.data_exploration_tools",
+    "doris_mcp_server.utils.data_quality_tools",
+    "doris_mcp_server.utils.security_analytics_tools",
+    "doris_mcp_server.utils.dependency_analysis_tools",
+    "doris_mcp_server.utils.performance_analytics_tools",
+    "doris_mcp_server.utils.adbc_query_tools",
+)
+
+
+def _import_times(module: str) -> dict:
+    """Run ``python -X importtime -c 'import module'`` and return cumulative microseconds per module"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+@pytest.mark.parametrize("module", ["doris_mcp_server.main", "doris_mcp_server.tools.tools_manager"])
+def test_heavy_dependencies_are_lazy(module):
+    times = _import_times(module)
+    assert module in times
+    eager = [name for name in LAZY_MODULES if name in times]
+    assert eager == [], f"Imported at startup: {eager}"
+
+
+def test_main_import_time_budget():
+    times = _import_times("doris_mcp_server.main")
+    elapsed_ms = times["doris_mcp_server.main"] / 1000
+    assert elapsed_ms <= IMPORT_TIME_BUDGET_MS, (
+        f"Importing doris_mcp_server.main took {elapsed_ms:.0f}ms, budget is {IMPORT_TIME_BUDGET_MS:.0f}ms"
+    )
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Tool registry tests
+"""
+
+import asyncio
+
+import pytest
+from mcp.types import Tool
+
+from doris_mcp_server.tools import tool_registry
+from doris_mcp_server.tools.tool_registry import QUERY_CLASS, LatencyHistogram, ToolRegistry
+
+
+def _tool(name):
+    return Tool(name=name, description=name, inputSchema={"type": "object", "properties": {}})
+
+
+class TestToolRegistry:
+    """Tool registry tests"""
+
+    @pytest.mark.asyncio
+    async def test_dispatch_and_listing(self):
+        registry = ToolRegistry()
+
+        async def echo(arguments):
+            return {"echo": arguments["value"]}
+
+        registry.register("echo", echo, definition=_tool("echo"))
+        registry.register("legacy_echo", echo)
+
+        assert await registry.call("echo", {"value": 1}) == {"echo": 1}
+        assert await registry.call("legacy_echo", {"value": 2}) == {"echo": 2}
+        # Unlisted aliases are dispatched but not listed
+        assert [tool.name for tool in registry.list_tools()] == ["echo"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool(self):
+        registry = ToolRegistry()
+        with pytest.raises(ValueError, match="Unknown tool: missing"):
+            await registry.call("missing", {})
+
+    def test_list_tools_is_cached(self):
+        registry = ToolRegistry()
+
+        async def noop(arguments):
+            return None
+
+        registry.register("a", noop, definition=_tool("a"))
+        first = registry.list_tools()
+        first.clear()
+        second = registry.list_tools()
+        assert [tool.name for tool in second] == ["a"]
+        assert second[0] is registry.get_spec("a").definition
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_error_histogram(self):
+        registry = ToolRegistry(class_timeouts={QUERY_CLASS: 0.01})
+
+        async def slow(arguments):
+            await asyncio.sleep(1)
+
+        registry.register("slow", slow, concurrency_class=QUERY_CLASS)
+        with pytest.raises(TimeoutError, match="timed out"):
+            await registry.call("slow", {})
+
+        stats = registry.get_latency_stats()["slow"]
+        assert stats["count"] == 1
+        assert stats["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_argument_extends_class_timeout(self, monkeypatch):
+        monkeypatch.setattr(tool_registry, "TIMEOUT_ARGUMENT_MARGIN", 0.05)
+        registry = ToolRegistry(class_timeouts={QUERY_CLASS: 0.01})
+
+        async def query(arguments):
+            await asyncio.sleep(0.03)
+            return "done"
+
+        registry.register("query", query, concurrency_class=QUERY_CLASS)
+        assert await registry.call("query", {"timeout": 0.01}) == "done"
+        with pytest.raises(TimeoutError, match="timed out"):
+            await registry.call("query", {})
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        registry = ToolRegistry(concurrency_limits={QUERY_CLASS: 2})
+        running = 0
+        peak = 0
+
+        async def query(arguments):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        registry.register("query", query, concurrency_class=QUERY_CLASS)
+        await asyncio.gather(*(registry.call("query", {}) for _ in range(6)))
+        assert peak == 2
+        assert registry.get_latency_stats()["query"]["count"] == 6
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = LatencyHistogram()
+        histogram.observe(0.001)
+        histogram.observe(0.2)
+        histogram.observe(120)
+        snapshot = histogram.snapshot()
+        assert snapshot["buckets"]["0.005"] == 1
+        assert snapshot["buckets"]["0.25"] == 2
+        assert snapshot["buckets"]["60.0"] == 2
+        assert snapshot["buckets"]["+Inf"] == 3
@@ -20,6 +20,7 @@ Tools manager tests
 """
 
 import json
+import jsonschema
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 
@@ -64,6 +65,7 @@ class TestDorisToolsManager:
         # Create a proper mock connection manager
         mock_connection_manager = Mock()
         mock_connection_manager.get_connection = AsyncMock()
+        mock_connection_manager.config = DorisConfig()
         return DorisToolsManager(mock_connection_manager)
 
     @pytest.mark.asyncio
@@ -251,6 +253,19 @@ class TestDorisToolsManager:
         assert "error" in result_data or "success" in result_data
         # The test may pass if the tool handles missing parameters gracefully
 
+    @pytest.mark.asyncio
+    async def test_exec_query_accepts_cursor_without_sql(self, tools_manager):
+        """exec_query takes either sql or a continuation cursor"""
+        schema = next(tool for tool in await tools_manager.list_tools() if tool.name == "exec_query").inputSchema
+        jsonschema.validate({"cursor": "abc"}, schema)
+        jsonschema.validate({"sql": "SELECT 1"}, schema)
+        with pytest.raises(jsonschema.ValidationError):
+            jsonschema.validate({"max_rows": 10}, schema)
+
+        result = json.loads(await tools_manager.call_tool("exec_query", {}))
+        assert result["success"] is False
+        assert result["error_type"] == "invalid_arguments"
+
     @pytest.mark.asyncio
     async def test_tool_definitions_structure(self, tools_manager):
         """Test tool definitions have correct structure"""
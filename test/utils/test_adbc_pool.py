@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+ADBC connection pool and port check cache tests
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from doris_mcp_server.utils.adbc_pool import ADBCConnectionPool
+from doris_mcp_server.utils.adbc_query_tools import DorisADBCQueryTools
+from doris_mcp_server.utils.config import DorisConfig
+
+
+def _pool(**kwargs):
+    connections = []
+
+    def connect():
+        connection = MagicMock(name=f"connection-{len(connections)}")
+        connections.append(connection)
+        return connection
+
+    return ADBCConnectionPool(connect, **kwargs), connections
+
+
+class TestADBCConnectionPool:
+
+    @pytest.mark.asyncio
+    async def test_connection_is_reused(self):
+        pool, connections = _pool()
+
+        async with pool.connection() as first:
+            pass
+        async with pool.connection() as second:
+            pass
+
+        assert first is second
+        assert len(connections) == 1
+        assert pool.stats()["reused"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_block_discards_connection(self):
+        pool, connections = _pool()
+
+        with pytest.raises(RuntimeError):
+            async with pool.connection():
+                raise RuntimeError("flight call failed")
+        async with pool.connection():
+            pass
+
+        assert len(connections) == 2
+        connections[0].close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_max_size_bounds_concurrent_connections(self):
+        pool, connections = _pool(max_size=2)
+        first = await pool.acquire()
+        second = await pool.acquire()
+
+        third = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.05)
+        assert not third.done()
+
+        pool.release(first)
+        assert await third is first
+        pool.release(second)
+        pool.release(first)
+        assert len(connections) == 2
+
+    @pytest.mark.asyncio
+    async def test_borrowing_from_a_thread_only_takes_free_slots(self):
+        pool, connections = _pool(max_size=2)
+        held = await pool.acquire()
+        loop = asyncio.get_running_loop()
+
+        borrowed = await asyncio.to_thread(pool.borrow_threadsafe, loop)
+        assert borrowed is not None and borrowed is not held
+        assert await asyncio.to_thread(pool.borrow_threadsafe, loop) is None
+
+        await asyncio.to_thread(pool.give_back_threadsafe, loop, borrowed, False)
+        await asyncio.sleep(0)
+        assert await pool.try_acquire() is borrowed
+        assert len(connections) == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_connections_are_validated_or_expired(self):
+        validate = MagicMock(return_value=False)
+        pool, connections = _pool(validate_after=0.0, validate=validate)
+
+        async with pool.connection():
+            pass
+        async with pool.connection() as replacement:
+            pass
+
+        validate.assert_called_once_with(connections[0])
+        assert replacement is connections[1]
+
+        pool.idle_timeout = 0.0
+        time.sleep(0.01)
+        async with pool.connection() as expired_replacement:
+            pass
+        assert expired_replacement is connections[2]
+        assert pool.stats()["discarded"] == 2
+
+    @pytest.mark.asyncio
+    async def test_close_rejects_new_acquisitions(self):
+        pool, connections = _pool()
+        async with pool.connection():
+            pass
+
+        await pool.close()
+
+        connections[0].close.assert_called_once()
+        with pytest.raises(RuntimeError):
+            await pool.acquire()
+
+
+class TestPortCheckCache:
+
+    @pytest.mark.asyncio
+    async def test_successful_check_is_cached(self):
+        tools = DorisADBCQueryTools(MagicMock(config=DorisConfig()))
+        tools._probe_arrow_flight_ports = AsyncMock(return_value={"success": True})
+
+        await tools._check_arrow_flight_ports()
+        await tools._check_arrow_flight_ports()
+        assert tools._probe_arrow_flight_ports.await_count == 1
+
+        await tools._check_arrow_flight_ports(use_cache=False)
+        assert tools._probe_arrow_flight_ports.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_check_is_not_cached(self):
+        tools = DorisADBCQueryTools(MagicMock(config=DorisConfig()))
+        tools._probe_arrow_flight_ports = AsyncMock(return_value={"success": False, "error": "down"})
+
+        await tools._check_arrow_flight_ports()
+        await tools._check_arrow_flight_ports()
+        assert tools._probe_arrow_flight_ports.await_count == 2
+
+
+class TestPooledExecution:
+
+    @pytest.mark.asyncio
+    async def test_run_does_not_block_the_event_loop(self):
+        pool, _ = _pool()
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticking = asyncio.create_task(ticker())
+        result = await pool.run(lambda cursor, cancelled: time.sleep(0.2) or "done")
+        ticking.cancel()
+
+        assert result == "done"
+        assert ticks >= 5
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout_cancels_statement_and_discards_connection(self):
+        pool, connections = _pool()
+        stopped = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def slow_query(cursor, cancelled):
+            # Block until adbc_cancel() is called, like a driver waiting on the FE
+            while not cursor.adbc_cancel.called:
+                time.sleep(0.01)
+            assert cancelled.is_set()
+            loop.call_soon_threadsafe(stopped.set)
+            raise RuntimeError("statement cancelled")
+
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.run(slow_query, timeout=0.1)
+
+        assert stopped.is_set()
+        assert pool.stats()["cancelled"] == 1
+        assert pool.stats()["idle"] == 0
+        connections[0].close.assert_called_once()
+        await pool.close()
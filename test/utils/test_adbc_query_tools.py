@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+ADBC result conversion tests
+"""
+
+import json
+import threading
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pyarrow as pa
+import pytest
+
+from doris_mcp_server.utils.adbc_query_tools import (
+    DorisADBCQueryTools,
+    _arrow_table_to_records,
+    _push_down_limit,
+    _read_limited,
+    _read_partitions,
+)
+from doris_mcp_server.utils.config import DorisConfig
+from doris_mcp_server.utils.response_encoder import ResponseEncoder
+
+
+def _table(rows: int = 5):
+    return pa.table({
+        "id": pa.array(range(rows), pa.int64()),
+        "name": pa.array([f"user_{i}" if i % 2 else None for i in range(rows)], pa.string()),
+        "amount": pa.array([Decimal(f"{i}.50") for i in range(rows)], pa.decimal128(10, 2)),
+        "created_at": pa.array([datetime(2024, 1, 1, 0, 0, i % 60) for i in range(rows)], pa.timestamp("s")),
+    })
+
+
+def _cursor(table, batch_size: int = 4):
+    """Fake ADBC cursor streaming ``table`` in batches, recording how many were read"""
+    cursor = MagicMock()
+    cursor.batches_read = 0
+
+    def batches():
+        for batch in table.to_batches(max_chunksize=batch_size):
+            cursor.batches_read += 1
+            yield batch
+
+    cursor.fetch_record_batch.side_effect = lambda: pa.RecordBatchReader.from_batches(table.schema, batches())
+    return cursor
+
+
+def _run(return_format: str, max_rows: int, rows: int = 5):
+    cursor = _cursor(_table(rows))
+    config = DorisConfig()
+    config.adbc.fetch_concurrency = 1
+    tools = DorisADBCQueryTools(MagicMock(config=config))
+    return tools._run_query(cursor, threading.Event(), "SELECT 1", max_rows, return_format)
+
+
+def test_records_keep_python_types_and_nulls():
+    records = _arrow_table_to_records(_table(2))
+
+    assert records == [
+        {"id": 0, "name": None, "amount": Decimal("0.50"), "created_at": datetime(2024, 1, 1, 0, 0, 0)},
+        {"id": 1, "name": "user_1", "amount": Decimal("1.50"), "created_at": datetime(2024, 1, 1, 0, 0, 1)},
+    ]
+    encoded = json.loads(ResponseEncoder("json").encode(records))
+    assert encoded[1] == {"id": 1, "name": "user_1", "amount": 1.5, "created_at": "2024-01-01T00:00:01"}
+
+
+def test_dict_format_slices_before_conversion():
+    result = _run("dict", max_rows=3)
+
+    assert result["max_rows_applied"] is True
+    assert result["result"]["num_rows"] == 3
+    assert [row["id"] for row in result["result"]["data"]] == [0, 1, 2]
+    assert result["result"]["column_types"] == ["int64", "string", "decimal128(10, 2)", "timestamp[s]"]
+
+
+@pytest.mark.parametrize("return_format", ["arrow", "pandas"])
+def test_other_formats(return_format):
+    result = _run(return_format, max_rows=100, rows=20)
+
+    assert result["max_rows_applied"] is False
+    assert result["result"]["num_rows"] == 20
+    if return_format == "arrow":
+        assert len(result["result"]["data_preview"]) == 10
+    else:
+        assert result["result"]["data"][3]["name"] == "user_3"
+
+
+@pytest.mark.parametrize("sql, expected", [
+    ("SELECT * FROM t", "SELECT * FROM (\nSELECT * FROM t\n) __t LIMIT 11"),
+    ("select a from t;  ", "SELECT * FROM (\nselect a from t\n) __t LIMIT 11"),
+    ("WITH x AS (SELECT 1) SELECT * FROM x", "SELECT * FROM (\nWITH x AS (SELECT 1) SELECT * FROM x\n) __t LIMIT 11"),
+    ("SELECT * FROM t -- recent rows", "SELECT * FROM (\nSELECT * FROM t -- recent rows\n) __t LIMIT 11"),
+    ("SELECT * FROM t WHERE id IN (SELECT id FROM s LIMIT 5)",
+     "SELECT * FROM (\nSELECT * FROM t WHERE id IN (SELECT id FROM s LIMIT 5)\n) __t LIMIT 11"),
+    ("SELECT a FROM t ORDER BY a", "SELECT a FROM t ORDER BY a"),
+    ("SELECT * FROM t INTO OUTFILE 's3://bucket/out_'", "SELECT * FROM t INTO OUTFILE 's3://bucket/out_'"),
+    ("SHOW TABLES", "SHOW TABLES"),
+])
+def test_push_down_limit(sql, expected):
+    assert _push_down_limit(sql, 10) == expected
+
+
+def test_read_limited_stops_streaming_and_cancels():
+    cursor = _cursor(_table(100), batch_size=10)
+
+    table, truncated = _read_limited(cursor, 25)
+
+    assert truncated is True
+    assert table.num_rows == 25
+    assert cursor.batches_read == 3
+    cursor.adbc_cancel.assert_called_once()
+
+
+def test_read_limited_reads_short_results_fully():
+    cursor = _cursor(_table(25), batch_size=10)
+
+    table, truncated = _read_limited(cursor, 25)
+
+    assert truncated is False
+    assert table.num_rows == 25
+    cursor.adbc_cancel.assert_not_called()
+
+
+def _partition_connection(tables, fail_partition=None):
+    """Fake connection serving one table per partition descriptor"""
+    connection = MagicMock()
+
+    def new_cursor():
+        reader_cursor = MagicMock()
+
+        def read_partition(partition):
+            index = int(partition)
+            if index == fail_partition:
+                raise RuntimeError("BE unavailable")
+            reader_cursor.fetch_record_batch.return_value = pa.RecordBatchReader.from_batches(
+                tables[index].schema, tables[index].to_batches(max_chunksize=5)
+            )
+
+        reader_cursor.adbc_read_partition.side_effect = read_partition
+        return reader_cursor
+
+    connection.cursor.side_effect = new_cursor
+    return connection
+
+
+def _partitioned_cursor(tables, fail_partition=None):
+    """Fake query cursor plus partition descriptors"""
+    cursor = MagicMock()
+    cursor.connection = _partition_connection(tables, fail_partition)
+    partitions = [str(i).encode() for i in range(len(tables))]
+    return cursor, partitions
+
+
+class _Lender:
+    """Hands out up to ``available`` extra connections and records their return"""
+
+    def __init__(self, tables, available: int, fail_partition=None):
+        self.connections = [_partition_connection(tables, fail_partition) for _ in range(available)]
+        self.lent = []
+        self.returned = []
+
+    def borrow(self):
+        if len(self.lent) == len(self.connections):
+            return None
+        self.lent.append(self.connections[len(self.lent)])
+        return self.lent[-1]
+
+    def give_back(self, connection, discard):
+        self.returned.append((connection, discard))
+
+
+def _partition_tables(count: int, rows: int):
+    return [pa.table({"id": pa.array(range(p * rows, (p + 1) * rows), pa.int64())}) for p in range(count)]
+
+
+def test_read_partitions_concatenates_in_partition_order():
+    tables = _partition_tables(4, 10)
+    cursor, partitions = _partitioned_cursor(tables)
+    lender = _Lender(tables, available=5)
+
+    table, truncated = _read_partitions(
+        cursor, partitions, tables[0].schema, 100, 2, threading.Event(), lender.borrow, lender.give_back
+    )
+
+    assert truncated is False
+    assert table.column("id").to_pylist() == list(range(40))
+    # One reader per connection: the query's own plus one borrowed, returned for reuse
+    assert cursor.connection.cursor.call_count == 1
+    assert lender.lent[0].cursor.call_count == 1
+    assert lender.returned == [(lender.lent[0], False)]
+
+
+def test_read_partitions_without_free_connections_reads_serially():
+    tables = _partition_tables(3, 10)
+    cursor, partitions = _partitioned_cursor(tables)
+    lender = _Lender(tables, available=0)
+
+    table, _ = _read_partitions(
+        cursor, partitions, tables[0].schema, 100, 4, threading.Event(), lender.borrow, lender.give_back
+    )
+
+    assert table.column("id").to_pylist() == list(range(30))
+    assert cursor.connection.cursor.call_count == 1
+
+
+def test_read_partitions_stops_at_max_rows():
+    tables = _partition_tables(4, 10)
+    cursor, partitions = _partitioned_cursor(tables)
+
+    table, truncated = _read_partitions(cursor, partitions, tables[0].schema, 15, 4, threading.Event())
+
+    assert truncated is True
+    assert table.num_rows == 15
+
+
+def test_read_partitions_raises_reader_errors():
+    tables = _partition_tables(3, 10)
+    cursor, partitions = _partitioned_cursor(tables, fail_partition=1)
+
+    lender = _Lender(tables, available=2, fail_partition=1)
+
+    with pytest.raises(RuntimeError, match="BE unavailable"):
+        _read_partitions(
+            cursor, partitions, tables[0].schema, 100, 3, threading.Event(), lender.borrow, lender.give_back
+        )
+    # Connections of a failed read are discarded
+    assert sorted(discard for _, discard in lender.returned) == [True, True]
+
+
+def test_read_partitions_reports_cursor_errors():
+    """A reader that cannot open its cursor reports the driver error instead of hanging"""
+    tables = _partition_tables(2, 10)
+    cursor, partitions = _partitioned_cursor(tables)
+    cursor.connection.cursor.side_effect = RuntimeError("Flight SQL handshake failed")
+
+    with pytest.raises(RuntimeError, match="handshake failed"):
+        _read_partitions(cursor, partitions, tables[0].schema, 100, 2, threading.Event())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+ASGI path router tests
+"""
+
+import asyncio
+
+from doris_mcp_server.utils.asgi_router import PrefixRouter
+from doris_mcp_server.utils.sql_security_utils import get_auth_context, set_auth_context
+
+
+class TestPrefixRouter:
+    """Prefix router tests"""
+
+    def _router(self):
+        return (
+            PrefixRouter(default="fallback")
+            .add_exact(("/", "/index"), "index")
+            .add_prefix(("/health", "/cache/", "/mcp/"), "app")
+            .add_prefix(("/cache/admin/",), "admin")
+            .add_exact(("/mcp",), "mcp")
+        )
+
+    def test_exact_routes(self):
+        router = self._router()
+        assert router.resolve("/") == "index"
+        assert router.resolve("/index") == "index"
+        assert router.resolve("/mcp") == "mcp"
+
+    def test_prefix_routes_match_like_startswith(self):
+        router = self._router()
+        assert router.resolve("/health") == "app"
+        assert router.resolve("/healthz") == "app"
+        assert router.resolve("/cache/stats") == "app"
+        assert router.resolve("/mcp/") == "app"
+
+    def test_longest_prefix_wins(self):
+        router = self._router()
+        assert router.resolve("/cache/admin/clear") == "admin"
+        assert router.resolve("/cache/adm") == "app"
+
+    def test_unmatched_paths_use_default(self):
+        router = self._router()
+        assert router.resolve("/cache") == "fallback"
+        assert router.resolve("/mcpx") == "fallback"
+        assert router.resolve("") == "fallback"
+        assert PrefixRouter().resolve("/anything") is None
+
+
+class TestSharedAuthContext:
+    """Shared auth context variable tests"""
+
+    def test_auth_context_reaches_awaited_consumers(self):
+        async def consumer():
+            return get_auth_context()
+
+        async def request(token):
+            set_auth_context(token)
+            await asyncio.sleep(0)
+            return await consumer()
+
+        async def run():
+            return await asyncio.gather(request("token-a"), request("token-b"))
+
+        assert asyncio.run(run()) == ["token-a", "token-b"]
+        assert get_auth_context() is None
@@ -76,3 +76,64 @@ class TestDorisSessionCache:
         connection_manager.release_connection.assert_any_call("query", mock_conn1)
         connection_manager.release_connection.assert_any_call("system", mock_conn2)
         assert connection_manager.release_connection.call_count == 2
+
+
+class TestBackgroundInitialization:
+    """stdio fast startup: pool initialization runs behind the MCP handshake"""
+
+    @staticmethod
+    def _manager():
+        from doris_mcp_server.utils.config import DorisConfig
+        from doris_mcp_server.utils.db import DorisConnectionManager
+
+        config = DorisConfig()
+        config.database.host = "localhost"
+        config.database.user = "root"
+        return DorisConnectionManager(config)
+
+    def test_invalid_config_fails_immediately(self):
+        manager = self._manager()
+        manager.original_db_config["host"] = ""
+
+        with pytest.raises(RuntimeError):
+            manager.start_background_initialization()
+        assert manager._init_task is None
+
+    @pytest.mark.asyncio
+    async def test_get_connection_waits_for_initialization(self):
+        import asyncio
+
+        manager = self._manager()
+        release = asyncio.Event()
+
+        async def fake_initialize(timeout, mode, strict=False, background_warmup=False):
+            await release.wait()
+            manager.pool = MagicMock(closed=False)
+            return True
+
+        manager._initialize_connection_pool = fake_initialize
+        manager.start_background_initialization()
+
+        waiter = asyncio.create_task(manager.wait_until_ready())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        release.set()
+        await waiter
+        assert manager._init_task is None
+        assert manager.pool is not None
+
+    @pytest.mark.asyncio
+    async def test_failure_is_reported_once_then_cleared(self):
+        manager = self._manager()
+
+        async def failing_initialize(timeout, mode, strict=False, background_warmup=False):
+            raise RuntimeError("connection refused")
+
+        manager._initialize_connection_pool = failing_initialize
+        manager.start_background_initialization()
+
+        with pytest.raises(RuntimeError, match="connection refused"):
+            await manager.wait_until_ready()
+        # Later callers go through the regular recovery path
+        await manager.wait_until_ready()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Logging pipeline tests
+"""
+
+import logging
+import threading
+from unittest.mock import patch
+
+from doris_mcp_server.utils.logger import DorisLoggerManager, HotPathLogger
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.records.append(record.getMessage())
+        self.threads.add(threading.get_ident())
+
+
+def _logger(name):
+    logger = logging.getLogger(name)
+    logger.handlers.clear()
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    handler = _ListHandler()
+    logger.addHandler(handler)
+    return logger, handler
+
+
+class TestHotPathLogger:
+    """Hot path logger tests"""
+
+    def test_rate_limit_reports_suppressed_records(self):
+        logger, handler = _logger("test.hot_path.rate")
+        hot_path_logger = HotPathLogger(logger, max_per_second=2)
+
+        with patch("doris_mcp_server.utils.logger.time.monotonic", return_value=100.0):
+            for i in range(5):
+                hot_path_logger.info("request %d", i)
+        with patch("doris_mcp_server.utils.logger.time.monotonic", return_value=101.0):
+            hot_path_logger.info("request %d", 5)
+
+        assert handler.records == [
+            "request 0",
+            "request 1",
+            "request 5 (3 similar messages suppressed)",
+        ]
+
+    def test_sampling_and_level_check(self):
+        logger, handler = _logger("test.hot_path.sample")
+        logger.setLevel(logging.INFO)
+        hot_path_logger = HotPathLogger(logger, sample_rate=0.0)
+
+        hot_path_logger.info("dropped")
+        HotPathLogger(logger).debug("below level")
+        HotPathLogger(logger).info("kept")
+
+        assert handler.records == ["kept"]
+
+    def test_records_caller_location(self):
+        logger, handler = _logger("test.hot_path.caller")
+        records = []
+        handler.emit = records.append
+
+        HotPathLogger(logger).info("where")
+
+        assert records[0].funcName == "test_records_caller_location"
+
+
+class TestQueuedHandlers:
+    """Queue-based logging pipeline tests"""
+
+    def test_records_are_written_by_listener_thread(self):
+        manager = DorisLoggerManager()
+        target = _ListHandler()
+        logger = logging.getLogger("test.queued")
+        logger.handlers.clear()
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        logger.addHandler(manager._queue_handlers([target]))
+
+        for i in range(3):
+            logger.info("message %d", i)
+        manager._stop_listeners()
+
+        assert target.records == ["message 0", "message 1", "message 2"]
+        assert threading.get_ident() not in target.threads
+        assert manager.listeners == []
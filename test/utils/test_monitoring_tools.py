@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Concurrent FE/BE metrics scraping tests
+"""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from aiohttp import web
+
+from doris_mcp_server.utils.analysis_tools import MemoryTracker
+from doris_mcp_server.utils.config import DorisConfig
+from doris_mcp_server.utils.http_client import close_http_session, get_http_session
+from doris_mcp_server.utils.metrics_collector import SeriesRing
+from doris_mcp_server.utils.monitoring_tools import DorisMonitoringTools
+
+
+def _tools(be_count: int = 0, **monitoring):
+    config = DorisConfig()
+    config.database.be_hosts = [f"be{i}" for i in range(be_count)]
+    for name, value in monitoring.items():
+        setattr(config.monitoring, name, value)
+    return DorisMonitoringTools(MagicMock(config=config))
+
+
+class TestConcurrentScraping:
+
+    @pytest.mark.asyncio
+    async def test_be_nodes_are_scraped_concurrently_with_bounded_fan_out(self):
+        tools = _tools(be_count=10, scrape_concurrency=3)
+        in_flight = 0
+        peak = 0
+
+        async def fake_fetch(url, node_type, node_info, name_prefixes=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            if node_info["host"] == "be4":
+                return {"success": False, "error": "HTTP 500", "node_info": node_info}
+            return {"success": True, "metrics": {}, "node_info": node_info}
+
+        tools.fetch_metrics_from_url = fake_fetch
+        results = await tools._get_be_metrics("all", "all", "prometheus", False)
+
+        assert peak == 3
+        assert len(results) == 10
+        assert [r["success"] for r in results].count(False) == 1
+        assert results[4]["error"] == "HTTP 500"
+
+    @pytest.mark.asyncio
+    async def test_fe_and_be_are_scraped_in_parallel(self):
+        tools = _tools(be_count=2)
+
+        async def fake_fetch(url, node_type, node_info, name_prefixes=None):
+            await asyncio.sleep(0.2)
+            return {"success": True, "metrics": {}, "node_info": node_info}
+
+        tools.fetch_metrics_from_url = fake_fetch
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result = await tools.get_monitoring_metrics(role="all", priority="all")
+
+        assert loop.time() - start < 0.35
+        assert result["data"]["fe"]["success"] is True
+        assert len(result["data"]["be"]) == 2
+
+
+class TestMetricsHttpFetch:
+
+    @pytest.mark.asyncio
+    async def test_shared_session_and_per_node_timeout(self):
+        async def metrics(request):
+            return web.Response(text="doris_be_load_average 1.5\n")
+
+        async def hang(request):
+            await asyncio.sleep(2)
+            return web.Response(text="")
+
+        app = web.Application()
+        app.router.add_get("/metrics", metrics)
+        app.router.add_get("/hang", hang)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        tools = _tools(scrape_timeout=1)
+        try:
+            first = await tools.fetch_metrics_from_url(f"http://127.0.0.1:{port}/metrics", "be", {})
+            session = await get_http_session()
+            second = await tools.fetch_metrics_from_url(f"http://127.0.0.1:{port}/metrics", "be", {})
+            timed_out = await tools.fetch_metrics_from_url(f"http://127.0.0.1:{port}/hang", "be", {})
+
+            assert first["success"] and second["success"]
+            assert await get_http_session() is session
+            assert timed_out["success"] is False
+            assert timed_out["error"] == "Timed out after 1 seconds"
+        finally:
+            await close_http_session()
+            await runner.cleanup()
+
+
+class TestMetricsCollector:
+
+    def test_series_ring_wraps_and_computes_rates(self):
+        ring = SeriesRing(3)
+        for t, v in [(1, 10), (2, 20), (3, 30), (4, 50)]:
+            ring.append(t, v)
+
+        assert len(ring) == 3
+        assert ring.samples() == [(2, 20), (3, 30), (4, 50)]
+        assert ring.samples(since=3) == [(3, 30), (4, 50)]
+        assert ring.rate() == 20.0
+
+        ring.append(6, 4)  # counter reset after a node restart
+        assert ring.rate() == 2.0
+
+    @pytest.mark.asyncio
+    async def test_collected_scrapes_serve_p0_requests_and_rates(self, monkeypatch):
+        tools = _tools(be_count=2, collector_enabled=True, collector_interval=10)
+        now = [1000.0]
+        monkeypatch.setattr("doris_mcp_server.utils.metrics_collector.time.time", lambda: now[0])
+        fetches = []
+
+        async def fake_fetch(url, node_type, node_info, name_prefixes=None):
+            fetches.append(url)
+            metrics = {
+                "doris_be_memory_allocated_bytes": 1000 + now[0],
+                "doris_be_stream_load": [
+                    {"labels": {"type": "load_rows"}, "value": 5 * now[0]},
+                ],
+            }
+            return {"success": True, "node_type": node_type, "node_info": node_info, "metrics": metrics}
+
+        tools.fetch_metrics_from_url = fake_fetch
+        await tools.collector.collect_once()
+        now[0] += 10
+        await tools.collector.collect_once()
+        assert len(fetches) == 6
+
+        result = await tools.get_monitoring_metrics(role="be", monitor_type="all", priority="p0")
+
+        assert len(fetches) == 6  # answered from the collector
+        assert [node["node_info"]["host"] for node in result["data"]["be"]] == ["be0", "be1"]
+        assert result["data"]["be"][0]["metrics"]["memory_allocated_bytes"] == 2010.0
+        assert tools.collector.rate("be:be0:8040", "doris_be_stream_load", {"type": "load_rows"}) == 5.0
+
+        now[0] += 100  # stale collector, scrape live again
+        await tools.get_monitoring_metrics(role="be", priority="p0")
+        assert len(fetches) == 8
+
+    @pytest.mark.asyncio
+    async def test_memory_history_comes_from_collected_samples(self):
+        tools = _tools(be_count=1, collector_enabled=True)
+        tracker = MemoryTracker(tools.connection_manager, collector=tools.collector)
+        ring_key = ("be:be0:8040", "doris_be_memory_allocated_bytes", ())
+        now = time.time()
+        tools.collector._append(ring_key, now - 30, 100)
+        tools.collector._append(ring_key, now, 200)
+
+        result = await tracker.get_historical_memory_stats(["allocated_bytes", "missing"], "1h")
+
+        stats = result["historical_stats"]["be0:8040"]["doris_be_memory_allocated_bytes"]
+        assert result["success"] is True
+        assert (stats["data_points"], stats["min"], stats["peak"], stats["avg"]) == (2, 100, 200, 150)
+        assert stats["memory_trend"] == "rising"
+        assert result["unmatched_tracker_names"] == ["missing"]
+
+        disabled = await MemoryTracker(tools.connection_manager).get_historical_memory_stats()
+        assert disabled["success"] is False
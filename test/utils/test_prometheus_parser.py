@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Streaming Prometheus text parser tests
+"""
+
+import math
+
+from doris_mcp_server.utils.prometheus_parser import PrometheusTextParser, parse_prometheus_text
+
+PAGE = b"""# HELP doris_be_load_bytes Total bytes loaded
+# TYPE doris_be_load_bytes counter
+doris_be_load_bytes 123456
+doris_be_cpu{mode="user"} 10
+doris_be_cpu{mode="idle"} 90.5
+doris_be_query_latency{quantile="0.99",path="/api/v1,x"} 1.5e3 1700000000000
+doris_be_mem_ratio NaN
+doris_be_disk_bytes_total{path="C:\\\\data \\"ssd\\"\\n"} -7
+jvm_heap_size_bytes{type="max"} 2147483648
+"""
+
+
+class TestPrometheusTextParser:
+
+    def test_parses_plain_labeled_and_special_values(self):
+        metrics = parse_prometheus_text(PAGE)
+
+        assert metrics["doris_be_load_bytes"] == 123456
+        assert metrics["doris_be_cpu"] == [
+            {"labels": {"mode": "user"}, "value": 10},
+            {"labels": {"mode": "idle"}, "value": 90.5},
+        ]
+        latency = metrics["doris_be_query_latency"][0]
+        assert latency["labels"] == {"quantile": "0.99", "path": "/api/v1,x"}
+        assert latency["value"] == 1500.0  # trailing timestamp ignored
+        assert math.isnan(metrics["doris_be_mem_ratio"])
+        assert metrics["doris_be_disk_bytes_total"][0] == {
+            "labels": {"path": 'C:\\data "ssd"\n'},
+            "value": -7,
+        }
+
+    def test_chunk_boundaries_do_not_change_the_result(self):
+        expected = parse_prometheus_text(PAGE)
+        for size in (1, 7, 64):
+            parser = PrometheusTextParser()
+            for start in range(0, len(PAGE), size):
+                parser.feed(PAGE[start:start + size])
+            assert repr(parser.close()) == repr(expected)
+
+    def test_last_line_without_newline_is_parsed_on_close(self):
+        parser = PrometheusTextParser()
+        parser.feed(b"a 1\nb 2")
+        assert parser.metrics == {"a": 1}
+        assert parser.close() == {"a": 1, "b": 2}
+
+    def test_name_prefixes_skip_other_metrics(self):
+        parser = PrometheusTextParser(name_prefixes=["doris_be_cpu", "jvm_heap"])
+        parser.feed(PAGE)
+        metrics = parser.close()
+
+        assert set(metrics) == {"doris_be_cpu", "jvm_heap_size_bytes"}
+        assert parser.samples_kept == 3
+
+    def test_mixed_labeled_and_plain_samples_share_one_list(self):
+        metrics = parse_prometheus_text('m 1\nm{a="x"} 2\nm 3\n')
+        assert metrics["m"] == [
+            {"labels": {}, "value": 1},
+            {"labels": {"a": "x"}, "value": 2},
+            {"labels": {}, "value": 3},
+        ]
+
+    def test_malformed_lines_are_skipped(self):
+        metrics = parse_prometheus_text("ok 1\nbroken\nbad{a=\"x\"} abc\nalso_ok 2\n")
+        assert metrics == {"ok": 1, "also_ok": 2}
@@ -201,3 +201,30 @@ class TestDorisQueryExecutor:
             if result["success"]:
                 assert "data" in result
                 assert "row_count" in result 
+
+    def test_format_result_data_layouts(self, query_executor):
+        """Test the compact result layouts emit column names once"""
+        from decimal import Decimal
+
+        rows = [{"id": 1, "name": "a|b", "amount": Decimal("2.50")}, {"id": 2, "name": None, "amount": None}]
+        columns = ["id", "name", "amount"]
+
+        assert query_executor._format_result_data(rows, columns, "rows") is rows
+        assert query_executor._format_result_data(rows, columns, "columns") == {
+            "columns": ["id", "name", "amount"],
+            "rows": [[1, "a|b", Decimal("2.50")], [2, None, None]],
+        }
+        assert query_executor._format_result_data(rows, columns, "csv") == "id,name,amount\n1,a|b,2.5\n2,,\n"
+        assert query_executor._format_result_data(rows, columns, "markdown_table") == (
+            "| id | name | amount |\n|---|---|---|\n| 1 | a\\|b | 2.5 |\n| 2 |  |  |"
+        )
+        # Empty results still carry the header from cursor metadata
+        assert query_executor._format_result_data([], columns, "csv") == "id,name,amount\n"
+
+    @pytest.mark.asyncio
+    async def test_execute_sql_for_mcp_rejects_unknown_format(self, query_executor):
+        """Test an unsupported result format is rejected before execution"""
+        result = await query_executor.execute_sql_for_mcp("SELECT 1", result_format="xml")
+
+        assert result["success"] is False
+        assert result["error_type"] == "invalid_argument"
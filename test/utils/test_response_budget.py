@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Response budget and continuation cursor tests
+"""
+
+import pytest
+
+from doris_mcp_server.utils.response_budget import ResponseBudgeter, _split_csv_records
+from doris_mcp_server.utils.response_encoder import ResponseEncoder
+from doris_mcp_server.utils.result_spool import ResultSpool
+from doris_mcp_server.utils.security import AuthContext
+from doris_mcp_server.utils.sql_security_utils import auth_context_var
+
+
+def _result(data, result_format="rows", row_count=None):
+    return {
+        "success": True,
+        "data": data,
+        "row_count": row_count if row_count is not None else len(data),
+        "metadata": {"columns": ["id", "name"], "query": "SELECT id, name FROM t", "format": result_format},
+    }
+
+
+class TestResponseBudgeter:
+    """Response budgeter tests"""
+
+    @pytest.fixture
+    def budgeter(self, tmp_path):
+        spool = ResultSpool(ttl=60, max_entries=4, spool_dir=str(tmp_path))
+        yield ResponseBudgeter(ResponseEncoder("json"), spool, max_chars=1024)
+        spool.close()
+
+    @pytest.mark.asyncio
+    async def test_small_result_is_not_truncated(self, budgeter):
+        """Results within the budget are returned whole"""
+        page = await budgeter.apply(_result([{"id": 1, "name": "a"}]))
+
+        assert page["truncated"] is False
+        assert page["returned_rows"] == 1
+        assert "next_cursor" not in page
+
+    @pytest.mark.asyncio
+    async def test_pages_fit_budget_and_cover_all_rows(self, budgeter):
+        """Truncated pages stay within budget and cursors walk the remaining rows"""
+        rows = [{"id": i, "name": f"name_{i}"} for i in range(200)]
+        page = await budgeter.apply(_result(rows))
+
+        collected = []
+        pages = 0
+        while True:
+            assert len(budgeter.encoder.encode(page)) <= budgeter.max_chars
+            assert page["row_count"] == 200
+            assert page["row_offset"] == len(collected)
+            assert page["returned_rows"] == len(page["data"])
+            collected.extend(page["data"])
+            pages += 1
+            if not page["truncated"]:
+                break
+            page = await budgeter.fetch_page(page["next_cursor"])
+
+        assert collected == rows
+        assert pages > 1
+        # The spool entry is released after the last page
+        assert budgeter.spool.get_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_pretty_encoder_pages_fit_budget(self):
+        """Indentation the pretty encoder adds to nested rows counts against the budget"""
+        spool = ResultSpool(ttl=60, max_entries=4)
+        budgeter = ResponseBudgeter(ResponseEncoder("pretty"), spool, max_chars=4096)
+        rows = [{"id": i, "name": f"name_{i}"} for i in range(500)]
+        page = await budgeter.apply(_result(rows))
+        while True:
+            assert len(budgeter.encoder.encode(page)) <= budgeter.max_chars
+            if not page["truncated"]:
+                break
+            page = await budgeter.fetch_page(page["next_cursor"])
+
+    @pytest.mark.asyncio
+    async def test_text_formats_paginate_by_record(self, budgeter):
+        """CSV pages keep the header and never split a quoted record"""
+        lines = ["id,name"] + [f'{i},"line one\nline two {i}"' for i in range(100)]
+        page = await budgeter.apply(_result("\n".join(lines) + "\n", "csv", row_count=100))
+
+        assert page["truncated"] is True
+        records = _split_csv_records(page["data"])
+        assert records[0] == "id,name"
+        assert records[1:] == lines[1:1 + page["returned_rows"]]
+
+        next_page = await budgeter.fetch_page(page["next_cursor"])
+        assert _split_csv_records(next_page["data"])[0] == "id,name"
+        assert next_page["row_offset"] == page["returned_rows"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_rejected(self, budgeter):
+        """Unknown or malformed cursors return an error instead of data"""
+        for cursor in ("not-a-cursor", budgeter._encode_cursor("missing", 10)):
+            result = await budgeter.fetch_page(cursor)
+            assert result["success"] is False
+            assert result["error_type"] == "invalid_cursor"
+
+    @pytest.mark.asyncio
+    async def test_cursor_is_bound_to_caller(self, budgeter):
+        """A cursor issued to one caller is rejected for another"""
+        rows = [{"id": i, "name": f"name_{i}"} for i in range(200)]
+        owner = auth_context_var.set(AuthContext(token_id="alpha", user_id="alice"))
+        try:
+            page = await budgeter.apply(_result(rows))
+
+            other = auth_context_var.set(AuthContext(token_id="beta", user_id="bob"))
+            try:
+                result = await budgeter.fetch_page(page["next_cursor"])
+            finally:
+                auth_context_var.reset(other)
+            assert result["error_type"] == "invalid_cursor"
+
+            next_page = await budgeter.fetch_page(page["next_cursor"])
+            assert next_page["success"] is True
+            assert next_page["row_offset"] == page["returned_rows"]
+        finally:
+            auth_context_var.reset(owner)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Tool response encoder tests
+"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from doris_mcp_server.utils import response_encoder
+from doris_mcp_server.utils.response_encoder import ResponseEncoder
+
+
+ROW_RESULT = {
+    "success": True,
+    "data": [{
+        "amount": Decimal("12.50"),
+        "created_at": datetime(2024, 1, 2, 3, 4, 5),
+        "day": date(2024, 1, 2),
+        "payload": b"raw",
+        "name": "名字",
+    }],
+}
+
+EXPECTED_ROW = {
+    "amount": 12.5,
+    "created_at": "2024-01-02T03:04:05",
+    "day": "2024-01-02",
+    "payload": "raw",
+    "name": "名字",
+}
+
+
+class TestResponseEncoder:
+    """Response encoder tests"""
+
+    @pytest.mark.parametrize("encoder", ["auto", "json", "pretty"])
+    def test_rows_encoded_in_single_pass(self, encoder):
+        """Non-JSON values in raw rows are converted by the default hook"""
+        encoded = ResponseEncoder(encoder).encode(ROW_RESULT)
+
+        assert json.loads(encoded)["data"] == [EXPECTED_ROW]
+        assert "名字" in encoded
+
+    def test_compact_output_by_default(self):
+        """The default encoder emits no pretty-print whitespace"""
+        encoded = ResponseEncoder().encode({"a": [1, 2], "b": {"c": None}})
+        assert encoded == '{"a":[1,2],"b":{"c":null}}'
+
+    def test_missing_orjson_falls_back_to_json(self, monkeypatch):
+        """Requesting orjson without it installed uses the stdlib encoder"""
+        monkeypatch.setattr(response_encoder, "orjson", None)
+        assert ResponseEncoder("orjson").name == "json"
+
+    def test_numpy_values_encoded(self):
+        """numpy scalars and arrays are converted inline"""
+        np = pytest.importorskip("numpy")
+        for encoder in ("auto", "json"):
+            encoded = ResponseEncoder(encoder).encode({"n": np.int64(3), "v": np.array([1.5, 2.5])})
+            assert json.loads(encoded) == {"n": 3, "v": [1.5, 2.5]}
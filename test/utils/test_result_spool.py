@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Result spool tests
+"""
+
+import os
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from doris_mcp_server.utils.result_spool import SPOOL_BLOCK_ROWS, ResultSpool, SpooledResult
+
+
+def _entry(count: int) -> SpooledResult:
+    rows = [{"id": i, "amount": Decimal(f"{i}.5"), "name": f"name_{i}"} for i in range(count)]
+    return SpooledResult(template={"success": True}, result_format="rows", header=None, units=rows)
+
+
+class TestResultSpool:
+    """On-disk result spool tests"""
+
+    @pytest.mark.asyncio
+    async def test_rows_served_from_compressed_blocks(self, tmp_path):
+        """Spooled rows leave memory and are read back across block boundaries"""
+        spool = ResultSpool(spool_dir=str(tmp_path))
+        entry = _entry(SPOOL_BLOCK_ROWS * 2 + 10)
+        spool_id = await spool.put(entry)
+
+        assert entry.units is None
+        assert os.path.exists(entry.path)
+        assert len(entry.blocks) == 3
+
+        stored = await spool.get(spool_id)
+        rows = await stored.read_units(SPOOL_BLOCK_ROWS - 2, 5)
+        assert [row["id"] for row in rows] == list(range(SPOOL_BLOCK_ROWS - 2, SPOOL_BLOCK_ROWS + 3))
+        assert rows[0]["amount"] == SPOOL_BLOCK_ROWS - 2 + 0.5
+
+        await spool.discard(spool_id)
+        assert not os.path.exists(entry.path)
+        assert spool.get_stats()["disk_usage_bytes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_disk_quota_evicts_oldest(self, tmp_path):
+        """Exceeding the quota evicts least recently used results, oversize results are refused"""
+        probe = ResultSpool(spool_dir=str(tmp_path / "probe"))
+        await probe.put(_entry(500))
+        entry_size = probe.get_stats()["disk_usage_bytes"]
+        probe.close()
+
+        spool = ResultSpool(spool_dir=str(tmp_path / "spool"), disk_quota_bytes=int(entry_size * 1.5))
+        first = await spool.put(_entry(500))
+        second = await spool.put(_entry(500))
+
+        assert await spool.get(first) is None
+        assert await spool.get(second) is not None
+        assert spool.get_stats()["disk_usage_bytes"] <= spool.disk_quota_bytes
+        assert await spool.put(_entry(5000)) is None
+        assert len([name for name in os.listdir(tmp_path / "spool") if name.endswith(".spool")]) == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_results_are_removed(self, tmp_path):
+        """Results past their TTL are dropped together with their files"""
+        spool = ResultSpool(ttl=10, spool_dir=str(tmp_path))
+        with patch("doris_mcp_server.utils.result_spool.time.monotonic", return_value=1000.0):
+            spool_id = await spool.put(_entry(10))
+        with patch("doris_mcp_server.utils.result_spool.time.monotonic", return_value=1011.0):
+            assert await spool.get(spool_id) is None
+        assert os.listdir(tmp_path) == []
+
+    @pytest.mark.asyncio
+    async def test_shared_directory_serves_other_process_cursors(self, tmp_path):
+        """A result spooled by one process is readable by another sharing the directory"""
+        owner = ResultSpool(spool_dir=str(tmp_path))
+        other = ResultSpool(spool_dir=str(tmp_path))
+        entry = _entry(SPOOL_BLOCK_ROWS + 10)
+        entry.template = {"success": True, "metadata": {"columns": ["id", "amount", "name"]}}
+        entry.caller = "alpha:alice"
+        spool_id = await owner.put(entry)
+
+        loaded = await other.get(spool_id)
+        assert loaded is not None and not loaded.owned
+        assert loaded.row_total == entry.row_total
+        assert loaded.template == entry.template
+        assert loaded.caller == "alpha:alice"
+        rows = await loaded.read_units(SPOOL_BLOCK_ROWS, 10)
+        assert [row["id"] for row in rows] == list(range(SPOOL_BLOCK_ROWS, SPOOL_BLOCK_ROWS + 10))
+
+        # Evicting a borrowed entry leaves the owner's files alone; serving the last page removes them
+        other.close()
+        assert await owner.get(spool_id) is not None
+        other = ResultSpool(spool_dir=str(tmp_path))
+        assert await other.get(spool_id) is not None
+        await other.discard(spool_id)
+        assert os.listdir(tmp_path) == []
+        assert await owner.get("../../etc/passwd") is None
+
+    @pytest.mark.asyncio
+    async def test_shared_entry_kept_while_read_elsewhere(self, tmp_path):
+        """The owner keeps an expired entry another process has read within the TTL"""
+        owner = ResultSpool(ttl=10, spool_dir=str(tmp_path))
+        with patch("doris_mcp_server.utils.result_spool.time.monotonic", return_value=1000.0):
+            spool_id = await owner.put(_entry(10))
+        index_path = os.path.join(tmp_path, f"{spool_id}.idx")
+        os.utime(index_path, (os.path.getmtime(index_path) + 1,) * 2)  # read by another worker
+
+        with patch("doris_mcp_server.utils.result_spool.time.monotonic", return_value=1011.0):
+            assert await owner.get(spool_id) is not None
+        with patch("doris_mcp_server.utils.result_spool.time.monotonic", return_value=1030.0):
+            assert await owner.get(spool_id) is None
+        assert os.listdir(tmp_path) == []
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+MCP server Prometheus metrics tests
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from prometheus_client.parser import text_string_to_metric_families
+
+from doris_mcp_server.auth.cache_manager import DorisCacheManager
+from doris_mcp_server.tools.tool_registry import ToolRegistry
+from doris_mcp_server.utils import server_metrics
+from doris_mcp_server.utils.config import DorisConfig
+from doris_mcp_server.utils.response_encoder import ResponseEncoder
+
+
+def _scrape():
+    body, content_type = server_metrics.render_metrics()
+    assert content_type.startswith("text/plain")
+    samples = {}
+    for family in text_string_to_metric_families(body.decode()):
+        for sample in family.samples:
+            samples[(sample.name, tuple(sorted(sample.labels.items())))] = sample.value
+    return samples
+
+
+@pytest.fixture
+def registry():
+    tool_registry = ToolRegistry()
+
+    async def ok(arguments):
+        return "ok"
+
+    async def broken(arguments):
+        raise ValueError("boom")
+
+    tool_registry.register("exec_query", ok)
+    tool_registry.register("get_db_list", broken)
+    yield tool_registry
+    server_metrics.register_server()
+
+
+class TestServerMetrics:
+
+    @pytest.mark.asyncio
+    async def test_tools_pool_and_caches_are_read_at_scrape_time(self, registry):
+        await registry.call("exec_query", {})
+        with pytest.raises(ValueError):
+            await registry.call("get_db_list", {})
+
+        query_executor = SimpleNamespace(
+            metrics=SimpleNamespace(cache_hits=3, cache_misses=1),
+            query_cache=SimpleNamespace(cache={"a": 1}),
+        )
+        tools_manager = SimpleNamespace(
+            get_tool_latency_stats=registry.get_latency_stats, query_executor=query_executor
+        )
+        connection_manager = SimpleNamespace(
+            pool=SimpleNamespace(size=5, freesize=2, maxsize=20),
+            acquire_waiting=4,
+            metrics=SimpleNamespace(connection_errors=1),
+        )
+        cache_manager = DorisCacheManager(DorisConfig())
+        cache_manager.set("k", "v")
+        cache_manager.get("k")
+        cache_manager.get("missing")
+        server_metrics.register_server(
+            tools_manager=tools_manager,
+            connection_manager=connection_manager,
+            cache_manager=cache_manager,
+            request_counters={"http_requests": 7},
+        )
+
+        samples = _scrape()
+
+        assert samples[("doris_mcp_tool_calls_total", (("tool", "exec_query"),))] == 1
+        assert samples[("doris_mcp_tool_errors_total", (("tool", "get_db_list"),))] == 1
+        assert samples[("doris_mcp_tool_duration_seconds_count", (("tool", "exec_query"),))] == 1
+        assert samples[("doris_mcp_tool_duration_seconds_bucket", (("le", "+Inf"), ("tool", "exec_query")))] == 1
+        assert samples[("doris_mcp_pool_active_connections", ())] == 3
+        assert samples[("doris_mcp_pool_waiting", ())] == 4
+        assert samples[("doris_mcp_cache_hit_ratio", (("cache", "query"),))] == 0.75
+        assert samples[("doris_mcp_cache_hit_ratio", (("cache", "metadata"),))] == 0.5
+        assert samples[("doris_mcp_http_requests_total", ())] == 7
+
+    def test_hot_path_instruments(self, registry):
+        before = _scrape()
+        encoder = ResponseEncoder("json")
+        encoder.encode({"name": "é"})  # {"name":"é"}: 12 characters, 13 UTF-8 bytes
+        server_metrics.SECURITY_VALIDATION_SECONDS.observe(0.003)
+
+        after = _scrape()
+
+        bytes_key = ("doris_mcp_response_bytes_total", (("encoder", "json"),))
+        assert after[bytes_key] - before.get(bytes_key, 0) == 13
+        validation_key = ("doris_mcp_security_validation_seconds_bucket", (("le", "0.005"),))
+        assert after[validation_key] - before[validation_key] == 1
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Tool call tracing tests
+"""
+
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from doris_mcp_server.tools.tools_manager import DorisToolsManager
+from doris_mcp_server.utils import tracing
+from doris_mcp_server.utils.config import DorisConfig
+from doris_mcp_server.utils.tracing import Tracer, carry_span, current_trace, record_span, span
+
+
+class TestTracer:
+    """Sampling, stage recording and export"""
+
+    def test_unsampled_calls_record_nothing(self):
+        tracer = Tracer(sample_rate=0.0)
+        assert tracer.start("exec_query") is None
+        assert current_trace() is None
+        with span("doris_execute"):
+            pass
+        record_span("pool_acquire", time.perf_counter())
+        assert current_trace() is None
+
+    def test_sampled_call_breakdown(self):
+        tracer = Tracer(sample_rate=1.0)
+        trace = tracer.start("exec_query")
+        assert current_trace() is trace
+
+        started = time.perf_counter()
+        record_span("pool_acquire", started, started + 0.002)
+        # Retries record the same stage again; the breakdown sums them
+        record_span("doris_execute", started, started + 0.010)
+        record_span("doris_execute", started, started + 0.005)
+        with span("masking"):
+            pass
+        tracer.finish(trace)
+
+        stages = trace.breakdown()
+        assert stages["pool_acquire"] == pytest.approx(2.0)
+        assert stages["doris_execute"] == pytest.approx(15.0)
+        assert stages["masking"] >= 0
+        assert current_trace() is None
+
+    def test_carried_span_joins_next_trace_only(self):
+        tracer = Tracer(sample_rate=1.0)
+        started = time.perf_counter()
+        carry_span("auth", started, started + 0.001)
+        trace = tracer.start("exec_query")
+        tracer.finish(trace)
+        assert trace.breakdown()["auth"] == pytest.approx(1.0)
+
+        trace = tracer.start("exec_query")
+        tracer.finish(trace)
+        assert "auth" not in trace.breakdown()
+
+    def test_carried_span_cleared_when_not_sampled(self):
+        started = time.perf_counter()
+        carry_span("auth", started, started + 0.001)
+        assert Tracer(sample_rate=0.0).start("exec_query") is None
+
+        tracer = Tracer(sample_rate=1.0)
+        trace = tracer.start("exec_query")
+        tracer.finish(trace)
+        assert "auth" not in trace.breakdown()
+
+    def test_from_config(self):
+        config = DorisConfig()
+        config.monitoring.trace_sample_rate = 0.25
+        config.monitoring.trace_exporter = "log"
+        tracer = Tracer.from_config(config)
+        assert tracer.sample_rate == 0.25
+        assert tracer.exporter == "log"
+
+        tracer = Tracer.from_config(DorisConfig())
+        assert tracer.sample_rate == 0.0
+        assert tracer.exporter == "none"
+
+    def test_unknown_exporter_disables_export(self):
+        assert Tracer(sample_rate=1.0, exporter="zipkin").exporter == "none"
+
+    def test_log_exporter(self, monkeypatch):
+        mock_logger = Mock()
+        monkeypatch.setattr(tracing, "logger", mock_logger)
+        tracer = Tracer(sample_rate=1.0, exporter="log")
+        trace = tracer.start("exec_query")
+        with span("doris_execute"):
+            pass
+        tracer.finish(trace)
+
+        message = mock_logger.info.call_args[0][0]
+        assert message.startswith("Trace exec_query ")
+        assert "doris_execute=" in message
+
+    def test_otel_exporter(self):
+        pytest.importorskip("opentelemetry")
+        tracer = Tracer(sample_rate=1.0, exporter="otel")
+        spans = []
+
+        class FakeSpan:
+            def __init__(self, name, start_time):
+                self.name = name
+                self.start_time = start_time
+                self.end_time = None
+                spans.append(self)
+
+            def end(self, end_time=None):
+                self.end_time = end_time
+
+            # Used by set_span_in_context
+            def get_span_context(self):
+                return None
+
+        tracer._otel_tracer = SimpleNamespace(
+            start_span=lambda name, context=None, start_time=None, attributes=None: FakeSpan(name, start_time)
+        )
+        started = time.perf_counter()
+        carry_span("auth", started - 0.001, started)
+        trace = tracer.start("exec_query")
+        with span("doris_execute"):
+            pass
+        tracer.finish(trace)
+
+        root, auth, execute = spans
+        assert root.name == "tools/call exec_query"
+        assert [auth.name, execute.name] == ["auth", "doris_execute"]
+        # The root span starts with the carried auth span and ends last
+        assert root.start_time == auth.start_time
+        assert root.end_time >= execute.end_time >= execute.start_time
+
+
+class TestToolCallTracing:
+    """Stage breakdown in tool results"""
+
+    @pytest.fixture
+    def tools_manager(self):
+        connection_manager = Mock()
+        connection_manager.config = DorisConfig()
+        return DorisToolsManager(connection_manager)
+
+    @pytest.mark.asyncio
+    async def test_sampled_call_reports_stages(self, tools_manager):
+        tools_manager.tracer = Tracer(sample_rate=1.0)
+
+        async def exec_query_for_mcp(*args):
+            record_span("pool_acquire", time.perf_counter())
+            with span("doris_execute"):
+                pass
+            return {"success": True, "data": [{"id": 1}], "row_count": 1}
+
+        tools_manager.metadata_extractor.exec_query_for_mcp = exec_query_for_mcp
+        result = json.loads(await tools_manager.call_tool("exec_query", {"sql": "SELECT 1"}))
+
+        stages = result["_execution_info"]["stages_ms"]
+        assert {"pool_acquire", "doris_execute", "response_budget"} <= set(stages)
+        assert current_trace() is None
+
+    @pytest.mark.asyncio
+    async def test_unsampled_call_has_no_stages(self, tools_manager):
+        async def exec_query_for_mcp(*args):
+            return {"success": True, "data": [], "row_count": 0}
+
+        tools_manager.metadata_extractor.exec_query_for_mcp = exec_query_for_mcp
+        result = json.loads(await tools_manager.call_tool("exec_query", {"sql": "SELECT 1"}))
+        assert "stages_ms" not in result["_execution_info"]
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Worker supervisor tests
+"""
+
+import json
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from doris_mcp_server.utils.worker_supervisor import (
+    REUSE_PORT_SUPPORTED,
+    SUPERVISOR_STATS_FILE,
+    WorkerSupervisor,
+    create_reuseport_socket,
+    read_pool_stats,
+    write_worker_stats,
+)
+
+
+def _exit_immediately(marker_dir, worker_index, stats_dir):
+    """Worker that records its start and exits at once"""
+    with open(os.path.join(marker_dir, f"{worker_index}-{os.getpid()}"), "w"):
+        pass
+    os._exit(3)
+
+
+class TestPoolStats:
+    """Worker stats publication tests"""
+
+    def test_aggregates_running_workers(self, tmp_path):
+        stats_dir = str(tmp_path)
+        with open(os.path.join(stats_dir, SUPERVISOR_STATS_FILE), "w") as f:
+            json.dump({"pid": 1, "worker_count": 3, "restarts": {"0": 2, "1": 0, "2": 0}}, f)
+        write_worker_stats(stats_dir, 0, {"counters": {"http_requests": 5, "tool_calls": 2}})
+        write_worker_stats(stats_dir, 1, {"counters": {"http_requests": 7, "tool_calls": 1}})
+
+        pool = read_pool_stats(stats_dir)
+
+        assert pool["worker_count"] == 3
+        assert pool["running"] == 2
+        assert pool["restarts"] == 2
+        assert pool["totals"] == {"http_requests": 12, "tool_calls": 3}
+        assert [worker["status"] for worker in pool["workers"]] == ["running", "running", "starting"]
+        assert pool["workers"][0]["restarts"] == 2
+
+    def test_stale_workers_are_excluded_from_totals(self, tmp_path):
+        stats_dir = str(tmp_path)
+        with open(os.path.join(stats_dir, SUPERVISOR_STATS_FILE), "w") as f:
+            json.dump({"worker_count": 1, "restarts": {}}, f)
+        write_worker_stats(stats_dir, 0, {"counters": {"http_requests": 5}})
+
+        with open(os.path.join(stats_dir, "worker-0.json")) as f:
+            stats = json.load(f)
+        stats["updated_at"] -= 3600
+        with open(os.path.join(stats_dir, "worker-0.json"), "w") as f:
+            json.dump(stats, f)
+
+        pool = read_pool_stats(stats_dir)
+        assert pool["workers"][0]["status"] == "stale"
+        assert pool["totals"] == {}
+
+    def test_missing_stats_dir(self, tmp_path):
+        pool = read_pool_stats(str(tmp_path / "missing"))
+        assert pool["worker_count"] == 0
+        assert pool["workers"] == []
+
+
+@pytest.mark.skipif(not REUSE_PORT_SUPPORTED, reason="SO_REUSEPORT not supported")
+class TestReusePortSocket:
+    """SO_REUSEPORT socket tests"""
+
+    def test_workers_can_bind_the_same_port(self):
+        first = create_reuseport_socket("127.0.0.1", 0)
+        try:
+            port = first.getsockname()[1]
+            second = create_reuseport_socket("127.0.0.1", port)
+            second.close()
+        finally:
+            first.close()
+
+    def test_plain_socket_conflicts(self):
+        plain = socket.socket()
+        plain.bind(("127.0.0.1", 0))
+        plain.listen()
+        try:
+            with pytest.raises(OSError):
+                create_reuseport_socket("127.0.0.1", plain.getsockname()[1])
+        finally:
+            plain.close()
+
+
+class TestWorkerSupervisor:
+    """Worker supervisor tests"""
+
+    def test_restarts_crashed_workers(self, tmp_path):
+        marker_dir = tmp_path / "markers"
+        marker_dir.mkdir()
+        supervisor = WorkerSupervisor(
+            1, _exit_immediately, args=(str(marker_dir),), min_uptime=0.0, shutdown_timeout=2.0
+        )
+        stats_dir = supervisor.stats_dir
+
+        stopper = threading.Timer(8.0, supervisor.stop)
+        stopper.start()
+        try:
+            # Stop as soon as the worker has been restarted at least once
+            def stop_after_restart():
+                deadline = time.monotonic() + 8.0
+                while time.monotonic() < deadline:
+                    if len(os.listdir(marker_dir)) >= 2:
+                        supervisor.stop()
+                        return
+                    time.sleep(0.05)
+
+            watcher = threading.Thread(target=stop_after_restart)
+            watcher.start()
+            assert supervisor.run() == 0
+            watcher.join()
+        finally:
+            stopper.cancel()
+
+        starts = os.listdir(marker_dir)
+        assert len(starts) >= 2
+        assert all(name.startswith("0-") for name in starts)
+        assert len({name.split("-")[1] for name in starts}) == len(starts)
+        # The supervisor removes the stats directory it created
+        assert not os.path.exists(stats_dir)
+
+
+class TestWorkerPoolConflicts:
+    """Settings that cannot be served by several workers"""
+
+    def test_default_config_has_no_conflicts(self):
+        from doris_mcp_server.main import worker_pool_conflicts
+        from doris_mcp_server.utils.config import DorisConfig
+
+        assert worker_pool_conflicts(DorisConfig()) == []
+
+    def test_per_worker_state_is_rejected(self, tmp_path, monkeypatch):
+        from doris_mcp_server.main import run_http_workers, worker_pool_conflicts
+        from doris_mcp_server.utils.config import DorisConfig
+
+        monkeypatch.delenv("JWT_PRIVATE_KEY", raising=False)
+        monkeypatch.delenv("JWT_PUBLIC_KEY", raising=False)
+        config = DorisConfig()
+        config.security.enable_basic_auth = True
+        config.security.enable_oauth_auth = True
+        config.security.enable_jwt_auth = True
+        conflicts = worker_pool_conflicts(config)
+        assert [conflict.split(":")[0] for conflict in conflicts] == [
+            "ENABLE_BASIC_AUTH", "ENABLE_OAUTH_AUTH", "ENABLE_JWT_AUTH", "KEY_ROTATION_INTERVAL"
+        ]
+        assert run_http_workers(config, 2) == 1
+
+        # A configured, non-rotating key pair is the same in every worker
+        for name in ("private.pem", "public.pem"):
+            (tmp_path / name).write_text("key")
+        config = DorisConfig()
+        config.security.enable_jwt_auth = True
+        config.security.jwt_private_key_path = str(tmp_path / "private.pem")
+        config.security.jwt_public_key_path = str(tmp_path / "public.pem")
+        config.security.key_rotation_interval = 0
+        assert worker_pool_conflicts(config) == []